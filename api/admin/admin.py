@@ -10,6 +10,7 @@ from api.admin.views.calendar.event import (
 from api.admin.views.city import CityAdmin, CityTranslationAdmin
 from api.admin.views.country import CountryAdmin, CountryTranslationAdmin
 from api.admin.views.event import EventAdmin
+from api.admin.views.exchange_rate import ExchangeRateAdmin
 from api.admin.views.frilance.custom_field import ProposalTableCustomFieldAdmin
 from api.admin.views.frilance.job import JobAdmin, JobViewAdmin
 from api.admin.views.frilance.proposal import (
@@ -96,6 +97,7 @@ def load_admin_site(admin: Admin) -> None:
     admin.add_view(CountryAdmin)
     admin.add_view(CountryTranslationAdmin)
     admin.add_view(TimezoneAdmin)
+    admin.add_view(ExchangeRateAdmin)
     admin.add_view(SpecializationAdmin)
     admin.add_view(SpecializationTranslationAdmin)
     admin.add_view(DirectionAdmin)
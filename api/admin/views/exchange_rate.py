@@ -0,0 +1,14 @@
+from sqladmin import ModelView
+
+from models import ExchangeRate
+
+
+class ExchangeRateAdmin(ModelView, model=ExchangeRate):
+    name_plural = "Exchange Rates"
+    column_default_sort = ("currency", False)
+    column_list = [
+        ExchangeRate.currency,
+        ExchangeRate.rate,
+        ExchangeRate.updated_at,
+    ]
+    form_excluded_columns = [ExchangeRate.updated_at]
@@ -86,7 +86,11 @@ class EventFilters(Filter):
             "timezone": lambda q, v: v.filter(q),
             "city": lambda q, v: v.filter(q),
             "language__in": lambda q, v: q.filter(Event.language.in_(v)),
-            "specializations": lambda q, v: v.filter(q),
+            "specializations": lambda q, v: (
+                q.filter(Event.specialization_ids.overlap(v.id__in))
+                if v.id__in
+                else q
+            ),
             "search": lambda q, _: q,
         }
 
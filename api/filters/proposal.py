@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import Query
+from fastapi_filter import FilterDepends, with_prefix
+from fastapi_filter.contrib.sqlalchemy import Filter
+from sqlalchemy import and_, or_
+
+from models import (
+    MultipleChoiceAnswer,
+    NumberAnswer,
+    Proposal,
+    SingleChoiceAnswer,
+)
+
+
+class ProposalAnswerFilter(Filter):
+    """
+    Фильтр по ответам на одно поле таблицы откликов.
+
+    Условия проверяются через EXISTS по таблицам ответов, которые
+    покрыты частичными индексами этого поля.
+    """
+
+    field_id: Optional[int] = None
+    number__gte: Optional[float] = None
+    number__lte: Optional[float] = None
+    choice_id__in: Optional[List[int]] = None
+
+    class Constants(Filter.Constants):
+        model = Proposal
+
+    def filter(self, query: Query) -> Query:
+        if self.field_id is None:
+            return query
+        if self.number__gte is not None or self.number__lte is not None:
+            conditions = [NumberAnswer.field_id == self.field_id]
+            if self.number__gte is not None:
+                conditions.append(NumberAnswer.value >= self.number__gte)
+            if self.number__lte is not None:
+                conditions.append(NumberAnswer.value <= self.number__lte)
+            query = query.filter(
+                Proposal.number_answers.any(and_(*conditions))
+            )
+        if self.choice_id__in:
+            query = query.filter(
+                or_(
+                    Proposal.single_choice_answers.any(
+                        and_(
+                            SingleChoiceAnswer.field_id == self.field_id,
+                            SingleChoiceAnswer.choice_id.in_(
+                                self.choice_id__in
+                            ),
+                        )
+                    ),
+                    Proposal.multiple_choice_answers.any(
+                        and_(
+                            MultipleChoiceAnswer.field_id == self.field_id,
+                            MultipleChoiceAnswer.choice_id.in_(
+                                self.choice_id__in
+                            ),
+                        )
+                    ),
+                )
+            )
+        return query
+
+
+class ProposalBoardFilter(Filter):
+    status_id__in: Optional[List[int]] = None
+    price__gte: Optional[int] = None
+    price__lte: Optional[int] = None
+    is_hidden: Optional[bool] = None
+    created_at__gte: Optional[datetime] = None
+    created_at__lte: Optional[datetime] = None
+    answer: Optional[ProposalAnswerFilter] = FilterDepends(
+        with_prefix("answer", ProposalAnswerFilter)
+    )
+
+    class Constants(Filter.Constants):
+        model = Proposal
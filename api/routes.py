@@ -0,0 +1,47 @@
+from typing import Callable
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from starlette.types import Message
+
+from constants.files import MAX_UPLOAD_BODY_SIZE
+
+
+class UploadSizeLimitRoute(APIRoute):
+    """
+    Маршрут с лимитом размера тела запроса.
+
+    Starlette читает multipart целиком до вызова обработчика, поэтому
+    проверки в services.storage срабатывают уже после буферизации.
+    Здесь тело отклоняется по Content-Length до чтения, а без него -
+    как только прочитано больше MAX_UPLOAD_BODY_SIZE байт.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request) -> Response:
+            limit = MAX_UPLOAD_BODY_SIZE
+            content_length = request.headers.get("content-length")
+            if content_length is not None and int(content_length) > limit:
+                raise _too_large(limit)
+            received = 0
+
+            async def receive() -> Message:
+                nonlocal received
+                message = await request.receive()
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise _too_large(limit)
+                return message
+
+            return await handler(Request(request.scope, receive))
+
+        return limited_handler
+
+
+def _too_large(limit: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Request body exceeds the limit of {limit} bytes",
+    )
@@ -1,12 +1,21 @@
-from datetime import datetime, UTC
-from typing import List, Optional
+import csv
+import io
+from typing import AsyncIterator, Iterable, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from fastapi_filter import FilterDepends
 from pydantic import ValidationError
 from redis import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.requests import Request
 
 from api.dependencies.auth import get_current_user, get_current_user_optional
@@ -16,16 +25,23 @@ from api.dependencies.redis import get_redis
 from api.filters.event import (
     AuthorEventFilters,
     EventFilters,
+    EventParticipantsFilter,
 )
+from api.routes import UploadSizeLimitRoute
 from constants.event import EventType
+from constants.event_participants import (
+    PARTICIPANTS_EXPORT_COLUMNS,
+    PARTICIPANTS_MAX_PAGE_SIZE,
+    PARTICIPANTS_PAGE_SIZE,
+    ParticipantsExportFormat,
+)
 from constants.i18n import EventLanguage
+from constants.publication import PublicationErrorCode
 from crud.event import crud_event
-from crud.event_participants import crud_event_participants
 from crud.event_with_counters import crud_ewc
-from crud.status import crud_status
 from crud.user import crud_user
 from databases.database import get_async_session
-from models import User, EventParticipants
+from models import User
 from schemas.endpoints.paginated_response import (
     EventPaginatedResponse,
 )
@@ -33,22 +49,36 @@ from schemas.endpoints.pagination import DefaultPagination
 from schemas.event import (
     EventCreateDraft,
     EventLanguagesResponse,
+    EventParticipantShortResponse,
+    EventParticipantsPageResponse,
     EventResponse,
     EventTypesResponse,
     EventUpdate,
     EventWithCountersResponse,
     EventCountResponse,
 )
+from schemas.publication import (
+    PublicationBulkRequest,
+    PublicationBulkResponse,
+    PublicationStateResponse,
+)
 from schemas.user.contact_person import ContactPersonAddCreateMulty
-from services.event import event, event_read
+from services import publication
+from services.event import attendance, event, event_read
+from services.event.event_recommendation import (
+    invalidate_event_recommendations,
+)
+from services.user.author_statistics import invalidate_author_statistics
+from services.user.profile_snapshot import invalidate_profile_snapshot
 from services.redis import add_to_redis_browsing_now, get_browsing_now_by_id
+from services.storage import FileTooLargeError
 from services.user.language import get_user_language
 from utilities.exception import (
     SomeObjectsNotFoundError,
     OperationConstraintError,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=UploadSizeLimitRoute)
 
 
 @router.get("/", response_model=EventPaginatedResponse)
@@ -81,6 +111,26 @@ async def read_events(
     )
 
 
+@router.get("/recommended/", response_model=EventPaginatedResponse)
+async def read_recommended_events(
+    request: Request,
+    db: AsyncSession = Depends(get_async_session),
+    pagination: DefaultPagination = Depends(),
+    current_user: User = Depends(get_current_user),
+    current_user_ip: Optional[str] = Depends(get_current_user_ip),
+    redis: Redis = Depends(get_redis),
+):
+    locale = await get_user_language(request=request, db=db, user=current_user)
+    return await event_read.read_recommended_events(
+        db=db,
+        redis=redis,
+        pagination=pagination,
+        current_user_id=current_user.id,
+        current_user_ip=current_user_ip,
+        locale=locale,
+    )
+
+
 @router.get("/attended/", response_model=EventPaginatedResponse)
 async def read_attended_events(
     request: Request,
@@ -263,9 +313,10 @@ async def create_event(
     contact_person_files: List[UploadFile] = [],  # noqa: B006
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     try:
-        return await event.create(
+        created_event = await event.create(
             db=db,
             create_data=create_data,
             user_id=current_user.id,
@@ -282,6 +333,38 @@ async def create_event(
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=str(ex.errors())
         ) from ex
+    except FileTooLargeError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=ex.message,
+        ) from ex
+    await invalidate_author_statistics(redis=redis, user_id=current_user.id)
+    await invalidate_profile_snapshot(redis=redis, uid=current_user.uid)
+    return created_event
+
+
+@router.patch("/publish/", response_model=PublicationBulkResponse)
+async def publish_events(
+    data: PublicationBulkRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
+):
+    return await _set_events_published(
+        db, data, user=current_user, redis=redis, published=True
+    )
+
+
+@router.patch("/unpublish/", response_model=PublicationBulkResponse)
+async def unpublish_events(
+    data: PublicationBulkRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
+):
+    return await _set_events_published(
+        db, data, user=current_user, redis=redis, published=False
+    )
 
 
 @router.patch("/{event_id}/", response_model=EventResponse)
@@ -294,6 +377,7 @@ async def update_event(
     contact_person_files: list[UploadFile] = [],  # noqa: B006
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     found_event = await crud_event.get_by_id_extended(
         db=db, obj_id=event_id, author_id=current_user.id
@@ -309,7 +393,7 @@ async def update_event(
             detail="You don't have permission!",
         )
     try:
-        return await event.update(
+        updated_event = await event.update(
             db=db,
             event=found_event,
             update_data=update_data,
@@ -327,10 +411,18 @@ async def update_event(
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=str(ex.errors())
         ) from ex
+    except FileTooLargeError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=ex.message,
+        ) from ex
     except OperationConstraintError as ex:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=str(ex)
         ) from ex
+    await invalidate_author_statistics(redis=redis, user_id=current_user.id)
+    await invalidate_profile_snapshot(redis=redis, uid=current_user.uid)
+    return updated_event
 
 
 @router.delete("/{event_id}/", status_code=status.HTTP_204_NO_CONTENT)
@@ -338,6 +430,7 @@ async def delete_event(
     event_id: int,
     db: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     found_event = await crud_event.get_by_id(db=db, obj_id=event_id)
     if not found_event:
@@ -351,6 +444,8 @@ async def delete_event(
             detail="You don't have permission!",
         )
     await crud_event.remove(db=db, obj_id=event_id)
+    await invalidate_author_statistics(redis=redis, user_id=current_user.id)
+    await invalidate_profile_snapshot(redis=redis, uid=current_user.uid)
 
 
 @router.post("/{event_id}/attend/", status_code=status.HTTP_200_OK)
@@ -358,26 +453,30 @@ async def attend_event(
     event_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
-    found_event = await crud_event.get_by_id_extended(db=db, obj_id=event_id)
-    if not found_event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
+    try:
+        creator_id = await attendance.attend(
+            db=db, event_id=event_id, user_id=current_user.id
         )
-    current_user = await db.merge(current_user)
-    if current_user.id in {user.user_id for user in found_event.participants}:
+    except OperationConstraintError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(ex)
+        ) from ex
+    if creator_id is None:
+        if not await crud_event.is_attendable(db, event_id=event_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already registered for this event.",
         )
-    found_status = await crud_status.get_new_status_id(db)
-    participant = EventParticipants(
-        event_id=found_event.id,
-        user_id=current_user.id,
-        status_id=found_status,
+    await invalidate_event_recommendations(
+        redis=redis, user_id=current_user.id
     )
-    found_event.participants.append(participant)
-    await db.commit()
+    await invalidate_author_statistics(redis=redis, user_id=creator_id)
 
 
 @router.delete(
@@ -387,23 +486,108 @@ async def cancel_attendance(
     event_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
-    found_event = await crud_event.get_by_id_extended(db=db, obj_id=event_id)
-    if not found_event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
-        )
-
-    found_attendance = await crud_event_participants.get_by_event_and_user_ids(
+    creator_id = await attendance.cancel_attendance(
         db=db, event_id=event_id, user_id=current_user.id
     )
-    if not found_attendance:
+    if creator_id is None:
+        if not await crud_event.is_attendable(
+            db, event_id=event_id, archived=True
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User not registered for this event.",
         )
-    await db.delete(found_attendance)
-    await db.commit()
+    await invalidate_event_recommendations(
+        redis=redis, user_id=current_user.id
+    )
+    await invalidate_author_statistics(redis=redis, user_id=creator_id)
+
+
+@router.get(
+    "/{event_id}/participants/page/",
+    response_model=EventParticipantsPageResponse,
+)
+async def read_event_participants_page(
+    event_id: int,
+    after_id: Optional[int] = None,
+    limit: int = Query(
+        PARTICIPANTS_PAGE_SIZE, ge=1, le=PARTICIPANTS_MAX_PAGE_SIZE
+    ),
+    filters: EventParticipantsFilter = FilterDepends(EventParticipantsFilter),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    await _check_event_organizer(db=db, event_id=event_id, user=current_user)
+    participants = await crud_ewc.get_participants_page(
+        db,
+        event_id=event_id,
+        limit=limit + 1,
+        after_id=after_id,
+        filters=filters,
+    )
+    total = await crud_ewc.count_participants(
+        db, event_id=event_id, filters=filters
+    )
+    return EventParticipantsPageResponse(
+        objects=[
+            EventParticipantShortResponse.model_validate(dict(participant))
+            for participant in participants[:limit]
+        ],
+        total=total,
+        next_after_id=(
+            participants[limit - 1]["user_id"]
+            if len(participants) > limit
+            else None
+        ),
+    )
+
+
+@router.get(
+    "/{event_id}/participants/export/",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export_event_participants(
+    event_id: int,
+    export_format: ParticipantsExportFormat = ParticipantsExportFormat.CSV,
+    filters: EventParticipantsFilter = FilterDepends(EventParticipantsFilter),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    await _check_event_organizer(db=db, event_id=event_id, user=current_user)
+    session_maker = async_sessionmaker(bind=db.bind, expire_on_commit=False)
+    is_csv = export_format == ParticipantsExportFormat.CSV
+
+    async def generate() -> AsyncIterator[str]:
+        if is_csv:
+            yield _to_csv_line(PARTICIPANTS_EXPORT_COLUMNS)
+        async with session_maker() as session:
+            async for row in crud_ewc.stream_participants(
+                session, event_id=event_id, filters=filters
+            ):
+                participant = EventParticipantShortResponse.model_validate(
+                    dict(row)
+                )
+                if is_csv:
+                    data = participant.model_dump(mode="json")
+                    yield _to_csv_line(
+                        data[column] for column in PARTICIPANTS_EXPORT_COLUMNS
+                    )
+                else:
+                    yield participant.model_dump_json() + "\n"
+
+    filename = f"event_{event_id}_participants.{export_format.value}"
+    return StreamingResponse(
+        generate(),
+        media_type="text/csv" if is_csv else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get("/types/all/", response_model=EventTypesResponse)
@@ -420,63 +604,117 @@ async def get_event_languages():
 
 @router.patch(
     "/publish/{event_id}/",
+    response_model=PublicationStateResponse,
     status_code=status.HTTP_200_OK,
 )
 async def publish_event(
     event_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
-    found_event = await crud_event.get_by_id(db, obj_id=event_id)
-    if not found_event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="The event not found.",
-        )
-    if found_event.creator_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the event creator can publish.",
-        )
-    if found_event.is_draft:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="You cannot publish a draft event.",
-        )
-    if not found_event.is_archived:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="The event is already published.",
-        )
-    found_event.is_archived = False
-    found_event.published_at = datetime.now(tz=UTC)
-    await db.commit()
+    return await _set_event_published(
+        db, event_id, user=current_user, redis=redis, published=True
+    )
 
 
 @router.patch(
     "/unpublish/{event_id}/",
+    response_model=PublicationStateResponse,
     status_code=status.HTTP_200_OK,
 )
 async def unpublish_event(
     event_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
+    return await _set_event_published(
+        db, event_id, user=current_user, redis=redis, published=False
+    )
+
+
+async def _check_event_organizer(
+    db: AsyncSession, event_id: int, user: User
+) -> None:
     found_event = await crud_event.get_by_id(db, obj_id=event_id)
     if not found_event:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="The event not found",
+            status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
         )
-    if found_event.creator_id != current_user.id:
+    if found_event.creator_id != user.id and not (
+        await crud_event.is_organizer(db, event_id=event_id, user_id=user.id)
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the event creator can unpublish.",
+            detail="Only the event organizers can view participants.",
         )
-    if found_event.is_archived:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="The event is not published.",
+
+
+def _to_csv_line(values: Iterable) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+EVENT_PUBLICATION_ERRORS = {
+    PublicationErrorCode.NOT_FOUND: (
+        status.HTTP_404_NOT_FOUND,
+        "The event not found.",
+    ),
+    PublicationErrorCode.NOT_AUTHOR: (
+        status.HTTP_403_FORBIDDEN,
+        "Only the event creator can change its publication.",
+    ),
+    PublicationErrorCode.DRAFT: (
+        status.HTTP_409_CONFLICT,
+        "You cannot publish a draft event.",
+    ),
+    PublicationErrorCode.ALREADY_PUBLISHED: (
+        status.HTTP_409_CONFLICT,
+        "The event is already published.",
+    ),
+    PublicationErrorCode.NOT_PUBLISHED: (
+        status.HTTP_409_CONFLICT,
+        "The event is not published.",
+    ),
+}
+
+
+async def _set_event_published(
+    db: AsyncSession,
+    event_id: int,
+    user: User,
+    redis: Redis,
+    published: bool,
+):
+    try:
+        state = await publication.set_published(
+            db,
+            crud_event,
+            obj_id=event_id,
+            user_id=user.id,
+            published=published,
         )
-    found_event.is_archived = True
-    await db.commit()
+    except publication.PublicationError as ex:
+        status_code, detail = EVENT_PUBLICATION_ERRORS[ex.code]
+        raise HTTPException(status_code=status_code, detail=detail)
+    await invalidate_author_statistics(redis=redis, user_id=user.id)
+    await invalidate_profile_snapshot(redis=redis, uid=user.uid)
+    return state
+
+
+async def _set_events_published(
+    db: AsyncSession,
+    data: PublicationBulkRequest,
+    user: User,
+    redis: Redis,
+    published: bool,
+) -> PublicationBulkResponse:
+    objects, errors = await publication.set_published_many(
+        db, crud_event, ids=data.ids, user_id=user.id, published=published
+    )
+    if objects:
+        await invalidate_author_statistics(redis=redis, user_id=user.id)
+        await invalidate_profile_snapshot(redis=redis, uid=user.uid)
+    return PublicationBulkResponse(objects=objects, errors=errors)
@@ -1,18 +1,25 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_async_db
 from api.dependencies.ip import get_current_user_ip
-from crud.event import crud_event
+from api.dependencies.redis import get_redis
+from constants.favorite import FAVORITES_BULK_LIMIT, FavoriteTarget
 from crud.favorite import crud_favorite
 from models import User
-from models.favorite import Favorite
 from schemas.endpoints.paginated_response import EventPaginatedResponse
+from schemas.user.favorite import FavoriteIds
+from services.event.event_recommendation import (
+    invalidate_event_recommendations,
+)
+from services.favorite.favorite import add_favorites, remove_favorites
 from services.user.language import get_user_language
+from utilities.exception import SomeObjectsNotFoundError
 
 router = APIRouter()
 
@@ -41,6 +48,57 @@ async def read_favorite_events(
     )
 
 
+@router.post(
+    "/",
+    response_model=list[int],
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_favorite_events(
+    data: FavoriteIds,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    redis: Redis = Depends(get_redis),
+) -> list[int]:
+    try:
+        added_ids = await add_favorites(
+            db=db,
+            user_id=current_user.id,
+            target=FavoriteTarget.event,
+            ids=data.ids,
+        )
+    except SomeObjectsNotFoundError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=ex.message
+        )
+    await invalidate_event_recommendations(
+        redis=redis, user_id=current_user.id
+    )
+    return added_ids
+
+
+@router.delete(
+    "/",
+    response_model=list[int],
+    status_code=status.HTTP_200_OK,
+)
+async def remove_favorite_events(
+    ids: list[int] = Query(max_length=FAVORITES_BULK_LIMIT),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    redis: Redis = Depends(get_redis),
+) -> list[int]:
+    removed_ids = await remove_favorites(
+        db=db,
+        user_id=current_user.id,
+        target=FavoriteTarget.event,
+        ids=ids,
+    )
+    await invalidate_event_recommendations(
+        redis=redis, user_id=current_user.id
+    )
+    return removed_ids
+
+
 @router.post(
     "/{event_id}/",
     status_code=status.HTTP_201_CREATED,
@@ -49,26 +107,28 @@ async def add_favorite_event(
     event_id: int,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
+    redis: Redis = Depends(get_redis),
 ) -> None:
-    found_event = await crud_event.get_by_id_extended(db=db, obj_id=event_id)
-    if not found_event:
+    try:
+        added_ids = await add_favorites(
+            db=db,
+            user_id=current_user.id,
+            target=FavoriteTarget.event,
+            ids=[event_id],
+        )
+    except SomeObjectsNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
         )
-    current_user = await db.merge(current_user)
-    favorite_ids = {f.event_id for f in current_user.favorites}
-    if found_event.id in favorite_ids:
+    if not added_ids:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Event with ID: {event_id}"
             "is already added to favorites",
         )
-    new_favorite = Favorite(
-        user_id=current_user.id,
-        event_id=event_id,
+    await invalidate_event_recommendations(
+        redis=redis, user_id=current_user.id
     )
-    current_user.favorites.append(new_favorite)
-    await db.commit()
 
 
 @router.delete(
@@ -79,22 +139,20 @@ async def remove_favorite_event(
     event_id: int,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
+    redis: Redis = Depends(get_redis),
 ) -> None:
-    found_event = await crud_event.get_by_id_extended(db=db, obj_id=event_id)
-    if not found_event:
+    removed_ids = await remove_favorites(
+        db=db,
+        user_id=current_user.id,
+        target=FavoriteTarget.event,
+        ids=[event_id],
+    )
+    if not removed_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Event with ID: {event_id} not found",
+            detail=f"Favorite event with ID: {event_id} not found in the"
+            "current user's favorites",
         )
-    for favorite in current_user.favorites:
-        if favorite.event_id == found_event.id:
-            current_user.favorites.remove(favorite)
-            await db.merge(favorite)
-            await db.commit()
-            return
-
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="Favorite organisation not found in the"
-        "current user's favorites",
+    await invalidate_event_recommendations(
+        redis=redis, user_id=current_user.id
     )
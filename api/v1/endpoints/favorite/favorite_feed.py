@@ -0,0 +1,34 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies.auth import get_current_user
+from api.dependencies.database import get_async_db
+from constants.favorite import (
+    FAVORITES_FEED_MAX_PAGE_SIZE,
+    FAVORITES_FEED_PAGE_SIZE,
+)
+from models import User
+from schemas.user.favorite_feed import FavoriteFeedResponse
+from services.favorite.favorite_feed import get_favorites_feed
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=FavoriteFeedResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def read_favorites_feed(
+    after_id: Optional[int] = None,
+    limit: int = Query(
+        FAVORITES_FEED_PAGE_SIZE, ge=1, le=FAVORITES_FEED_MAX_PAGE_SIZE
+    ),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> FavoriteFeedResponse:
+    return await get_favorites_feed(
+        db=db, user_id=current_user.id, limit=limit, after_id=after_id
+    )
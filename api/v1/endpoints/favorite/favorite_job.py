@@ -1,16 +1,18 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_async_db
 from api.dependencies.ip import get_current_user_ip
+from constants.favorite import FAVORITES_BULK_LIMIT, FavoriteTarget
 from crud.favorite import crud_favorite
-from crud.frilance.job import crud_job
 from models import User
-from models.favorite import Favorite
 from schemas.endpoints.paginated_response import JobPaginatedResponse
+from schemas.user.favorite import FavoriteIds
+from services.favorite.favorite import add_favorites, remove_favorites
+from utilities.exception import SomeObjectsNotFoundError
 
 router = APIRouter()
 
@@ -36,6 +38,47 @@ async def read_favorite_jobs(
     )
 
 
+@router.post(
+    "/",
+    response_model=list[int],
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_favorite_jobs(
+    data: FavoriteIds,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[int]:
+    try:
+        return await add_favorites(
+            db=db,
+            user_id=current_user.id,
+            target=FavoriteTarget.job,
+            ids=data.ids,
+        )
+    except SomeObjectsNotFoundError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=ex.message
+        )
+
+
+@router.delete(
+    "/",
+    response_model=list[int],
+    status_code=status.HTTP_200_OK,
+)
+async def remove_favorite_jobs(
+    ids: list[int] = Query(max_length=FAVORITES_BULK_LIMIT),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[int]:
+    return await remove_favorites(
+        db=db,
+        user_id=current_user.id,
+        target=FavoriteTarget.job,
+        ids=ids,
+    )
+
+
 @router.post(
     "/{job_id}/",
     status_code=status.HTTP_201_CREATED,
@@ -45,28 +88,23 @@ async def add_favorite_job(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
 ):
-    found_job = await crud_job.get_by_id(
-        db=db,
-        obj_id=job_id,
-    )
-    if not found_job:
+    try:
+        added_ids = await add_favorites(
+            db=db,
+            user_id=current_user.id,
+            target=FavoriteTarget.job,
+            ids=[job_id],
+        )
+    except SomeObjectsNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job with ID: {job_id} not found",
         )
-    current_user = await db.merge(current_user)
-    favorite_ids = {favorite.job_id for favorite in current_user.favorites}
-    if found_job.id in favorite_ids:
+    if not added_ids:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Job with ID: {job_id} " "is already added to favorites",
         )
-    new_favorite = Favorite(
-        user_id=current_user.id,
-        job_id=job_id,
-    )
-    current_user.favorites.append(new_favorite)
-    await db.commit()
 
 
 @router.delete(
@@ -78,21 +116,15 @@ async def remove_favorite_job(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
 ):
-    found_job = await crud_job.get_by_id(db=db, obj_id=job_id)
-    if not found_job:
+    removed_ids = await remove_favorites(
+        db=db,
+        user_id=current_user.id,
+        target=FavoriteTarget.job,
+        ids=[job_id],
+    )
+    if not removed_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Job with ID: {job_id} not found",
+            detail=f"Favorite job with ID: {job_id} not found in the"
+            "current user's favorites",
         )
-    for favorite in current_user.favorites:
-        if favorite.job_id == found_job.id:
-            current_user.favorites.remove(favorite)
-            await db.merge(favorite)
-            await db.commit()
-            return
-
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Favorite job with ID: {job_id} not found in the"
-        "current user's favorites",
-    )
@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_async_db
+from constants.favorite import FAVORITES_BULK_LIMIT, FavoriteTarget
 from crud.favorite import crud_favorite
-from crud.organisation.organisation import crud_organisation
 from models import User
-from models.favorite.favorite import Favorite
 from schemas.endpoints.paginated_response import (
     OrganisationFavoritePaginatedResponse,
 )
+from schemas.user.favorite import FavoriteIds
+from services.favorite.favorite import add_favorites, remove_favorites
+from utilities.exception import SomeObjectsNotFoundError
 from utilities.paginated_response import response_with_pagination
 
 router = APIRouter()
@@ -32,6 +34,47 @@ async def read_favorite_organisations(
     return await response_with_pagination(limit=limit, skip=skip, data=objects)
 
 
+@router.post(
+    "/",
+    response_model=list[int],
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_favorite_organisations(
+    data: FavoriteIds,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[int]:
+    try:
+        return await add_favorites(
+            db=db,
+            user_id=current_user.id,
+            target=FavoriteTarget.organisation,
+            ids=data.ids,
+        )
+    except SomeObjectsNotFoundError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=ex.message
+        )
+
+
+@router.delete(
+    "/",
+    response_model=list[int],
+    status_code=status.HTTP_200_OK,
+)
+async def remove_favorite_organisations(
+    ids: list[int] = Query(max_length=FAVORITES_BULK_LIMIT),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[int]:
+    return await remove_favorites(
+        db=db,
+        user_id=current_user.id,
+        target=FavoriteTarget.organisation,
+        ids=ids,
+    )
+
+
 @router.post(
     "/{organisation_id}/",
     status_code=status.HTTP_201_CREATED,
@@ -41,34 +84,24 @@ async def add_favorite_organisation(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
 ):
-    found_organisation = await crud_organisation.get_by_id(
-        db=db, obj_id=organisation_id
-    )
-    if not found_organisation:
+    try:
+        added_ids = await add_favorites(
+            db=db,
+            user_id=current_user.id,
+            target=FavoriteTarget.organisation,
+            ids=[organisation_id],
+        )
+    except SomeObjectsNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organisation not found",
         )
-    current_user = await db.merge(current_user)
-    favorite_ids = {f.organisation_id for f in current_user.favorites}
-    if found_organisation.id in favorite_ids:
+    if not added_ids:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Organisation with ID: {organisation_id}"
             "is already added to favorites",
         )
-    try:
-        new_favorite = Favorite(
-            user_id=current_user.id,
-            organisation_id=organisation_id,
-        )
-        current_user.favorites.append(new_favorite)
-        await db.commit()
-    except Exception as ex:
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(ex)
-        )
 
 
 @router.delete(
@@ -80,23 +113,15 @@ async def remove_favorite_organisation(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
 ):
-    found_organisation = await crud_organisation.get_by_id(
-        db=db, obj_id=organisation_id
+    removed_ids = await remove_favorites(
+        db=db,
+        user_id=current_user.id,
+        target=FavoriteTarget.organisation,
+        ids=[organisation_id],
     )
-    if not found_organisation:
+    if not removed_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Organisation with ID: {organisation_id} not found",
+            detail="Favorite organisation not found in the"
+            "current user's favorites",
         )
-    for favorite in current_user.favorites:
-        if favorite.organisation_id == found_organisation.id:
-            current_user.favorites.remove(favorite)
-            await db.merge(favorite)
-            await db.commit()
-            return
-
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="Favorite organisation not found in the"
-        "current user's favorites",
-    )
@@ -5,11 +5,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_async_db
+from constants.favorite import FavoriteTarget
 from crud.favorite import crud_favorite
 from crud.user import crud_user
 from models import User
-from models.favorite.favorite import Favorite
 from schemas.endpoints.paginated_response import UserPaginatedResponse
+from services.favorite.favorite import add_favorites, remove_favorites
 from utilities.paginated_response import response_with_pagination
 
 router = APIRouter()
@@ -54,26 +55,17 @@ async def add_favorite_user(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You can't add yourself to favorite.",
         )
-    current_user = await db.merge(current_user)
-    favorite_ids = {user.favorite_user_id for user in current_user.favorites}
-    if found_user.id in favorite_ids:
+    added_ids = await add_favorites(
+        db=db,
+        user_id=current_user.id,
+        target=FavoriteTarget.user,
+        ids=[found_user.id],
+    )
+    if not added_ids:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"User with uid {user_uid} is already added to favorites",
         )
-    try:
-        new_favorite = Favorite(
-            user_id=current_user.id,
-            favorite_user_id=found_user.id,
-        )
-        current_user.favorites.append(new_favorite)
-
-        await db.commit()
-    except Exception as ex:
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(ex)
-        )
 
 
 @router.delete(
@@ -92,14 +84,14 @@ async def remove_favorite_user(
             detail=f"User with uid {user_uid} not found",
         )
 
-    for favorite in current_user.favorites:
-        if favorite.favorite_user_id == found_user.id:
-            current_user.favorites.remove(favorite)
-            await db.merge(favorite)
-            await db.commit()
-            return
-
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="Favorite user not found in the current user's favorites",
+    removed_ids = await remove_favorites(
+        db=db,
+        user_id=current_user.id,
+        target=FavoriteTarget.user,
+        ids=[found_user.id],
     )
+    if not removed_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Favorite user not found in the current user's favorites",
+        )
@@ -1,4 +1,3 @@
-from datetime import datetime, timezone
 from typing import Optional, Union
 from uuid import UUID
 
@@ -13,10 +12,14 @@ from api.dependencies.database import get_async_db
 from api.dependencies.ip import get_current_user_ip
 from api.dependencies.redis import get_redis
 from api.filters.job import JobFilter
+from api.routes import UploadSizeLimitRoute
+from constants.frilance.job import JobSortField
+from constants.publication import PublicationErrorCode
+from constants.sorting import SortOrder
 from crud.frilance.job import crud_job
 from crud.frilance.job_with_counters import crud_job as crud_jwc
 from crud.user import crud_user
-from models import User
+from models import MediaFile, User
 from schemas.endpoints.paginated_response import (
     JobPaginatedAuthorResponse,
     JobPaginatedResponse,
@@ -27,15 +30,25 @@ from schemas.frilance.job import (
     JobUpdate,
     JobWithProposalFullResponse,
 )
+from schemas.publication import (
+    PublicationBulkRequest,
+    PublicationBulkResponse,
+    PublicationStateResponse,
+)
 from schemas.user.contact_person import ContactPersonAddCreateMulty
+from services import publication
 from services.frilance import job
 from services.frilance import job_view as service_job_view
 from services.frilance import jobs_read
+from services.frilance.job_recommendation import (
+    invalidate_job_recommendations,
+)
+from services.media import purge_unreferenced, share_files
+from services.user.author_statistics import invalidate_author_statistics
 from services.redis import add_user_to_browsing_now
-from storages.s3_jobs import jobs_storage
 from utilities.exception import ObjectNotFound, SomeObjectsNotFound
 
-router = APIRouter()
+router = APIRouter(route_class=UploadSizeLimitRoute)
 
 
 @router.get(
@@ -52,6 +65,8 @@ async def read_jobs(
     current_user_ip: Optional[str] = Depends(get_current_user_ip),
     redis: Redis = Depends(get_redis),
     favorite: bool = False,
+    sort_by: Optional[JobSortField] = None,
+    sort_order: SortOrder = SortOrder.asc,
 ):
     if favorite:
         if not current_user:
@@ -69,6 +84,8 @@ async def read_jobs(
         redis=redis,
         filters=filters,
         favorite=favorite,
+        sort_by=sort_by,
+        sort_order=sort_order,
     )
 
 
@@ -137,6 +154,29 @@ async def read_author_jobs(
     )
 
 
+@router.get(
+    "/recommended/",
+    response_model=JobPaginatedResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def read_recommended_jobs(
+    db: AsyncSession = Depends(get_async_db),
+    limit: int = 20,
+    skip: int = 0,
+    current_user: User = Depends(get_current_user),
+    current_user_ip: Optional[str] = Depends(get_current_user_ip),
+    redis: Redis = Depends(get_redis),
+):
+    return await jobs_read.read_recommended_jobs(
+        db,
+        redis=redis,
+        limit=limit,
+        skip=skip,
+        current_user_id=current_user.id,
+        current_user_ip=current_user_ip,
+    )
+
+
 @router.get(
     "/{job_id}/",
     response_model=Union[JobWithProposalFullResponse, JobAuthorFullResponse],
@@ -172,6 +212,7 @@ async def read_job(
     await db.commit()
     if author_id and author_id == found_job.Job.author_id:
         schema_class = JobAuthorFullResponse
+        await invalidate_author_statistics(redis=redis, user_id=author_id)
     else:
         schema_class = JobWithProposalFullResponse
     return schema_class.model_validate(
@@ -214,13 +255,14 @@ async def create_job(
     contact_person_files: list[UploadFile] = [],
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     found_user = await crud_user.get_by_uid(db=db, uid=create_data.author_uid)
     if not found_user:
         found_user = current_user
 
     try:
-        return await job.create_job(
+        created_job = await job.create_job(
             db=db,
             user=found_user,
             create_data=create_data,
@@ -233,6 +275,8 @@ async def create_job(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ex.message
         )
+    await invalidate_author_statistics(redis=redis, user_id=found_user.id)
+    return created_job
 
 
 @router.post(
@@ -244,11 +288,11 @@ async def copy_job(
     job_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     if found_job := await crud_job.get_by_id(
         db, obj_id=job_id, author_id=current_user.id
     ):
-        files = await jobs_storage.get_by_names(found_job.filenames)
         specialization_ids = [s.id for s in found_job.specializations]
         create_data = JobCreateDraft(
             specialization_ids=specialization_ids,
@@ -271,23 +315,70 @@ async def copy_job(
         contact_person_data = []
         for person in found_job.contact_persons:
             contact_person_data.append({"contact_person_id": person.id})
-        return await job.create_job(
+        created_job = await job.create_job(
             db=db,
             user=current_user,
             create_data=create_data,
-            files=files,
+            files=[],
             specialization_ids=specialization_ids,
             contact_person_data=ContactPersonAddCreateMulty(
                 data=contact_person_data
             ),
             contact_person_files=[],
         )
+        if found_job.filenames:
+            names = await share_files(
+                db, MediaFile.file, found_job.filenames
+            )
+            db.add_all(
+                MediaFile(file=name, job_id=created_job.id) for name in names
+            )
+            await db.commit()
+            created_job = await crud_job.get_by_id(
+                db, obj_id=created_job.id, author_id=current_user.id
+            )
+        await invalidate_author_statistics(
+            redis=redis, user_id=current_user.id
+        )
+        return created_job
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
         detail="Job not found.",
     )
 
 
+@router.patch(
+    "/publish/",
+    response_model=PublicationBulkResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def publish_jobs(
+    data: PublicationBulkRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
+):
+    return await _set_jobs_published(
+        db, data, user=current_user, redis=redis, published=True
+    )
+
+
+@router.patch(
+    "/unpublish/",
+    response_model=PublicationBulkResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def unpublish_jobs(
+    data: PublicationBulkRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
+):
+    return await _set_jobs_published(
+        db, data, user=current_user, redis=redis, published=False
+    )
+
+
 @router.patch(
     "/{job_id}/",
     response_model=JobAuthorFullResponse,
@@ -301,6 +392,7 @@ async def update_job(
     contact_person_files: list[UploadFile] = [],
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     found_job = await crud_job.get_by_id(
         db, obj_id=job_id, author_id=current_user.id
@@ -317,7 +409,7 @@ async def update_job(
             detail="It's not your job!",
         )
     try:
-        return await job.update_job(
+        updated_job = await job.update_job(
             db=db,
             job=found_job,
             update_data=update_data,
@@ -333,83 +425,42 @@ async def update_job(
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=str(ex.errors())
         )
+    # Заменённые вложения могли остаться без ссылок.
+    await purge_unreferenced(db, MediaFile.file)
+    await invalidate_job_recommendations(redis=redis)
+    await invalidate_author_statistics(redis=redis, user_id=current_user.id)
+    return updated_job
 
 
 @router.patch(
     "/publish/{job_id}/",
-    response_model=JobAuthorFullResponse,
+    response_model=PublicationStateResponse,
     status_code=status.HTTP_200_OK,
 )
 async def publish_job(
     job_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
-    found_job = await crud_job.get_by_id(
-        db, obj_id=job_id, author_id=current_user.id
-    )
-    if not found_job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found",
-        )
-    if found_job.author_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="It's not your job!",
-        )
-    if found_job.is_draft:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Cannot publish a draft job.",
-        )
-    if not found_job.is_archived:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="The job is already published.",
-        )
-    found_job.is_archived = False
-    found_job.published_at = datetime.now(tz=timezone.utc)
-    await db.commit()
-    await db.refresh(found_job)
-    return await crud_jwc.get_by_id(
-        db, obj_id=job_id, author_id=current_user.id
+    return await _set_job_published(
+        db, job_id, user=current_user, redis=redis, published=True
     )
 
 
 @router.patch(
     "/unpublish/{job_id}/",
-    response_model=JobAuthorFullResponse,
+    response_model=PublicationStateResponse,
     status_code=status.HTTP_200_OK,
 )
 async def unpublish_job(
     job_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
-    found_job = await crud_job.get_by_id(
-        db, obj_id=job_id, author_id=current_user.id
-    )
-    if not found_job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found",
-        )
-    if found_job.author_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="It's not your job!",
-        )
-    if found_job.is_archived:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="The job is not published.",
-        )
-    found_job.is_archived = True
-    await db.commit()
-    await db.refresh(found_job)
-    return await crud_jwc.get_by_id(
-        db, obj_id=job_id, author_id=current_user.id
+    return await _set_job_published(
+        db, job_id, user=current_user, redis=redis, published=False
     )
 
 
@@ -421,6 +472,7 @@ async def delete_job(
     job_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     found_job = await crud_job.get(db, obj_id=job_id)
 
@@ -435,4 +487,61 @@ async def delete_job(
             detail="It's not your job!",
         )
 
-    return await crud_job.remove(db, obj_id=job_id)
+    await crud_job.remove(db, obj_id=job_id)
+    await purge_unreferenced(db, MediaFile.file)
+    await invalidate_author_statistics(redis=redis, user_id=current_user.id)
+
+
+JOB_PUBLICATION_ERRORS = {
+    PublicationErrorCode.NOT_FOUND: (
+        status.HTTP_404_NOT_FOUND,
+        "Job not found",
+    ),
+    PublicationErrorCode.NOT_AUTHOR: (
+        status.HTTP_403_FORBIDDEN,
+        "It's not your job!",
+    ),
+    PublicationErrorCode.DRAFT: (
+        status.HTTP_409_CONFLICT,
+        "Cannot publish a draft job.",
+    ),
+    PublicationErrorCode.ALREADY_PUBLISHED: (
+        status.HTTP_409_CONFLICT,
+        "The job is already published.",
+    ),
+    PublicationErrorCode.NOT_PUBLISHED: (
+        status.HTTP_409_CONFLICT,
+        "The job is not published.",
+    ),
+}
+
+
+async def _set_job_published(
+    db: AsyncSession, job_id: int, user: User, redis: Redis, published: bool
+):
+    try:
+        state = await publication.set_published(
+            db, crud_job, obj_id=job_id, user_id=user.id, published=published
+        )
+    except publication.PublicationError as ex:
+        status_code, detail = JOB_PUBLICATION_ERRORS[ex.code]
+        raise HTTPException(status_code=status_code, detail=detail)
+    await invalidate_job_recommendations(redis=redis)
+    await invalidate_author_statistics(redis=redis, user_id=user.id)
+    return state
+
+
+async def _set_jobs_published(
+    db: AsyncSession,
+    data: PublicationBulkRequest,
+    user: User,
+    redis: Redis,
+    published: bool,
+) -> PublicationBulkResponse:
+    objects, errors = await publication.set_published_many(
+        db, crud_job, ids=data.ids, user_id=user.id, published=published
+    )
+    if objects:
+        await invalidate_job_recommendations(redis=redis)
+        await invalidate_author_statistics(redis=redis, user_id=user.id)
+    return PublicationBulkResponse(objects=objects, errors=errors)
@@ -1,13 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, Optional, Sequence
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from fastapi_filter import FilterDepends
+from redis import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_async_db
+from api.dependencies.redis import get_redis
+from api.filters.proposal import ProposalBoardFilter
+from api.routes import UploadSizeLimitRoute
+from constants.frilance.proposal import (
+    PROPOSAL_BOARD_MAX_PAGE_SIZE,
+    PROPOSAL_BOARD_PAGE_SIZE,
+    ProposalSortField,
+)
+from constants.sorting import SortOrder
 from crud.frilance.job import crud_job
 from crud.frilance.proposal import crud_proposal
+from crud.frilance.proposal_board import (
+    ANSWER_SORT_COLUMNS,
+    crud_proposal_board,
+)
 from crud.frilance.proposal_status import crud_proposal_status
 from crud.frilance.proposal_table_config import crud_proposal_table_config
-from models import User
+from models import ProposalTableConfig, User
 from schemas.frilance.proposals import (
     ProposalCreate,
     ProposalCreateDB,
@@ -18,13 +44,14 @@ from schemas.frilance.proposals import (
     ProposalUpdateForSpecialist,
 )
 from services.frilance import proposal
+from services.user.author_statistics import invalidate_author_statistics
 from utilities.exception import (
     FileNotFound,
     SomeObjectsNotFound,
     WrongAnswerFieldRelation,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=UploadSizeLimitRoute)
 
 
 @router.get(
@@ -62,6 +89,91 @@ async def read_job_proposals(
     }
 
 
+@router.get(
+    "/{job_id}/page/",
+    response_model=ProposalsWithConfigsResponse,
+    status_code=status.HTTP_200_OK,
+    description="""
+       Keyset-пагинация откликов: следующий `after_id` возвращается
+       в заголовке `X-Next-After-Id`, пока есть следующая страница.
+       Фильтры `answer__*` и сортировка `number_answer`/`choice_answer`
+       работают по ответам на одно поле таблицы откликов.
+       """,
+)
+async def read_job_proposals_page(
+    job_id: int,
+    response: Response,
+    after_id: Optional[int] = None,
+    limit: int = Query(
+        PROPOSAL_BOARD_PAGE_SIZE, ge=1, le=PROPOSAL_BOARD_MAX_PAGE_SIZE
+    ),
+    filters: ProposalBoardFilter = FilterDepends(ProposalBoardFilter),
+    sort_by: Optional[ProposalSortField] = None,
+    sort_field_id: Optional[int] = None,
+    sort_order: SortOrder = SortOrder.asc,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    if sort_by in ANSWER_SORT_COLUMNS and sort_field_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="sort_field_id is required to sort by answers.",
+        )
+    await _check_job_author(db=db, job_id=job_id, user=current_user)
+    proposal_table_config = (
+        await crud_proposal_table_config.get_by_job_id_and_user_id(
+            db=db, job_id=job_id, user_id=current_user.id
+        )
+    )
+    proposals = await crud_proposal_board.get_page(
+        db,
+        job_id=job_id,
+        field_ids=_get_visible_field_ids(proposal_table_config),
+        after_id=after_id,
+        limit=limit,
+        filters=filters,
+        sort_by=sort_by,
+        sort_field_id=sort_field_id,
+        sort_order=sort_order,
+    )
+    if len(proposals) == limit:
+        response.headers["X-Next-After-Id"] = str(proposals[-1].id)
+    return {
+        "proposals": proposals,
+        "configs": proposal_table_config,
+    }
+
+
+@router.get(
+    "/{job_id}/export/",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export_job_proposals(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    await _check_job_author(db=db, job_id=job_id, user=current_user)
+    field_ids = _get_visible_field_ids(
+        await crud_proposal_table_config.get_by_job_id_and_user_id(
+            db=db, job_id=job_id, user_id=current_user.id
+        )
+    )
+    session_maker = async_sessionmaker(bind=db.bind, expire_on_commit=False)
+
+    async def generate() -> AsyncIterator[str]:
+        async with session_maker() as session:
+            async for found_proposal in crud_proposal_board.stream(
+                session, job_id=job_id, field_ids=field_ids
+            ):
+                yield ProposalFullResponse.model_validate(
+                    found_proposal, from_attributes=True
+                ).model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.post(
     "/{job_id}/",
     response_model=ProposalResponse,
@@ -73,6 +185,7 @@ async def create_proposal(
     create_data: ProposalCreate = Depends(ProposalCreate),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     found_job = await crud_job.get_by_id(db, obj_id=job_id)
     if not found_job:
@@ -94,9 +207,13 @@ async def create_proposal(
         job_id=job_id,
         **create_data.model_dump(exclude_unset=True)
     )
-    return await proposal.create_proposal(
+    created_proposal = await proposal.create_proposal(
         db=db, files=files, create_data=create_data_db
     )
+    await invalidate_author_statistics(
+        redis=redis, user_id=found_job.Job.author_id
+    )
+    return created_proposal
 
 
 @router.patch(
@@ -193,6 +310,7 @@ async def delete_proposal(
     proposal_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     found_proposal = await crud_proposal.get(db, obj_id=proposal_id)
 
@@ -207,4 +325,32 @@ async def delete_proposal(
             detail="It's not your proposal!",
         )
 
-    return await crud_proposal.remove(db, obj_id=proposal_id)
+    found_job = await crud_job.get(db, obj_id=found_proposal.job_id)
+    await crud_proposal.remove(db, obj_id=proposal_id)
+    await invalidate_author_statistics(
+        redis=redis, user_id=found_job.author_id if found_job else None
+    )
+
+
+async def _check_job_author(
+    db: AsyncSession, job_id: int, user: User
+) -> None:
+    found_job = await crud_job.get_by_id(db, obj_id=job_id, author_id=user.id)
+    if not found_job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found.",
+        )
+    if found_job.Job.author_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission!",
+        )
+
+
+def _get_visible_field_ids(
+    configs: Sequence[ProposalTableConfig],
+) -> list[int]:
+    """Поля из конфигурации таблицы автора, ответы на которые видны."""
+
+    return [field.id for config in configs for field in config.custom_fields]
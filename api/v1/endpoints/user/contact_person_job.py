@@ -12,6 +12,7 @@ from starlette.responses import JSONResponse
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_async_db
+from api.routes import UploadSizeLimitRoute
 from constants.user.contact_person import (
     CREATE_DATA_EXAMPLE,
     UPDATE_DATA_EXAMPLE,
@@ -24,7 +25,7 @@ from services.dto.exception import DTOException
 from services.user import contact_person
 from utilities.exception import SomeObjectsNotFound
 
-router = APIRouter()
+router = APIRouter(route_class=UploadSizeLimitRoute)
 
 
 @router.post(
@@ -3,10 +3,13 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from fastapi.exceptions import RequestValidationError
+from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_async_db
+from api.dependencies.redis import get_redis
+from api.routes import UploadSizeLimitRoute
 from crud.education import crud_education
 from crud.user import crud_user
 from models import User
@@ -16,7 +19,9 @@ from schemas.user.education import (
     EducationUpdateMulty,
     EducationUpdateSingle,
 )
+from services.storage import FileTooLargeError
 from services.user import education
+from services.user.profile_snapshot import invalidate_profile_snapshot
 from utilities.exception import (
     FileNotFound,
     ObjectNotFound,
@@ -24,7 +29,7 @@ from utilities.exception import (
     SomeObjectsNotFound,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=UploadSizeLimitRoute)
 
 
 @router.get("/{user_uid}/", response_model=List[EducationResponse])
@@ -51,15 +56,25 @@ async def create_user_education(
     files: List[UploadFile] = [],
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     try:
         return await education.create_education(
-            db=db, create_data=create_data, files=files, user=current_user
+            db=db,
+            create_data=create_data,
+            files=files,
+            user=current_user,
+            redis=redis,
         )
     except (SomeObjectsNotFound, FileNotFound) as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ex.message
         )
+    except FileTooLargeError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=ex.message,
+        )
 
 
 @router.put(
@@ -72,15 +87,25 @@ async def update_education_multi(
     files: List[UploadFile] = [],
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     try:
         return await education.update_education_multi(
-            db=db, update_data=update_data, files=files, user=current_user
+            db=db,
+            update_data=update_data,
+            files=files,
+            user=current_user,
+            redis=redis,
         )
     except (SomeObjectsNotFound, FileNotFound) as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ex.message
         )
+    except FileTooLargeError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=ex.message,
+        )
     except PermissionDenied as ex:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -99,6 +124,7 @@ async def update_education(
     files: List[UploadFile] = [],
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     try:
         return await education.update_education(
@@ -107,11 +133,17 @@ async def update_education(
             update_data=update_data,
             files=files,
             user=current_user,
+            redis=redis,
         )
     except (SomeObjectsNotFound, FileNotFound, ObjectNotFound) as ex:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ex.message
         )
+    except FileTooLargeError as ex:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=ex.message,
+        )
     except PermissionDenied as ex:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -128,6 +160,7 @@ async def delete_user_education(
     education_id: int,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     found_education = await crud_education.get_by_id(db, obj_id=education_id)
     if not found_education:
@@ -141,3 +174,4 @@ async def delete_user_education(
             detail="You don't have permission!",
         )
     await crud_education.remove(db, obj_id=education_id)
+    await invalidate_profile_snapshot(redis=redis, uid=current_user.uid)
@@ -1,16 +1,21 @@
+import asyncio
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.datastructures import UploadFile as StarletteUploadFile
 
 from api.dependencies.auth import get_current_user
 from api.dependencies.database import get_async_db
+from api.dependencies.redis import get_redis
+from api.routes import UploadSizeLimitRoute
 from crud.city import crud_city
 from crud.timezone import crud_timezone
 from crud.user import crud_user
 from models import User
+from schemas.user.author_statistics import AuthorStatisticsResponse
 from schemas.user.user import (
     UserCreate,
     UserDetailResponse,
@@ -22,10 +27,17 @@ from schemas.user.user import (
 )
 from schemas.user.user_full import UserResponseFull
 from schemas.user.user_info import UserInfoCreateUpdate
-from services.user import user_info, user_service
+from services.images import create_variants, set_image_variants
+from services.storage import get_storage
+from services.user import (
+    author_statistics,
+    profile_snapshot,
+    user_info,
+    user_service,
+)
 from utilities.exception import SomeObjectsNotFound
 
-router = APIRouter()
+router = APIRouter(route_class=UploadSizeLimitRoute)
 
 
 @router.get("/profile/", response_model=UserProfileResponse)
@@ -35,6 +47,17 @@ async def profile(
     return current_user
 
 
+@router.get("/statistics/", response_model=AuthorStatisticsResponse)
+async def read_author_statistics(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
+):
+    return await author_statistics.get_author_statistics(
+        db=db, redis=redis, user_id=current_user.id
+    )
+
+
 @router.get("/{user_uid}/", response_model=UserDetailResponse)
 async def read_user(
     user_uid: UUID,
@@ -52,8 +75,11 @@ async def read_user(
 async def read_user_full(
     user_uid: UUID,
     db: AsyncSession = Depends(get_async_db),
+    redis: Redis = Depends(get_redis),
 ):
-    if found_user := await crud_user.get_by_uid_full(db=db, uid=user_uid):
+    if found_user := await profile_snapshot.get_profile_snapshot(
+        db=db, redis=redis, uid=user_uid
+    ):
         return found_user
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -85,6 +111,7 @@ async def update_user(
     update_data: UserUpdate,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     if update_data.city_id:
         found_city = await crud_city.get_by_id(
@@ -105,17 +132,25 @@ async def update_user(
                 detail=f"Timezone with id: "
                 f"{update_data.timezone_id} not found.",
             )
-    return await crud_user.update(
+    user = await crud_user.update(
         db=db, db_obj=current_user, update_data=update_data
     )
+    await profile_snapshot.invalidate_profile_snapshot(
+        redis=redis, uid=current_user.uid
+    )
+    return user
 
 
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
-    return await crud_user.mark_as_deleted(db=db, user_id=current_user.id)
+    await crud_user.mark_as_deleted(db=db, user_id=current_user.id)
+    await profile_snapshot.invalidate_profile_snapshot(
+        redis=redis, uid=current_user.uid
+    )
 
 
 @router.put(
@@ -128,6 +163,7 @@ async def add_photos(
     profile_cover: Optional[UploadFile | str],
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     update_data = {}
     if isinstance(photo, StarletteUploadFile):
@@ -150,6 +186,21 @@ async def add_photos(
         update_data=update_data,
     )
     await db.refresh(user)
+    names = [getattr(user, field).name for field in update_data]
+    variants = await asyncio.gather(
+        *(
+            create_variants(
+                get_storage(getattr(User, field)), name, file.file
+            )
+            for name, (field, file) in zip(names, update_data.items())
+        )
+    )
+    set_image_variants(user, dict(zip(names, variants)))
+    await db.commit()
+    await db.refresh(user)
+    await profile_snapshot.invalidate_profile_snapshot(
+        redis=redis, uid=user.uid
+    )
     return user
 
 
@@ -158,10 +209,14 @@ async def update_user_info(
     update_data: UserInfoCreateUpdate,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ):
     try:
         return await user_info.create_update_user_info(
-            db=db, schema=update_data, user_uid=current_user.uid
+            db=db,
+            schema=update_data,
+            user_uid=current_user.uid,
+            redis=redis,
         )
     except SomeObjectsNotFound as ex:
         raise HTTPException(
@@ -0,0 +1,141 @@
+from decimal import Decimal
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi_filter import FilterDepends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies.auth import get_current_user
+from api.dependencies.database import get_async_db
+from api.filters.user_expert import UserExpertFilter
+from api.filters.user_specialist import UserSpecialistFilter
+from constants.sorting import SortOrder
+from crud.user_catalog import crud_user_catalog
+from models import User
+from schemas.user.user_catalog import (
+    UserExpertResponse,
+    UserSpecialistResponse,
+)
+
+router = APIRouter()
+
+PRICE_ORDER_DESCRIPTION = "Сортировка по цене в рублях по курсу ExchangeRate."
+PRICE_RANGE_DESCRIPTION = "Граница цены в рублях по курсу ExchangeRate."
+
+
+@router.get("/user-specialists/", response_model=List[UserSpecialistResponse])
+async def read_user_specialists(
+    filters: UserSpecialistFilter = FilterDepends(UserSpecialistFilter),
+    skip: int = 0,
+    limit: int = 100,
+    price_order: Optional[SortOrder] = Query(
+        None, description=PRICE_ORDER_DESCRIPTION
+    ),
+    price_gte: Optional[Decimal] = Query(
+        None, ge=0, description=PRICE_RANGE_DESCRIPTION
+    ),
+    price_lte: Optional[Decimal] = Query(
+        None, ge=0, description=PRICE_RANGE_DESCRIPTION
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await crud_user_catalog.get_specialists(
+        db,
+        skip=skip,
+        limit=limit,
+        filters=filters,
+        price_order=price_order,
+        price_gte=price_gte,
+        price_lte=price_lte,
+    )
+
+
+@router.get("/user-experts/", response_model=List[UserExpertResponse])
+async def read_user_experts(
+    filters: UserExpertFilter = FilterDepends(UserExpertFilter),
+    skip: int = 0,
+    limit: int = 100,
+    price_order: Optional[SortOrder] = Query(
+        None, description=PRICE_ORDER_DESCRIPTION
+    ),
+    price_gte: Optional[Decimal] = Query(
+        None, ge=0, description=PRICE_RANGE_DESCRIPTION
+    ),
+    price_lte: Optional[Decimal] = Query(
+        None, ge=0, description=PRICE_RANGE_DESCRIPTION
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await crud_user_catalog.get_experts(
+        db,
+        skip=skip,
+        limit=limit,
+        filters=filters,
+        price_order=price_order,
+        price_gte=price_gte,
+        price_lte=price_lte,
+    )
+
+
+@router.get(
+    "/user-specialists/favorite/",
+    response_model=List[UserSpecialistResponse],
+)
+async def read_favorite_user_specialists(
+    filters: UserSpecialistFilter = FilterDepends(UserSpecialistFilter),
+    skip: int = 0,
+    limit: int = 100,
+    price_order: Optional[SortOrder] = Query(
+        None, description=PRICE_ORDER_DESCRIPTION
+    ),
+    price_gte: Optional[Decimal] = Query(
+        None, ge=0, description=PRICE_RANGE_DESCRIPTION
+    ),
+    price_lte: Optional[Decimal] = Query(
+        None, ge=0, description=PRICE_RANGE_DESCRIPTION
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await crud_user_catalog.get_specialists_favorite(
+        db,
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        filters=filters,
+        price_order=price_order,
+        price_gte=price_gte,
+        price_lte=price_lte,
+    )
+
+
+@router.get(
+    "/user-experts/favorite/",
+    response_model=List[UserExpertResponse],
+)
+async def read_favorite_user_experts(
+    filters: UserExpertFilter = FilterDepends(UserExpertFilter),
+    skip: int = 0,
+    limit: int = 100,
+    price_order: Optional[SortOrder] = Query(
+        None, description=PRICE_ORDER_DESCRIPTION
+    ),
+    price_gte: Optional[Decimal] = Query(
+        None, ge=0, description=PRICE_RANGE_DESCRIPTION
+    ),
+    price_lte: Optional[Decimal] = Query(
+        None, ge=0, description=PRICE_RANGE_DESCRIPTION
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await crud_user_catalog.get_experts_favorite(
+        db,
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        filters=filters,
+        price_order=price_order,
+        price_gte=price_gte,
+        price_lte=price_lte,
+    )
@@ -26,6 +26,7 @@ from .endpoints.emails.change_email import router as change_email
 from .endpoints.emails.vefiry_email import router as email_verify_router
 from .endpoints.event import router as event_router
 from .endpoints.favorite.favorite_event import router as favorite_event
+from .endpoints.favorite.favorite_feed import router as favorite_feed
 from .endpoints.favorite.favorite_job import router as favorite_job
 from .endpoints.favorite.favorite_organisation import (
     router as favorite_organisation,
@@ -79,6 +80,11 @@ router.include_router(
     prefix="/favorite-users",
     tags=["Favorite users"],
 )
+router.include_router(
+    favorite_feed,
+    prefix="/favorites",
+    tags=["Favorites"],
+)
 router.include_router(
     user_catalogs_router,
     prefix="",
@@ -0,0 +1,2 @@
+ARCHIVE_BATCH_SIZE: int = 500
+ARCHIVE_INTERVAL: int = 10 * 60
@@ -0,0 +1,18 @@
+from enum import Enum
+
+PARTICIPANTS_PAGE_SIZE: int = 50
+PARTICIPANTS_MAX_PAGE_SIZE: int = 200
+PARTICIPANTS_EXPORT_BATCH_SIZE: int = 500
+# Колонки CSV-выгрузки участников, вычисляемые поля в неё не входят.
+PARTICIPANTS_EXPORT_COLUMNS: tuple[str, ...] = (
+    "uid",
+    "first_name",
+    "second_name",
+    "username",
+    "photo",
+)
+
+
+class ParticipantsExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
@@ -0,0 +1,9 @@
+EVENT_RECOMMENDATIONS_KEY: str = "event_recommendations:{user_id}"
+EVENT_RECOMMENDATIONS_TTL: int = 60 * 15
+EVENT_RECOMMENDATIONS_TOP_K: int = 100
+
+SPECIALIZATION_WEIGHT: int = 10
+ATTENDED_SPECIALIZATION_WEIGHT: int = 4
+FAVORITE_SPECIALIZATION_WEIGHT: int = 3
+CITY_WEIGHT: int = 5
+TIMEZONE_WEIGHT: int = 2
@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+FAVORITES_BULK_LIMIT = 100
+FAVORITES_FEED_PAGE_SIZE = 20
+FAVORITES_FEED_MAX_PAGE_SIZE = 100
+
+
+class FavoriteTarget(StrEnum):
+    event = "event"
+    job = "job"
+    organisation = "organisation"
+    user = "user"
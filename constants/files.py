@@ -0,0 +1,7 @@
+MAX_UPLOAD_FILE_SIZE: int = 20 * 1024 * 1024
+MAX_UPLOAD_REQUEST_SIZE: int = 100 * 1024 * 1024
+UPLOAD_CONCURRENCY: int = 4
+HASH_CHUNK_SIZE: int = 1024 * 1024
+MEDIA_PURGE_INTERVAL: int = 60 * 60
+# Лимит тела multipart-запроса: файлы плюс поля формы и границы.
+MAX_UPLOAD_BODY_SIZE: int = MAX_UPLOAD_REQUEST_SIZE + 1024 * 1024
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class JobSortField(str, Enum):
+    AUTHOR = "author"
+    # Бюджет в рублях по курсу ExchangeRate.
+    PRICE = "price"
@@ -0,0 +1,23 @@
+from enum import Enum
+
+PROPOSAL_BOARD_PAGE_SIZE: int = 50
+PROPOSAL_BOARD_MAX_PAGE_SIZE: int = 200
+PROPOSAL_EXPORT_BATCH_SIZE: int = 500
+
+
+class ProposalAnswerRelation(str, Enum):
+    TEXT = "text_answers"
+    NUMBER = "number_answers"
+    SINGLE_CHOICE = "single_choice_answers"
+    MULTIPLE_CHOICE = "multiple_choice_answers"
+    FILE = "file_answers"
+
+
+class ProposalSortField(str, Enum):
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    PRICE = "price"
+    STATUS = "status"
+    # Требуют sort_field_id - поле, по ответам на которое сортировать.
+    NUMBER_ANSWER = "number_answer"
+    CHOICE_ANSWER = "choice_answer"
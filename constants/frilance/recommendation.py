@@ -0,0 +1,8 @@
+JOB_RECOMMENDATIONS_KEY: str = "job_recommendations:{generation}:{user_id}"
+JOB_RECOMMENDATIONS_GENERATION_KEY: str = "job_recommendations_generation"
+JOB_RECOMMENDATIONS_TTL: int = 60 * 30
+JOB_RECOMMENDATIONS_TOP_K: int = 200
+
+SPECIALIZATION_WEIGHT: int = 10
+LANGUAGE_WEIGHT: int = 3
+BUDGET_WEIGHT: int = 2
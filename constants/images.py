@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class ImageVariant(str, Enum):
+    THUMBNAIL = "thumbnail"
+    PREVIEW = "preview"
+
+
+IMAGE_VARIANT_SIZES: dict[ImageVariant, tuple[int, int]] = {
+    ImageVariant.THUMBNAIL: (320, 320),
+    ImageVariant.PREVIEW: (1280, 1280),
+}
+IMAGE_VARIANT_FORMAT: str = "webp"
+IMAGE_VARIANT_QUALITY: int = 80
+IMAGE_WORKERS: int = 2
+IMAGE_BACKFILL_CONCURRENCY: int = 4
+IMAGE_BACKFILL_BATCH_SIZE: int = 100
@@ -0,0 +1,19 @@
+from models import User
+
+USER_FULL_LOAD_ONLY = (
+    User.id,
+    User.uid,
+    User.first_name,
+    User.second_name,
+    User.email,
+    User.username,
+    User.photo,
+    User.profile_cover,
+    User.image_variants,
+    User.birthday,
+    User.last_visited_at,
+    User.contact_info,
+    User.profile_completeness,
+    User.city_id,
+    User.timezone_id,
+)
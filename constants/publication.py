@@ -0,0 +1,11 @@
+from enum import Enum
+
+PUBLICATION_BULK_MAX_SIZE: int = 100
+
+
+class PublicationErrorCode(str, Enum):
+    NOT_FOUND = "not_found"
+    NOT_AUTHOR = "not_author"
+    DRAFT = "draft"
+    ALREADY_PUBLISHED = "already_published"
+    NOT_PUBLISHED = "not_published"
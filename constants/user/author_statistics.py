@@ -0,0 +1,2 @@
+AUTHOR_STATISTICS_KEY: str = "author_statistics:{user_id}"
+AUTHOR_STATISTICS_TTL: int = 60 * 5
@@ -0,0 +1,5 @@
+PROFILE_SNAPSHOT_KEY: str = "user_profile_snapshot:{uid}"
+# Снимок сбрасывается при изменении пользователя, его информации,
+# образования и мероприятий. Опыт, менторство и проекты меняются кодом
+# вне этого сервиса и обновляются в снимке только по истечении TTL.
+PROFILE_SNAPSHOT_TTL: int = 60 * 10
@@ -0,0 +1,3 @@
+PURGE_AFTER_DAYS: int = 30
+PURGE_USERS_BATCH_SIZE: int = 100
+PURGE_ROWS_CHUNK_SIZE: int = 1000
@@ -4,7 +4,9 @@ from crud.crud_mixins import (
     CreateAsync,
     DeleteAsync,
     ReadAsync,
+    SyncAsync,
     UpdateAsync,
+    UpsertAsync,
 )
 
 
@@ -14,6 +16,8 @@ class BaseAsyncCRUD(
     ReadAsync[ModelType],
     UpdateAsync[ModelType, UpdateSchemaType],
     DeleteAsync[ModelType],
+    SyncAsync[ModelType],
+    UpsertAsync[ModelType, CreateSchemaType],
 ):
     """
     CRUD object with default methods to Create, Read, Update, Delete (CRUD)
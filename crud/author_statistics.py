@@ -0,0 +1,44 @@
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.crud_mixins import BaseCRUD
+from models import AuthorStatistics
+
+
+class CRUDAuthorStatistics(BaseCRUD[AuthorStatistics]):
+    counters = (
+        AuthorStatistics.archived_jobs_count,
+        AuthorStatistics.draft_jobs_count,
+        AuthorStatistics.published_jobs_count,
+        AuthorStatistics.proposals_count,
+        AuthorStatistics.jobs_views,
+        AuthorStatistics.archived_events_count,
+        AuthorStatistics.draft_events_count,
+        AuthorStatistics.published_events_count,
+        AuthorStatistics.participants_count,
+    )
+
+    async def get_by_author_id(
+        self, db: AsyncSession, *, author_id: int
+    ) -> Optional[RowMapping]:
+        """
+        Все счётчики дашборда автора поиском по первичному ключу.
+
+        Счётчики поддерживаются триггерами при записи; у автора без
+        вакансий и мероприятий строки нет.
+        """
+
+        statement = select(
+            *self.counters,
+            func.greatest(
+                self.model.proposals_count - self.model.proposals_views, 0
+            ).label("new_proposals_count"),
+        ).where(self.model.user_id == author_id)
+        result = await db.execute(statement)
+        return result.mappings().one_or_none()
+
+
+crud_author_statistics = CRUDAuthorStatistics(AuthorStatistics)
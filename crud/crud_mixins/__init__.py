@@ -1,13 +1,22 @@
+from .archive import ArchiveAsync
 from .base import BaseCRUD
 from .create import CreateAsync
 from .delete import DeleteAsync
 from .read import ReadAsync
+from .statement_cache import StatementCacheMixin, equals_param
+from .sync import SyncAsync
 from .update import UpdateAsync
+from .upsert import UpsertAsync
 
 __all__ = [
     "CreateAsync",
     "ReadAsync",
     "UpdateAsync",
     "DeleteAsync",
+    "SyncAsync",
+    "UpsertAsync",
+    "ArchiveAsync",
+    "StatementCacheMixin",
+    "equals_param",
     "BaseCRUD",
 ]
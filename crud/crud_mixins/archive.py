@@ -0,0 +1,107 @@
+from typing import Generic, Sequence
+
+from sqlalchemy import ColumnElement, Row, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.crud_types import ModelType
+
+
+class ArchiveAsync(Generic[ModelType]):
+    # Колонка автора записи, которому разрешено менять публикацию.
+    owner_field: str = "author_id"
+
+    async def archive_batch(
+        self,
+        db: AsyncSession,
+        *,
+        expired: ColumnElement[bool],
+        after_id: int = 0,
+        limit: int,
+    ) -> list[Row]:
+        """
+        Архивирует до `limit` опубликованных записей с id > after_id,
+        для которых выполняется `expired`, и возвращает их id и
+        owner_id по возрастанию id.
+
+        Строки, заблокированные другими транзакциями, пропускаются
+        и будут заархивированы при следующем запуске.
+        """
+
+        batch = (
+            select(self.model.id)
+            .where(
+                self.model.id > after_id,
+                self.model.is_draft.is_(False),
+                self.model.is_archived.is_(False),
+                expired,
+            )
+            .order_by(self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte()
+        )
+        statement = (
+            update(self.model)
+            .where(self.model.id.in_(select(batch.c.id)))
+            .values(is_archived=True)
+            .returning(
+                self.model.id,
+                getattr(self.model, self.owner_field).label("owner_id"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(statement)
+        return sorted(result.all(), key=lambda row: row.id)
+
+    async def set_archived(
+        self,
+        db: AsyncSession,
+        *,
+        ids: Sequence[int],
+        owner_id: int,
+        is_archived: bool,
+    ) -> list[Row]:
+        """
+        Публикует или снимает с публикации записи автора одним
+        UPDATE ... RETURNING.
+
+        Возвращает изменённые строки. Черновики и записи, которые уже
+        в нужном состоянии или принадлежат другому автору, не меняются.
+        """
+
+        values = {"is_archived": is_archived}
+        if not is_archived:
+            values["published_at"] = func.now()
+        statement = (
+            update(self.model)
+            .where(
+                self.model.id.in_(ids),
+                getattr(self.model, self.owner_field) == owner_id,
+                self.model.is_draft.is_(False),
+                self.model.is_archived.is_(not is_archived),
+            )
+            .values(**values)
+            .returning(
+                self.model.id,
+                self.model.is_draft,
+                self.model.is_archived,
+                self.model.published_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(statement)
+        return list(result.all())
+
+    async def get_publication_states(
+        self, db: AsyncSession, *, ids: Sequence[int]
+    ) -> dict[int, Row]:
+        """Автор и состояние публикации записей, без связей."""
+
+        statement = select(
+            self.model.id,
+            getattr(self.model, self.owner_field).label("owner_id"),
+            self.model.is_draft,
+            self.model.is_archived,
+        ).where(self.model.id.in_(ids))
+        result = await db.execute(statement)
+        return {row.id: row for row in result.all()}
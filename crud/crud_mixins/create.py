@@ -1,5 +1,6 @@
-from typing import Generic
+from typing import Generic, Sequence, Union
 
+from pydantic import BaseModel
 from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,3 +23,37 @@ class CreateAsync(Generic[CreateSchemaType, ModelType]):
             await db.commit()
             await db.refresh(obj)
         return obj
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        create_schemas: Sequence[Union[CreateSchemaType, dict]],
+        options: Sequence = (),
+        commit: bool = True,
+    ) -> Sequence[ModelType]:
+        """
+        Создаёт записи одним executemany INSERT ... RETURNING.
+
+        Объекты возвращаются в порядке входных данных и уже заполнены
+        из RETURNING, поэтому дополнительный refresh не выполняется.
+        """
+
+        if not create_schemas:
+            return []
+        data = [
+            schema.model_dump(exclude_unset=True)
+            if isinstance(schema, BaseModel)
+            else schema
+            for schema in create_schemas
+        ]
+        stmt = (
+            insert(self.model)
+            .returning(self.model, sort_by_parameter_order=True)
+            .options(*options)
+        )
+        res = await db.scalars(stmt, data)
+        objects = res.all()
+        if commit:
+            await db.commit()
+        return objects
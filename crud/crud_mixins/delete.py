@@ -1,5 +1,6 @@
-from typing import Generic, Optional
+from typing import Generic, Iterable, Optional
 
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from constants.crud_types import ModelType
@@ -17,3 +18,19 @@ class DeleteAsync(Generic[ModelType]):
         if commit:
             await db.commit()
         return obj
+
+    async def remove_many(
+        self, db: AsyncSession, *, ids: Iterable[int], commit: bool = True
+    ) -> None:
+        """Удаляет записи по id одним DELETE."""
+
+        ids = list(ids)
+        if not ids:
+            return
+        await db.execute(
+            delete(self.model)
+            .where(self.model.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        if commit:
+            await db.commit()
@@ -0,0 +1,40 @@
+from typing import Any, Callable, Hashable, Mapping
+
+from sqlalchemy import ColumnElement, bindparam
+from sqlalchemy.sql.selectable import Select
+
+
+class StatementCacheMixin:
+    """
+    Запросы, которые собираются один раз на процесс.
+
+    Значения передаются при выполнении через bindparam, поэтому один и
+    тот же select() переиспользуется, а SQLAlchemy берёт его
+    скомпилированную форму из кэша. Сборщик получает только имена
+    параметров со значением None: от них зависит форма запроса
+    (IS NULL вместо сравнения, пропущенные подзапросы).
+    """
+
+    def get_statement(
+        self,
+        key: Hashable,
+        build: Callable[[frozenset[str]], Select],
+        params: Mapping[str, Any],
+    ) -> Select:
+        nulls = frozenset(
+            name for name, value in params.items() if value is None
+        )
+        statements = self.__dict__.setdefault("_statements", {})
+        if (key, nulls) not in statements:
+            statements[(key, nulls)] = build(nulls)
+        return statements[(key, nulls)]
+
+
+def equals_param(
+    column: ColumnElement, name: str, nulls: frozenset[str]
+) -> ColumnElement[bool]:
+    """`column = :name`, для None - `column IS NULL`, как у литерала."""
+
+    if name in nulls:
+        return column.is_(None)
+    return column == bindparam(name)
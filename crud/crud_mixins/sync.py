@@ -0,0 +1,87 @@
+from typing import Generic, Iterable, Optional, Sequence
+
+from sqlalchemy import Integer, any_, delete, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from constants.crud_types import ModelType
+from utilities.exception import SomeObjectsNotFound
+
+
+class SyncAsync(Generic[ModelType]):
+    async def sync_children(
+        self,
+        db: AsyncSession,
+        *,
+        parent_column: InstrumentedAttribute,
+        parent_id: int,
+        incoming: Sequence[dict],
+        existing_ids: Optional[Iterable[int]] = None,
+        commit: bool = True,
+    ) -> Sequence[ModelType]:
+        """
+        Приводит дочернюю коллекцию родителя к переданному состоянию.
+
+        Записи с `id` обновляются, без `id` создаются, а существующие
+        записи, которых нет во входных данных, удаляются. Удаление - один
+        DELETE, остальные строки сохраняются через `upsert_many`
+        (INSERT ... ON CONFLICT (id) DO UPDATE), поэтому миксин
+        используется вместе с UpsertAsync. Обновляются колонки,
+        переданные во всех обновляемых записях.
+        """
+
+        if existing_ids is None:
+            existing_ids = await self._get_children_ids(
+                db, parent_column=parent_column, parent_id=parent_id
+            )
+        existing_ids = set(existing_ids)
+
+        rows, incoming_ids = [], set()
+        for data in incoming:
+            row = {**data, parent_column.key: parent_id}
+            if row.get("id"):
+                incoming_ids.add(row["id"])
+            else:
+                row.pop("id", None)
+            rows.append(row)
+
+        if missing_ids := incoming_ids - existing_ids:
+            raise SomeObjectsNotFound(
+                f"{self.model.__name__} with ids "
+                f"{sorted(missing_ids)} not found"
+            )
+
+        if ids_to_delete := existing_ids - incoming_ids:
+            await db.execute(
+                delete(self.model).where(
+                    parent_column == parent_id,
+                    self.model.id
+                    == any_(literal(sorted(ids_to_delete), ARRAY(Integer))),
+                )
+            )
+        update_columns = set().union(*rows).intersection(
+            *(row.keys() for row in rows if row.get("id"))
+        )
+        update_columns.discard("id")
+        objects = await self.upsert_many(
+            db,
+            create_schemas=rows,
+            update_columns=update_columns,
+            match_columns=(parent_column.key,),
+            commit=False,
+        )
+        if commit:
+            await db.commit()
+        return objects
+
+    async def _get_children_ids(
+        self,
+        db: AsyncSession,
+        *,
+        parent_column: InstrumentedAttribute,
+        parent_id: int,
+    ) -> set[int]:
+        statement = select(self.model.id).where(parent_column == parent_id)
+        result = await db.execute(statement)
+        return set(result.scalars().all())
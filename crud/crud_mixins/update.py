@@ -1,4 +1,4 @@
-from typing import Generic, Union
+from typing import Generic, Sequence, Union
 
 from pydantic import BaseModel
 from sqlalchemy import update
@@ -31,3 +31,28 @@ class UpdateAsync(Generic[ModelType, UpdateSchemaType]):
             await db.commit()
             await db.refresh(obj)
         return obj
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        update_schemas: Sequence[Union[UpdateSchemaType, dict]],
+        commit: bool = True,
+    ) -> None:
+        """
+        Обновляет записи по первичному ключу одним executemany UPDATE.
+
+        Каждая запись должна содержать `id`.
+        """
+
+        if not update_schemas:
+            return
+        data = [
+            schema.model_dump(exclude_unset=True)
+            if isinstance(schema, BaseModel)
+            else schema
+            for schema in update_schemas
+        ]
+        await db.execute(update(self.model), data)
+        if commit:
+            await db.commit()
@@ -0,0 +1,61 @@
+from typing import Generic, Optional, Sequence, Union
+
+from pydantic import BaseModel
+from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.crud_types import CreateSchemaType, ModelType
+
+
+class UpsertAsync(Generic[ModelType, CreateSchemaType]):
+    async def upsert_many(
+        self,
+        db: AsyncSession,
+        *,
+        create_schemas: Sequence[Union[CreateSchemaType, dict]],
+        index_elements: Sequence[str] = ("id",),
+        update_columns: Optional[Sequence[str]] = None,
+        match_columns: Sequence[str] = (),
+        commit: bool = True,
+    ) -> Sequence[ModelType]:
+        """
+        INSERT ... ON CONFLICT DO UPDATE ... RETURNING для набора записей.
+
+        Если `update_columns` не переданы, обновляются все переданные
+        колонки, кроме `index_elements`. Существующая строка
+        обновляется, только если колонки `match_columns` у неё совпадают
+        с переданными, иначе она не меняется и не возвращается.
+        """
+
+        if not create_schemas:
+            return []
+        data = [
+            schema.model_dump(exclude_unset=True)
+            if isinstance(schema, BaseModel)
+            else schema
+            for schema in create_schemas
+        ]
+        if update_columns is None:
+            update_columns = set().union(*data).difference(index_elements)
+        stmt = insert(self.model)
+        where = None
+        if match_columns:
+            where = and_(
+                *(
+                    getattr(self.model, column) == stmt.excluded[column]
+                    for column in match_columns
+                )
+            )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: stmt.excluded[column] for column in update_columns},
+            where=where,
+        ).returning(self.model, sort_by_parameter_order=True)
+        res = await db.scalars(
+            stmt, data, execution_options={"populate_existing": True}
+        )
+        objects = res.all()
+        if commit:
+            await db.commit()
+        return objects
@@ -6,21 +6,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
 from crud.async_crud import BaseAsyncCRUD
-from crud.crud_mixins import BulkAsync
 from databases.queryset import QuerySet
 from models.city import City
 from models.user.education import Education
 from schemas.user.education import (
     EducationCreateDB,
     EducationResponse,
-    EducationUpdateDB,
     EducationUpdateSingle,
 )
 
 
 class CRUDEducation(
     BaseAsyncCRUD[Education, EducationCreateDB, EducationResponse],
-    BulkAsync[Education, EducationCreateDB, EducationUpdateDB],
 ):
     async def get_multi_by_user_id(
         self,
@@ -46,6 +43,13 @@ class CRUDEducation(
         result = await db.execute(query)
         return result.unique().scalars().all()
 
+    async def get_ids_by_user_id(
+        self, db: AsyncSession, *, user_id: int
+    ) -> set[int]:
+        statement = select(self.model.id).where(self.model.user_id == user_id)
+        result = await db.execute(statement)
+        return set(result.scalars().all())
+
     async def get_multi_by_ids(
         self,
         db: AsyncSession,
@@ -95,28 +99,6 @@ class CRUDEducation(
             await db.commit()
         return obj
 
-    async def create_bulk(
-        self,
-        db: AsyncSession,
-        *,
-        create_schemas: List[EducationCreateDB],
-        commit: bool = True,
-    ) -> List[Education]:
-        data = [e.model_dump() for e in create_schemas]
-        stmt = (
-            insert(self.model)
-            .values(data)
-            .returning(self.model)
-            .options(
-                selectinload(self.model.certificates),
-            )
-        )
-        res = await db.execute(stmt)
-        obj = res.scalars().all()
-        if commit:
-            await db.commit()
-        return obj
-
     async def get_by_id(
         self,
         db: AsyncSession,
@@ -1,24 +1,44 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterable, List, Mapping, Optional
 
-from sqlalchemy import func, insert, not_, or_, select
+from sqlalchemy import CTE, delete, exists, func, literal, not_, or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload, with_loader_criteria
+from sqlalchemy.sql.selectable import Select
 
 from api.filters.event import EventFilters
 from constants.i18n import Languages
 from crud.async_crud import BaseAsyncCRUD
+from crud.crud_mixins import ArchiveAsync
 from models import Event
 from models.city import City
-from models.m2m import EventParticipants
+from models.m2m import (
+    EventOrganizers,
+    EventParticipants,
+    EventsOrganisations,
+    EventSpeakers,
+    EventSpecializations,
+)
 from models.organisation.organisation import Organisation
 from models.user.user import User
 from models.user.user_specialization import UserSpecialization
 from schemas.event import EventCreateDB, EventUpdateDB
 from utilities.i18n import detect_language
 
+EVENT_MEMBERS = {
+    "organizers": (EventOrganizers, "user_id"),
+    "speakers": (EventSpeakers, "user_id"),
+    "specializations": (EventSpecializations, "specialization_id"),
+    "organisations": (EventsOrganisations, "organisation_id"),
+}
+
+
+class CRUDEvent(
+    BaseAsyncCRUD[Event, EventCreateDB, EventUpdateDB], ArchiveAsync[Event]
+):
+    owner_field = "creator_id"
 
-class CRUDEvent(BaseAsyncCRUD[Event, EventCreateDB, EventUpdateDB]):
     def __init__(self, model):
         super().__init__(model)
         self.common_options = (
@@ -244,5 +264,137 @@ class CRUDEvent(BaseAsyncCRUD[Event, EventCreateDB, EventUpdateDB]):
             await db.commit()
         return res.scalars().first()
 
+    async def add_members(
+        self,
+        db: AsyncSession,
+        *,
+        event_id: int,
+        members: Mapping[str, Iterable[int]],
+    ) -> None:
+        """
+        Добавляет строки связей мероприятия executemany-вставками,
+        по одной на каждую таблицу, без загрузки связанных объектов.
+
+        Ключи `members` - имена связей из `EVENT_MEMBERS`.
+        """
+
+        for relation, ids in members.items():
+            model, column = EVENT_MEMBERS[relation]
+            if ids:
+                await db.execute(
+                    insert(model),
+                    [{"event_id": event_id, column: obj_id} for obj_id in ids],
+                )
+
+    async def set_members(
+        self,
+        db: AsyncSession,
+        *,
+        event_id: int,
+        members: Mapping[str, Iterable[int]],
+    ) -> None:
+        """Заменяет переданные связи мероприятия новым набором id."""
+
+        for relation in members:
+            model, _ = EVENT_MEMBERS[relation]
+            await db.execute(delete(model).where(model.event_id == event_id))
+        await self.add_members(db, event_id=event_id, members=members)
+
+    async def is_organizer(
+        self, db: AsyncSession, *, event_id: int, user_id: int
+    ) -> bool:
+        return await db.scalar(
+            select(
+                exists().where(
+                    EventOrganizers.event_id == event_id,
+                    EventOrganizers.user_id == user_id,
+                )
+            )
+        )
+
+    def get_attendable(
+        self, event_id: int, archived: bool = False
+    ) -> Select:
+        """
+        Мероприятие, на которое можно зарегистрироваться: опубликованное
+        и, если не `archived`, не архивное.
+        """
+
+        statement = select(self.model.id).where(
+            self.model.id == event_id, self.model.is_draft.is_(False)
+        )
+        if not archived:
+            statement = statement.where(self.model.is_archived.is_(False))
+        return statement
+
+    async def is_attendable(
+        self, db: AsyncSession, *, event_id: int, archived: bool = False
+    ) -> bool:
+        return await db.scalar(
+            select(self.get_attendable(event_id, archived).exists())
+        )
+
+    async def add_participant(
+        self,
+        db: AsyncSession,
+        *,
+        event_id: int,
+        user_id: int,
+        status_id: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Регистрирует пользователя на мероприятие одним запросом.
+
+        Возвращает id автора мероприятия или None, если мероприятия нет,
+        оно в черновике или архиве, или пользователь уже
+        зарегистрирован. При превышении
+        max_participants триггер счётчика нарушает event_capacity_check
+        и запрос падает с IntegrityError.
+        """
+
+        inserted = (
+            insert(EventParticipants)
+            .from_select(
+                ["event_id", "user_id", "status_id"],
+                self.get_attendable(event_id).add_columns(
+                    literal(user_id), literal(status_id)
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["event_id", "user_id"])
+            .returning(EventParticipants.event_id)
+            .cte("inserted")
+        )
+        return await self._get_creator_id(db, inserted)
+
+    async def remove_participant(
+        self, db: AsyncSession, *, event_id: int, user_id: int
+    ) -> Optional[int]:
+        """
+        Отменяет регистрацию, возвращает id автора мероприятия или
+        None, если регистрации не было или мероприятие в черновике.
+        """
+
+        deleted = (
+            delete(EventParticipants)
+            .where(
+                EventParticipants.event_id.in_(
+                    self.get_attendable(event_id, archived=True)
+                ),
+                EventParticipants.user_id == user_id,
+            )
+            .returning(EventParticipants.event_id)
+            .cte("deleted")
+        )
+        return await self._get_creator_id(db, deleted)
+
+    async def _get_creator_id(
+        self, db: AsyncSession, changed: CTE
+    ) -> Optional[int]:
+        statement = select(self.model.creator_id).join(
+            changed, changed.c.event_id == self.model.id
+        )
+        result = await db.execute(statement)
+        return result.scalar_one_or_none()
+
 
 crud_event = CRUDEvent(Event)
@@ -0,0 +1,103 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import case, desc, func, literal, nullslast, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.event_recommendation import (
+    ATTENDED_SPECIALIZATION_WEIGHT,
+    CITY_WEIGHT,
+    FAVORITE_SPECIALIZATION_WEIGHT,
+    SPECIALIZATION_WEIGHT,
+    TIMEZONE_WEIGHT,
+)
+from crud.crud_mixins import BaseCRUD
+from models import Event, Favorite, User, UserSpecialization
+from models.event_participants import EventParticipants
+from models.m2m import EventSpecializations, UsersSpecializations
+
+
+class CRUDEventRecommendation(BaseCRUD[Event]):
+    async def get_ranked_ids(
+        self, db: AsyncSession, *, user_id: int, limit: int
+    ) -> list[int]:
+        """
+        Возвращает id предстоящих мероприятий для пользователя
+        в порядке убывания оценки.
+
+        Интересы пользователя - его специализации и специализации
+        мероприятий, которые он посещал или добавил в избранное, каждая
+        со своим весом. К совпадению интересов добавляются бонусы за
+        тот же город и часовой пояс. Уже посещаемые и собственные
+        мероприятия исключаются.
+        """
+
+        interests = union_all(
+            select(
+                UsersSpecializations.specialization_id,
+                literal(SPECIALIZATION_WEIGHT).label("weight"),
+            )
+            .join(
+                UserSpecialization,
+                UserSpecialization.id
+                == UsersSpecializations.user_specialization_id,
+            )
+            .where(UserSpecialization.user_id == user_id),
+            select(
+                EventSpecializations.specialization_id,
+                literal(ATTENDED_SPECIALIZATION_WEIGHT),
+            )
+            .join(
+                EventParticipants,
+                EventParticipants.event_id == EventSpecializations.event_id,
+            )
+            .where(EventParticipants.user_id == user_id),
+            select(
+                EventSpecializations.specialization_id,
+                literal(FAVORITE_SPECIALIZATION_WEIGHT),
+            )
+            .join(Favorite, Favorite.event_id == EventSpecializations.event_id)
+            .where(Favorite.user_id == user_id),
+        ).subquery()
+        affinity = (
+            select(
+                EventSpecializations.event_id,
+                func.sum(interests.c.weight).label("affinity"),
+            )
+            .join(
+                interests,
+                interests.c.specialization_id
+                == EventSpecializations.specialization_id,
+            )
+            .group_by(EventSpecializations.event_id)
+            .subquery()
+        )
+        attended = select(EventParticipants.event_id).where(
+            EventParticipants.user_id == user_id
+        )
+        score = (
+            func.coalesce(affinity.c.affinity, 0)
+            + case((self.model.city_id == User.city_id, CITY_WEIGHT), else_=0)
+            + case(
+                (self.model.timezone_id == User.timezone_id, TIMEZONE_WEIGHT),
+                else_=0,
+            )
+        )
+        statement = (
+            select(self.model.id)
+            .outerjoin(affinity, affinity.c.event_id == self.model.id)
+            .join(User, User.id == user_id)
+            .where(
+                self.model.end_datetime > datetime.now(tz=UTC),
+                self.model.is_draft.is_(False),
+                self.model.is_archived.is_(False),
+                self.model.creator_id != user_id,
+                self.model.id.not_in(attended),
+            )
+            .order_by(desc(score), nullslast(self.model.start_datetime))
+            .limit(limit)
+        )
+        result = await db.execute(statement)
+        return list(result.scalars().all())
+
+
+crud_event_recommendation = CRUDEventRecommendation(Event)
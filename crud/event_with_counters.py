@@ -1,10 +1,14 @@
 from datetime import datetime, UTC
-from typing import Dict, List, Optional, Type
+from functools import partial
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Type
 
 from sqlalchemy import (
+    ColumnElement,
     Integer,
     RowMapping,
+    Subquery,
     and_,
+    bindparam,
     cast,
     distinct,
     func,
@@ -13,6 +17,7 @@ from sqlalchemy import (
     literal,
     case,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import (
     aliased,
@@ -27,8 +32,14 @@ from api.filters.event import (
     EventFilters,
     EventParticipantsFilter,
 )
+from constants.event_participants import PARTICIPANTS_EXPORT_BATCH_SIZE
 from constants.i18n import Languages
-from crud.crud_mixins import BaseCRUD, ReadAsync
+from crud.crud_mixins import (
+    BaseCRUD,
+    ReadAsync,
+    StatementCacheMixin,
+    equals_param,
+)
 from crud.options import specialisations, city_and_country
 from models import (
     City,
@@ -38,10 +49,8 @@ from models import (
     Organisation,
     User,
     UserSpecialization,
-    Specialization,
 )
 from models.event_participants import EventParticipants
-from models.m2m import EventSpecializations
 from models.country import Country
 from models.timezone import Timezone
 from schemas.endpoints.pagination import DefaultPagination
@@ -49,7 +58,9 @@ from utilities.exception import QuerySet
 from utilities.paginated_response import response_with_count
 
 
-class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
+class CRUDEventWithCounters(
+    BaseCRUD[Event], ReadAsync[Event], StatementCacheMixin
+):
     def __init__(self, model: Type[Event]) -> None:
         super().__init__(model)
         self.common_options = (
@@ -84,14 +95,25 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
         author_id: Optional[int] = None,
         current_user_ip: Optional[str] = None,
     ) -> Optional[Dict]:
-        subquery = await self._get_subquery_for_event_view(
-            author_id, current_user_ip
+        params = {
+            "obj_id": obj_id,
+            "current_user_id": author_id,
+            "current_user_ip": current_user_ip,
+        }
+        statement = self.get_statement(
+            "get_by_id", self._build_get_by_id, params
         )
-        favorite_subquery = await self._get_subquery_for_favorite_event(
-            event_id=obj_id, current_user_id=author_id
+        result = await db.execute(statement, params)
+        return result.mappings().first()
+
+    def _build_get_by_id(self, nulls: frozenset[str]) -> Select:
+        obj_id = bindparam("obj_id")
+        subquery = self._get_subquery_for_event_view(nulls)
+        favorite_subquery = self._get_subquery_for_favorite_event(
+            obj_id, nulls
         )
-        attended_subquery = await self._get_subquery_for_attended_event(
-            event_id=obj_id, current_user_id=author_id
+        attended_subquery = self._get_subquery_for_attended_event(
+            obj_id, nulls
         )
         all_event_views = aliased(EventView)
         statement = (
@@ -146,17 +168,14 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
                 attended_subquery.c.is_attended,
             )
         )
-        if author_id:
-            statement = statement.where(
+        if "current_user_id" not in nulls:
+            return statement.where(
                 or_(
-                    self.model.creator_id == author_id,
+                    self.model.creator_id == bindparam("current_user_id"),
                     self.model.is_draft.is_(False),
                 )
             )
-        else:
-            statement = statement.where(self.model.is_draft.is_(False))
-        result = await db.execute(statement)
-        return result.mappings().first()
+        return statement.where(self.model.is_draft.is_(False))
 
     async def get_multi(
         self,
@@ -169,18 +188,51 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
         current_user_ip: Optional[str] = None,
         filters: Optional[EventFilters] = None,
         attended: Optional[bool] = None,
+        ids: Optional[Sequence[int]] = None,
     ) -> Optional[Dict]:
-        subquery = await self._get_subquery_for_event_view(
-            current_user_id, current_user_ip
-        )
-        favorite_subquery = await self._get_subquery_for_favorite_event(
-            event_id=self.model.id, current_user_id=current_user_id
+        params = {
+            "author_id": author_id or None,
+            "current_user_id": current_user_id,
+            "current_user_ip": current_user_ip,
+            "now": datetime.now(tz=UTC),
+        }
+        statement = self.get_statement(
+            ("get_multi", favorite, bool(attended)),
+            partial(
+                self._build_get_multi,
+                favorite=favorite,
+                attended=bool(attended),
+            ),
+            params,
+        ).options(
+            with_loader_criteria(
+                City.translation_model,
+                City.translation_model.locale == locale,
+            ),
         )
-        user_view_subquery = await self._get_subquery_for_user_view(
-            current_user_id=current_user_id,
+        if filters:
+            statement = await filters.filter(statement)
+        if ids is not None:
+            statement = statement.where(self.model.id.in_(ids)).order_by(
+                func.array_position(
+                    literal(list(ids), ARRAY(Integer)), self.model.id
+                )
+            )
+        statement = statement.offset(pagination.skip).limit(pagination.limit)
+        result = await db.execute(statement, params)
+        rows = result.unique().mappings().all()
+        return await response_with_count(pagination, rows)
+
+    def _build_get_multi(
+        self, nulls: frozenset[str], favorite: bool, attended: bool
+    ) -> Select:
+        subquery = self._get_subquery_for_event_view(nulls)
+        favorite_subquery = self._get_subquery_for_favorite_event(
+            self.model.id, nulls
         )
-        attended_subquery = await self._get_subquery_for_attended_event(
-            event_id=self.model.id, current_user_id=current_user_id
+        user_view_subquery = self._get_subquery_for_user_view(nulls)
+        attended_subquery = self._get_subquery_for_attended_event(
+            self.model.id, nulls
         )
         all_event_views = aliased(EventView)
         statement = (
@@ -222,21 +274,14 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
             .outerjoin(City, City.id == self.model.city_id)
             .outerjoin(City.translation_model)
             .outerjoin(Country, City.country_id == Country.id)
-            .outerjoin(
-                EventSpecializations,
-                EventSpecializations.event_id == self.model.id,
-            )
-            .outerjoin(
-                Specialization,
-                Specialization.id == EventSpecializations.specialization_id,
-            )
             .outerjoin(
                 user_view_subquery,
                 user_view_subquery.c.event_id == self.model.id,
             )
             .where(
-                self.model.end_datetime > datetime.now(tz=UTC),
+                self.model.end_datetime > bindparam("now"),
                 self.model.is_archived.is_(False),
+                self.model.is_draft.is_(False),
             )
             .options(
                 contains_eager(self.model.event_views, alias=subquery),
@@ -244,10 +289,6 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
                 *self.user_options,
                 *self.contact_persons_options,
                 *self.organisations_options,
-                with_loader_criteria(
-                    City.translation_model,
-                    City.translation_model.locale == locale,
-                ),
             )
             .group_by(
                 self.model.id,
@@ -260,36 +301,23 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
                 user_view_subquery.c.is_viewed,
                 attended_subquery.c.is_attended,
             )
-            .offset(pagination.skip)
-            .limit(pagination.limit)
         )
-
-        if author_id:
+        if "author_id" not in nulls:
             statement = statement.where(
-                self.model.creator_id == author_id
-            ).where(self.model.is_draft.is_(False))
-        else:
-            statement = statement.where(self.model.is_draft.is_(False))
+                self.model.creator_id == bindparam("author_id")
+            )
         if favorite:
             statement = statement.where(
                 and_(
                     Favorite.event_id == self.model.id,
-                    Favorite.user_id == current_user_id,
+                    equals_param(Favorite.user_id, "current_user_id", nulls),
                 )
             )
         if attended:
             statement = statement.where(
                 attended_subquery.c.is_attended.is_(True),
             )
-        if filters:
-            statement = await filters.filter(statement)
-            if filters.specializations and filters.specializations.id__in:
-                statement = statement.where(
-                    Specialization.id.in_(filters.specializations.id__in)
-                )
-        result = await db.execute(statement)
-        rows = result.unique().mappings().all()
-        return await response_with_count(pagination, rows)
+        return statement
 
     async def get_multi_for_author(
         self,
@@ -299,11 +327,29 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
         filters: Optional[AuthorEventFilters] = None,
         author_id: Optional[int] = None,
     ) -> Optional[Dict]:
-        subquery = await self._get_subquery_for_event_view(
-            current_user_id=author_id
+        params = {
+            "current_user_id": author_id,
+            "current_user_ip": None,
+        }
+        statement = self.get_statement(
+            "get_multi_for_author", self._build_get_multi_for_author, params
+        ).options(
+            with_loader_criteria(
+                City.translation_model,
+                City.translation_model.locale == locale,
+            ),
         )
+        if filters:
+            statement = await filters.filter_query(statement)
+        statement = statement.offset(pagination.skip).limit(pagination.limit)
+        result = await db.execute(statement, params)
+        rows = result.unique().mappings().all()
+        return await response_with_count(pagination, rows)
+
+    def _build_get_multi_for_author(self, nulls: frozenset[str]) -> Select:
+        subquery = self._get_subquery_for_event_view(nulls)
         all_event_views = aliased(EventView)
-        statement = (
+        return (
             select(
                 self.model,
                 func.count(distinct(EventParticipants.user_id)).label(
@@ -326,7 +372,7 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
             )
             .outerjoin(subquery, subquery.c.event_id == self.model.id)
             .where(
-                self.model.creator_id == author_id,
+                equals_param(self.model.creator_id, "current_user_id", nulls),
             )
             .options(
                 contains_eager(self.model.event_views, alias=subquery),
@@ -334,10 +380,6 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
                 *self.user_options,
                 *self.contact_persons_options,
                 *self.organisations_options,
-                with_loader_criteria(
-                    City.translation_model,
-                    City.translation_model.locale == locale,
-                ),
             )
             .group_by(
                 self.model.id,
@@ -347,15 +389,7 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
                 subquery.c.ip_address,
                 subquery.c.user_id,
             )
-            .offset(pagination.skip)
-            .limit(pagination.limit)
         )
-        if filters:
-            statement = await filters.filter_query(statement)
-
-        result = await db.execute(statement)
-        rows = result.unique().mappings().all()
-        return await response_with_count(pagination, rows)
 
     async def get_multi_by_ids(
         self,
@@ -366,10 +400,24 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
     ) -> Optional[QuerySet[RowMapping]]:
         if not ids:
             return []
-        subquery = await self._get_subquery_for_event_view(
-            current_user_id, current_user_ip
+        params = {
+            "ids": list(ids),
+            "current_user_id": current_user_id,
+            "current_user_ip": current_user_ip,
+            "now": datetime.now(tz=UTC),
+        }
+        statement = self.get_statement(
+            "get_multi_by_ids", self._build_get_multi_by_ids, params
         )
-        statement = (
+        result = await db.execute(statement, params)
+        objects = result.unique().mappings().all()
+        result = QuerySet(objects)
+        result.model = self.model
+        return result
+
+    def _build_get_multi_by_ids(self, nulls: frozenset[str]) -> Select:
+        subquery = self._get_subquery_for_event_view(nulls)
+        return (
             select(
                 self.model,
                 func.count(distinct(EventParticipants.user_id)).label(
@@ -387,9 +435,9 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
             )
             .outerjoin(subquery, subquery.c.event_id == self.model.id)
             .where(
-                self.model.id.in_(ids),
+                self.model.id.in_(bindparam("ids", expanding=True)),
                 self.model.is_draft.is_(False),
-                self.model.end_datetime > datetime.now(tz=UTC),
+                self.model.end_datetime > bindparam("now"),
             )
             .options(
                 contains_eager(self.model.event_views, alias=subquery),
@@ -403,11 +451,6 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
                 subquery.c.user_id,
             )
         )
-        result = await db.execute(statement)
-        objects = result.unique().mappings().all()
-        result = QuerySet(objects)
-        result.model = self.model
-        return result
 
     async def get_multi_participants_by_event_id(
         self,
@@ -421,9 +464,9 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
                 User.first_name,
                 User.second_name,
                 User.username,
-                User.email,
                 User.uid,
                 User.photo,
+                User.image_variants,
                 func.count().over().label("total_count"),
             )
             .join(EventParticipants, EventParticipants.user_id == User.id)
@@ -437,36 +480,121 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
         rows = result.unique().mappings().all()
         return await response_with_count(pagination, rows)
 
-    async def _get_subquery_for_event_view(
+    async def get_participants_page(
         self,
-        current_user_id: Optional[int] = None,
-        current_user_ip: Optional[str] = None,
+        db: AsyncSession,
+        *,
+        event_id: int,
+        limit: int,
+        after_id: Optional[int] = None,
+        filters: Optional[EventParticipantsFilter] = None,
+    ) -> Sequence[RowMapping]:
+        """Страница участников по ключу user_id, без OFFSET."""
+
+        statement = await self._get_participants_statement(
+            event_id=event_id, filters=filters
+        )
+        if after_id is not None:
+            statement = statement.where(EventParticipants.user_id > after_id)
+        result = await db.execute(statement.limit(limit))
+        return result.mappings().all()
+
+    async def count_participants(
+        self,
+        db: AsyncSession,
+        *,
+        event_id: int,
+        filters: Optional[EventParticipantsFilter] = None,
+    ) -> int:
+        """
+        Число участников мероприятия.
+
+        Без поиска считается только по индексу (event_id, user_id),
+        таблица пользователей подключается лишь для фильтра.
+        """
+
+        statement = (
+            select(func.count())
+            .select_from(EventParticipants)
+            .where(EventParticipants.event_id == event_id)
+        )
+        if filters and filters.search:
+            statement = await filters.filter(
+                statement.join(User, User.id == EventParticipants.user_id)
+            )
+        return await db.scalar(statement)
+
+    async def stream_participants(
+        self,
+        db: AsyncSession,
+        *,
+        event_id: int,
+        filters: Optional[EventParticipantsFilter] = None,
+    ) -> AsyncIterator[RowMapping]:
+        """Отдаёт всех участников пачками серверного курсора."""
+
+        statement = await self._get_participants_statement(
+            event_id=event_id, filters=filters
+        )
+        result = await db.stream(
+            statement.execution_options(
+                yield_per=PARTICIPANTS_EXPORT_BATCH_SIZE
+            )
+        )
+        async for row in result.mappings():
+            yield row
+
+    async def _get_participants_statement(
+        self,
+        event_id: int,
+        filters: Optional[EventParticipantsFilter] = None,
     ) -> Select:
+        statement = (
+            select(
+                EventParticipants.user_id,
+                User.uid,
+                User.first_name,
+                User.second_name,
+                User.username,
+                User.photo,
+                User.image_variants,
+            )
+            .join(User, User.id == EventParticipants.user_id)
+            .where(EventParticipants.event_id == event_id)
+            .order_by(EventParticipants.user_id)
+        )
+        if filters:
+            statement = await filters.filter(statement)
+        return statement
+
+    @staticmethod
+    def _get_subquery_for_event_view(nulls: frozenset[str]) -> Subquery:
         return (
             select(EventView).where(
                 or_(
-                    EventView.user_id == current_user_id,
+                    equals_param(EventView.user_id, "current_user_id", nulls),
                     and_(
                         EventView.user_id.is_(None),
-                        EventView.ip_address == current_user_ip,
+                        equals_param(
+                            EventView.ip_address, "current_user_ip", nulls
+                        ),
                     ),
                 )
             )
         ).alias("filtered_event_view")
 
-    async def _get_subquery_for_favorite_event(
-        self,
-        event_id: int,
-        current_user_id: Optional[int] = None,
-    ) -> Select:
-        if current_user_id:
+    @staticmethod
+    def _get_subquery_for_favorite_event(
+        event_id: ColumnElement[int], nulls: frozenset[str]
+    ) -> Subquery:
+        if "current_user_id" not in nulls:
             favorite_subquery = (
                 select(
                     Favorite.event_id,
                     literal(True).label("is_favorite"),
                 )
                 .where(
-                    Favorite.user_id == current_user_id,
+                    Favorite.user_id == bindparam("current_user_id"),
                     Favorite.event_id == event_id,
                 )
                 .subquery()
@@ -509,13 +637,11 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
         return result.fetchone()
 
     @staticmethod
-    async def _get_subquery_for_user_view(
-        current_user_id: Optional[int] = None,
-    ) -> Select:
-        if current_user_id:
+    def _get_subquery_for_user_view(nulls: frozenset[str]) -> Subquery:
+        if "current_user_id" not in nulls:
             return (
                 select(EventView.event_id, literal(True).label("is_viewed"))
-                .where(EventView.user_id == current_user_id)
+                .where(EventView.user_id == bindparam("current_user_id"))
                 .subquery()
             )
 
@@ -524,19 +650,18 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
             literal(False).label("is_viewed"),
         ).subquery()
 
-    async def _get_subquery_for_attended_event(
-        self,
-        event_id: int,
-        current_user_id: Optional[int] = None,
-    ) -> Select:
-        if current_user_id:
+    @staticmethod
+    def _get_subquery_for_attended_event(
+        event_id: ColumnElement[int], nulls: frozenset[str]
+    ) -> Subquery:
+        if "current_user_id" not in nulls:
             attended_subquery = (
                 select(
                     EventParticipants.event_id,
                     literal(True).label("is_attended"),
                 )
                 .where(
-                    EventParticipants.user_id == current_user_id,
+                    EventParticipants.user_id == bindparam("current_user_id"),
                     EventParticipants.event_id == event_id,
                 )
                 .subquery()
@@ -548,5 +673,4 @@ class CRUDEventWithCounters(BaseCRUD[Event], ReadAsync[Event]):
             ).subquery()
         return attended_subquery
 
-
 crud_ewc = CRUDEventWithCounters(Event)
@@ -0,0 +1,57 @@
+from typing import Any, Iterable, Mapping
+
+from sqlalchemy import String, cast, literal, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from utilities.exception import SomeObjectsNotFoundError
+
+
+async def check_relations(
+    db: AsyncSession,
+    checks: Mapping[str, tuple[InstrumentedAttribute, Iterable[Any]]],
+) -> dict[str, dict[str, int]]:
+    """
+    Проверяет существование связанных объектов одним запросом.
+
+    `checks` сопоставляет имя связи с колонкой поиска (`id` или `uid`)
+    и искомыми значениями. Для каждой связи возвращается словарь
+    `str(значение) -> id`. Если чего-то не хватает, все отсутствующие
+    значения перечисляются в одном SomeObjectsNotFoundError.
+    """
+
+    expected = {
+        name: {str(value) for value in values}
+        for name, (_, values) in checks.items()
+    }
+    statements = [
+        select(
+            literal(name).label("relation"),
+            cast(column, String).label("key"),
+            column.class_.id.label("id"),
+        ).where(column.in_(set(values)))
+        for name, (column, values) in checks.items()
+        if expected[name]
+    ]
+    found = {name: {} for name in checks}
+    if not statements:
+        return found
+
+    result = await db.execute(union_all(*statements))
+    for relation, key, obj_id in result.all():
+        found[relation][key] = obj_id
+
+    missing = {
+        name: sorted(keys - found[name].keys())
+        for name, keys in expected.items()
+        if keys - found[name].keys()
+    }
+    if missing:
+        raise SomeObjectsNotFoundError(
+            "; ".join(
+                f"{name} with ids {keys} not found"
+                for name, keys in missing.items()
+            )
+        )
+    return found
@@ -1,13 +1,29 @@
 from datetime import datetime, UTC
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
 
-from sqlalchemy import and_, distinct, func, select, or_
+from sqlalchemy import (
+    Integer,
+    and_,
+    any_,
+    delete,
+    distinct,
+    func,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, with_loader_criteria, contains_eager
+from sqlalchemy.orm import (
+    joinedload,
+    selectinload,
+    with_loader_criteria,
+)
 from sqlalchemy.sql.selectable import Select
 
 from constants.i18n import Languages
-from constants.crud_types import CreateSchemaType
+from constants.crud_types import CreateSchemaType, ModelType
+from constants.favorite import FavoriteTarget
 from crud.crud_mixins import BaseCRUD, CreateAsync, ReadAsync
 from models import (
     City,
@@ -32,6 +48,172 @@ class CRUDFavorite(
     CreateAsync[Favorite, CreateSchemaType],
     ReadAsync[Favorite],
 ):
+    def __init__(self, model: Type[ModelType]) -> None:
+        super().__init__(model)
+        # Колонка избранного, модель цели и условия, при которых
+        # объект можно добавить в избранное.
+        self.targets = {
+            FavoriteTarget.event: (
+                self.model.event_id,
+                Event,
+                (Event.is_draft.is_(False),),
+            ),
+            FavoriteTarget.job: (self.model.job_id, Job, ()),
+            FavoriteTarget.organisation: (
+                self.model.organisation_id,
+                Organisation,
+                (),
+            ),
+            FavoriteTarget.user: (self.model.favorite_user_id, User, ()),
+        }
+        self.target_options = {
+            FavoriteTarget.organisation: (
+                selectinload(Organisation.translations),
+            ),
+        }
+
+    async def get_target_ids(
+        self,
+        db: AsyncSession,
+        *,
+        target: FavoriteTarget,
+        ids: Iterable[int],
+    ) -> set[int]:
+        _, target_model, conditions = self.targets[target]
+        statement = select(target_model.id).where(
+            target_model.id == any_(literal(list(ids), ARRAY(Integer))),
+            *conditions,
+        )
+        result = await db.execute(statement)
+        return set(result.scalars().all())
+
+    async def get_favorite_ids(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        target: FavoriteTarget,
+        ids: Iterable[int],
+    ) -> set[int]:
+        """Проверяет наличие в избранном по индексу (user_id, цель)."""
+
+        column = self.targets[target][0]
+        statement = select(column).where(
+            self.model.user_id == user_id,
+            column == any_(literal(list(ids), ARRAY(Integer))),
+        )
+        result = await db.execute(statement)
+        return set(result.scalars().all())
+
+    async def add_many(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        target: FavoriteTarget,
+        ids: Iterable[int],
+        commit: bool = True,
+    ) -> list[int]:
+        """Добавляет объекты в избранное и возвращает id новых записей."""
+
+        column = self.targets[target][0]
+        statement = (
+            insert(self.model)
+            .values([{"user_id": user_id, column.key: i} for i in ids])
+            .on_conflict_do_nothing(
+                index_elements=[self.model.user_id, column]
+            )
+            .returning(column)
+        )
+        result = await db.execute(statement)
+        added_ids = list(result.scalars().all())
+        if commit:
+            await db.commit()
+        return added_ids
+
+    async def get_totals(
+        self, db: AsyncSession, *, user_id: int
+    ) -> dict[FavoriteTarget, int]:
+        """Считает избранное пользователя по всем типам одним запросом."""
+
+        statement = select(
+            *(
+                func.count(column).label(target)
+                for target, (column, _, _) in self.targets.items()
+            )
+        ).where(self.model.user_id == user_id)
+        result = await db.execute(statement)
+        return {
+            FavoriteTarget(target): count
+            for target, count in result.mappings().one().items()
+        }
+
+    async def get_feed_page(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        limit: int,
+        after_id: Optional[int] = None,
+    ) -> Sequence[Favorite]:
+        """Страница избранного от новых к старым по ключу id."""
+
+        statement = (
+            select(self.model)
+            .where(self.model.user_id == user_id)
+            .order_by(self.model.id.desc())
+            .limit(limit)
+        )
+        if after_id is not None:
+            statement = statement.where(self.model.id < after_id)
+        result = await db.execute(statement)
+        return result.scalars().all()
+
+    async def get_targets(
+        self,
+        db: AsyncSession,
+        *,
+        target: FavoriteTarget,
+        ids: Iterable[int],
+    ) -> dict[int, Any]:
+        """Объекты цели по id с теми же условиями, что и при добавлении."""
+
+        _, target_model, conditions = self.targets[target]
+        statement = (
+            select(target_model)
+            .where(
+                target_model.id == any_(literal(list(ids), ARRAY(Integer))),
+                *conditions,
+            )
+            .options(*self.target_options.get(target, ()))
+        )
+        result = await db.execute(statement)
+        return {obj.id: obj for obj in result.scalars().all()}
+
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        target: FavoriteTarget,
+        ids: Iterable[int],
+        commit: bool = True,
+    ) -> list[int]:
+        column = self.targets[target][0]
+        statement = (
+            delete(self.model)
+            .where(
+                self.model.user_id == user_id,
+                column == any_(literal(list(ids), ARRAY(Integer))),
+            )
+            .returning(column)
+        )
+        result = await db.execute(statement)
+        removed_ids = list(result.scalars().all())
+        if commit:
+            await db.commit()
+        return removed_ids
+
     async def get_organizations_by_user_id(
         self,
         db: AsyncSession,
@@ -142,67 +324,87 @@ class CRUDFavorite(
         skip: int = 0,
         limit: int = 20,
     ) -> Dict:
-        subquery = await self._get_subquery_for_event_view(
-            user_id, current_user_ip
+        """
+        Избранные события со счётчиками из скалярных подзапросов.
+
+        Одна строка на событие: участники и просмотры не джойнятся,
+        а total_count считается один раз index-only сканированием
+        ix_favorites_user_id_id и ix_event_published_id_end_datetime.
+        """
+
+        conditions = (
+            self.model.user_id == user_id,
+            Event.is_draft.is_(False),
+            Event.is_archived.is_(False),
+            Event.end_datetime > datetime.now(tz=UTC),
+        )
+        participants_count = (
+            select(func.count())
+            .where(EventParticipants.event_id == Event.id)
+            .scalar_subquery()
+        )
+        views = (
+            select(func.count())
+            .where(EventView.event_id == Event.id)
+            .scalar_subquery()
+        )
+        participants_views = (
+            select(EventView.participants_views)
+            .where(
+                EventView.event_id == Event.id,
+                or_(
+                    EventView.user_id == user_id,
+                    and_(
+                        EventView.user_id.is_(None),
+                        EventView.ip_address == current_user_ip,
+                    ),
+                ),
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+        total_count = (
+            select(func.count())
+            .select_from(self.model)
+            .join(Event, Event.id == self.model.event_id)
+            .where(*conditions)
+            .scalar_subquery()
         )
         statement = (
             select(
                 Event,
-                func.count(EventParticipants.user_id).label(
-                    "participants_count"
-                ),
-                func.count(distinct(EventView.id)).label("views"),
+                participants_count.label("participants_count"),
+                views.label("views"),
                 (
-                    func.count(EventParticipants.user_id).label(
-                        "participants_count"
-                    )
-                    - func.coalesce(subquery.c.participants_views, 0)
+                    participants_count
+                    - func.coalesce(participants_views, 0)
                 ).label("new_participants_count"),
-                func.count(self.model.id).over().label("total_count"),
+                total_count.label("total_count"),
+                literal(True).label("is_favorite"),
             )
             .join(self.model, Event.id == self.model.event_id)
-            .filter(
-                self.model.user_id == user_id,
-            )
-            .outerjoin(EventView, EventView.event_id == Event.id)
-            .outerjoin(
-                EventParticipants, EventParticipants.event_id == self.model.id
-            )
-            .outerjoin(subquery, subquery.c.event_id == Event.id)
-            .where(
-                Event.is_draft.is_(False),
-                Event.is_archived.is_(False),
-                Event.end_datetime > datetime.now(tz=UTC),
-            )
+            .where(*conditions)
             .options(
-                contains_eager(Event.event_views, alias=subquery),
-                joinedload(Event.specializations),
+                selectinload(Event.specializations),
                 joinedload(Event.city).joinedload(City.country),
                 joinedload(Event.timezone),
-                joinedload(Event.organizers)
+                selectinload(Event.organizers)
                 .joinedload(User.specialization)
-                .joinedload(UserSpecialization.specializations),
-                joinedload(Event.speakers)
+                .selectinload(UserSpecialization.specializations),
+                selectinload(Event.speakers)
                 .joinedload(User.specialization)
-                .joinedload(UserSpecialization.specializations),
+                .selectinload(UserSpecialization.specializations),
                 joinedload(Event.creator),
-                joinedload(Event.contact_persons),
-                joinedload(Event.organisations).joinedload(
+                selectinload(Event.contact_persons),
+                selectinload(Event.organisations).selectinload(
                     Organisation.private_sites
                 ),
-                joinedload(Event.participants),
                 with_loader_criteria(
                     City.translation_model,
                     City.translation_model.locale == locale,
                 ),
             )
-            .group_by(
-                self.model.id,
-                Event.id,
-                EventView.id,
-                subquery.c.participants_views,
-                subquery.c.event_id,
-            )
+            .order_by(self.model.id.desc())
             .offset(skip)
             .limit(limit)
         )
@@ -279,22 +481,5 @@ class CRUDFavorite(
             )
         ).alias("filtered_job_view")
 
-    async def _get_subquery_for_event_view(
-        self,
-        current_user_id: Optional[int] = None,
-        current_user_ip: Optional[str] = None,
-    ) -> Select:
-        return (
-            select(EventView.event_id, EventView.participants_views).where(
-                or_(
-                    EventView.user_id == current_user_id,
-                    and_(
-                        EventView.user_id.is_(None),
-                        EventView.ip_address == current_user_ip,
-                    ),
-                )
-            )
-        ).alias("filtered_event_view")
-
 
 crud_favorite = CRUDFavorite(Favorite)
@@ -6,11 +6,12 @@ from sqlalchemy.orm import joinedload, selectinload
 
 from api.filters.job import JobFilter
 from crud.async_crud import BaseAsyncCRUD
+from crud.crud_mixins import ArchiveAsync
 from models import Job, Specialization
 from schemas.frilance.job import JobCreateDB, JobUpdate
 
 
-class CRUDJob(BaseAsyncCRUD[Job, JobCreateDB, JobUpdate]):
+class CRUDJob(BaseAsyncCRUD[Job, JobCreateDB, JobUpdate], ArchiveAsync[Job]):
     async def get_by_id(
         self, db: AsyncSession, *, obj_id: int, author_id: Optional[int] = None
     ) -> Optional[Job]:
@@ -0,0 +1,92 @@
+from sqlalchemy import and_, any_, case, desc, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.frilance.recommendation import (
+    BUDGET_WEIGHT,
+    LANGUAGE_WEIGHT,
+    SPECIALIZATION_WEIGHT,
+)
+from crud.crud_mixins import BaseCRUD
+from models import Job
+from models.m2m import JobSpecializations, UsersSpecializations
+from models.user import User
+from models.user.user_specialization import UserSpecialization
+
+
+class CRUDJobRecommendation(BaseCRUD[Job]):
+    async def get_ranked_ids(
+        self, db: AsyncSession, *, user_id: int, limit: int
+    ) -> list[int]:
+        """
+        Возвращает id опубликованных вакансий, подходящих специалисту,
+        в порядке убывания оценки.
+
+        Кандидаты - вакансии хотя бы с одной общей специализацией;
+        оценка складывается из числа общих специализаций, совпадения
+        основного языка пользователя с `accepted_languages` и того,
+        покрывает ли бюджет вакансии ставку специалиста.
+        """
+
+        matches = (
+            select(
+                JobSpecializations.job_id,
+                func.count().label("matches"),
+            )
+            .join(
+                UsersSpecializations,
+                UsersSpecializations.specialization_id
+                == JobSpecializations.specialization_id,
+            )
+            .join(
+                UserSpecialization,
+                UserSpecialization.id
+                == UsersSpecializations.user_specialization_id,
+            )
+            .where(UserSpecialization.user_id == user_id)
+            .group_by(JobSpecializations.job_id)
+            .subquery()
+        )
+        score = (
+            matches.c.matches * SPECIALIZATION_WEIGHT
+            + case(
+                (
+                    User.main_language == any_(self.model.accepted_languages),
+                    LANGUAGE_WEIGHT,
+                ),
+                else_=0,
+            )
+            + case(
+                (
+                    and_(
+                        self.model.budget >= UserSpecialization.price,
+                        self.model.currency == UserSpecialization.currency,
+                        self.model.payment_per
+                        == UserSpecialization.payment_per,
+                    ),
+                    BUDGET_WEIGHT,
+                ),
+                else_=0,
+            )
+        )
+        statement = (
+            select(self.model.id)
+            .join(matches, matches.c.job_id == self.model.id)
+            .join(User, User.id == user_id)
+            .join(UserSpecialization, UserSpecialization.user_id == User.id)
+            .where(
+                self.model.is_draft.is_(False),
+                self.model.is_archived.is_(False),
+                self.model.author_id.is_distinct_from(user_id),
+                or_(
+                    self.model.deadline.is_(None),
+                    self.model.deadline > func.now(),
+                ),
+            )
+            .order_by(desc(score), desc(self.model.published_at))
+            .limit(limit)
+        )
+        result = await db.execute(statement)
+        return list(result.scalars().all())
+
+
+crud_job_recommendation = CRUDJobRecommendation(Job)
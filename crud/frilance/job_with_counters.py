@@ -1,17 +1,23 @@
-from typing import Dict, Optional, Union
+from functools import partial
+from typing import Dict, Optional, Sequence
 
 from sqlalchemy import (
+    ColumnElement,
+    Integer,
     Subquery,
     and_,
+    bindparam,
     case,
     desc,
     distinct,
+    exists,
     func,
     nullslast,
     or_,
     select,
     literal,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import (
     aliased,
@@ -19,22 +25,26 @@ from sqlalchemy.orm import (
     with_loader_criteria,
     selectinload,
 )
-from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.sql.selectable import Select
 
 from api.filters.job import JobFilter
+from constants.frilance.job import JobSortField
 from constants.sorting import SortOrder
-from crud.crud_mixins import BaseCRUD, ReadAsync
+from crud.crud_mixins import (
+    BaseCRUD,
+    ReadAsync,
+    StatementCacheMixin,
+    equals_param,
+)
 from databases.queryset import QuerySet
-from models import City, Country, Favorite, Job, Proposal, Specialization
+from models import City, Favorite, Job, Proposal, Specialization
 from models.frilance import JobView
-from models.m2m import JobSpecializations
 from models.user import User
 from schemas.crud.job import JobDataBaseDTO
 from utilities.paginated_response import response_with_count
 
 
-class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
+class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job], StatementCacheMixin):
     async def get_by_id(
         self,
         db: AsyncSession,
@@ -43,17 +53,30 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
         author_id: Optional[int] = None,
         current_user_ip: Optional[str] = None,
     ) -> Optional[Dict]:
-        subquery = await self._get_subquery_for_job_view(
-            obj_id=obj_id,
-            current_user_id=author_id,
-            current_user_ip=current_user_ip,
+        params = {
+            "obj_id": obj_id,
+            "current_user_id": author_id,
+            "current_user_ip": current_user_ip,
+        }
+        statement = self.get_statement(
+            "get_by_id", self._build_get_by_id, params
+        ).options(
+            with_loader_criteria(
+                self.model.proposals,
+                Proposal.user_id == author_id,
+            ),
         )
-        favorite_subquery = await self._get_subquery_for_favorite_job(
-            job_id=obj_id,
-            current_user_id=author_id,
+        result = await db.execute(statement, params)
+        return result.mappings().first()
+
+    def _build_get_by_id(self, nulls: frozenset[str]) -> Select:
+        obj_id = bindparam("obj_id")
+        subquery = self._get_subquery_for_job_view(obj_id, nulls)
+        favorite_subquery = self._get_subquery_for_favorite_job(
+            obj_id, nulls
         )
-        proposal_subquery = await self._get_subquery_for_job_proposal(
-            job_id=self.model.id, current_user_id=author_id
+        proposal_subquery = self._get_subquery_for_job_proposal(
+            self.model.id, nulls
         )
 
         all_job_views = aliased(JobView)
@@ -96,10 +119,6 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
                     joinedload(Proposal.user),
                     joinedload(Proposal.files),
                 ),
-                with_loader_criteria(
-                    self.model.proposals,
-                    Proposal.user_id == author_id,
-                ),
             )
             .group_by(
                 self.model.id,
@@ -109,20 +128,17 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
                 proposal_subquery.c.is_applied,
             )
         )
-        if author_id is not None:
-            statement = statement.where(
+        if "current_user_id" not in nulls:
+            return statement.where(
                 or_(
                     self.model.is_draft.is_(False),
                     and_(
                         self.model.is_draft.is_(True),
-                        self.model.author_id == author_id,
+                        self.model.author_id == bindparam("current_user_id"),
                     ),
                 )
             )
-        else:
-            statement = statement.where(self.model.is_draft.is_(False))
-        result = await db.execute(statement)
-        return result.mappings().first()
+        return statement.where(self.model.is_draft.is_(False))
 
     async def get_multi(
         self,
@@ -134,53 +150,58 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
         current_user_id: Optional[int] = None,
         current_user_ip: Optional[str] = None,
         filters: Optional[JobFilter] = None,
-        sort_by: Optional[str] = None,
+        sort_by: Optional[JobSortField] = None,
         sort_order: SortOrder = SortOrder.asc,
+        ids: Optional[Sequence[int]] = None,
     ) -> Dict:
-        subquery = await self._get_subquery_for_job_view(
-            obj_id=self.model.id,
-            current_user_id=current_user_id,
-            current_user_ip=current_user_ip,
-        )
-        favorite_subquery = await self._get_subquery_for_favorite_job(
-            job_id=self.model.id,
-            current_user_id=current_user_id,
+        params = {
+            "author_id": author_id or None,
+            "current_user_id": current_user_id,
+            "current_user_ip": current_user_ip,
+        }
+        statement = self.get_statement(
+            ("get_multi", favorite),
+            partial(self._build_get_multi, favorite=favorite),
+            params,
+        ).options(
+            with_loader_criteria(
+                self.model.proposals,
+                Proposal.user_id == current_user_id,
+            ),
         )
-        proposal_subquery = await self._get_subquery_for_job_proposal(
-            job_id=self.model.id, current_user_id=current_user_id
+        if filters:
+            statement = self._apply_filters(statement, filters)
+        if ids is not None:
+            statement = (
+                statement.where(self.model.id.in_(ids))
+                .order_by(None)
+                .order_by(
+                    func.array_position(
+                        literal(list(ids), ARRAY(Integer)), self.model.id
+                    )
+                )
+            )
+        context = {
+            JobSortField.AUTHOR: (self.model.author, "last_visited_at"),
+            JobSortField.PRICE: (self.model, "normalized_budget"),
+        }
+
+        statement = self._apply_sorting(
+            statement, sort_by, sort_order, context
         )
-        all_job_views = aliased(JobView)
+        statement = statement.offset(skip).limit(limit)
+        result = await db.execute(statement, params)
+        rows = result.unique().mappings().all()
+        return await response_with_count(limit, skip, rows)
+
+    def _build_get_multi(
+        self, nulls: frozenset[str], favorite: bool
+    ) -> Select:
         statement = (
             select(
                 self.model,
-                func.count(distinct(Proposal.id)).label("proposals_count"),
-                func.count(distinct(all_job_views.id)).label("views"),
-                (
-                    func.count(distinct(Proposal.id)).label("proposals_count")
-                    - func.coalesce(subquery.c.proposals_views, 0)
-                ).label("new_proposals_count"),
-                func.bool_or(subquery.c.existing_view).label("existing_view"),
+                *self._get_counter_columns(nulls),
                 func.count(self.model.id).over().label("total_count"),
-                favorite_subquery.c.is_favorite.label("is_favorite"),
-                proposal_subquery.c.is_applied.label("is_applied"),
-            )
-            .outerjoin(all_job_views, all_job_views.job_id == self.model.id)
-            .outerjoin(subquery, subquery.c.job_id == self.model.id)
-            .outerjoin(
-                favorite_subquery, favorite_subquery.c.job_id == self.model.id
-            )
-            .outerjoin(
-                proposal_subquery, proposal_subquery.c.job_id == self.model.id
-            )
-            .outerjoin(self.model.proposals)
-            .outerjoin(City, City.id == self.model.city_id)
-            .outerjoin(Country, City.country_id == Country.id)
-            .outerjoin(
-                JobSpecializations, JobSpecializations.job_id == self.model.id
-            )
-            .outerjoin(
-                Specialization,
-                JobSpecializations.specialization_id == Specialization.id,
             )
             .outerjoin(User, User.id == self.model.author_id)
             .where(
@@ -196,51 +217,21 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
                     Specialization.direction
                 ),
                 selectinload(self.model.proposals).load_only(Proposal.id),
-                with_loader_criteria(
-                    self.model.proposals,
-                    Proposal.user_id == current_user_id,
-                ),
             )
             .order_by(desc(self.model.created_at))
-            .group_by(
-                self.model.id,
-                subquery.c.job_id,
-                subquery.c.proposals_views,
-                favorite_subquery.c.is_favorite,
-                proposal_subquery.c.is_applied,
-                User.last_visited_at,
-            )
-            .offset(skip)
-            .limit(limit)
         )
-        if author_id:
-            statement = statement.where(self.model.author_id == author_id)
+        if "author_id" not in nulls:
+            statement = statement.where(
+                self.model.author_id == bindparam("author_id")
+            )
         if favorite:
             statement = statement.where(
                 and_(
                     Favorite.job_id == self.model.id,
-                    Favorite.user_id == current_user_id,
+                    equals_param(Favorite.user_id, "current_user_id", nulls),
                 )
             )
-        if filters:
-            if filters.accepted_languages__in:
-                statement = statement.filter(
-                    self.model.accepted_languages.overlap(
-                        filters.accepted_languages__in
-                    )
-                )
-                filters.accepted_languages__in = None
-            statement = filters.filter(statement)
-        context = {
-            "author": (self.model.author, "last_visited_at"),
-        }
-
-        statement = await self._apply_sorting(
-            statement, sort_by, sort_order, context
-        )
-        result = await db.execute(statement)
-        rows = result.unique().mappings().all()
-        return await response_with_count(limit, skip, rows)
+        return statement
 
     async def get_multi_by_ids(
         self,
@@ -252,12 +243,23 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
     ) -> list[JobDataBaseDTO]:
         if not ids:
             return []
-        subquery = await self._get_subquery_for_job_view(
-            obj_id=self.model.id,
-            current_user_id=current_user_id,
-            current_user_ip=current_user_ip,
+        params = {
+            "ids": list(ids),
+            "current_user_id": current_user_id,
+            "current_user_ip": current_user_ip,
+        }
+        statement = self.get_statement(
+            "get_multi_by_ids", self._build_get_multi_by_ids, params
         )
-        statement = (
+        result = await db.execute(statement, params)
+        objects = result.mappings().unique().all()
+        result = QuerySet(objects)
+        result.model = self.model
+        return result
+
+    def _build_get_multi_by_ids(self, nulls: frozenset[str]) -> Select:
+        subquery = self._get_subquery_for_job_view(self.model.id, nulls)
+        return (
             select(
                 self.model,
                 func.count(distinct(Proposal.id)).label("proposals_count"),
@@ -269,7 +271,7 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
             )
             .outerjoin(subquery, subquery.c.job_id == self.model.id)
             .outerjoin(self.model.proposals)
-            .where(self.model.id.in_(ids))
+            .where(self.model.id.in_(bindparam("ids", expanding=True)))
             .options(
                 joinedload(self.model.job_views),
             )
@@ -280,11 +282,6 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
                 subquery.c.existing_view,
             )
         )
-        result = await db.execute(statement)
-        objects = result.mappings().unique().all()
-        result = QuerySet(objects)
-        result.model = self.model
-        return result
 
     async def get_multi_jobs_for_author(
         self,
@@ -294,36 +291,33 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
         skip: int = 0,
         limit: int = 100,
     ) -> Dict:
-        subquery = await self._get_subquery_for_job_view(
-            obj_id=self.model.id,
-            current_user_id=author_id,
+        params = {"current_user_id": author_id, "current_user_ip": None}
+        statement = self.get_statement(
+            "get_multi_jobs_for_author",
+            self._build_get_multi_jobs_for_author,
+            params,
         )
-        all_job_views = aliased(JobView)
-        statement = (
+
+        if filters is not None:
+            statement = self._apply_filters(statement, filters)
+
+        statement = statement.offset(skip).limit(limit)
+        result = await db.execute(statement, params)
+        rows = result.unique().mappings().all()
+        return await response_with_count(limit, skip, rows)
+
+    def _build_get_multi_jobs_for_author(
+        self, nulls: frozenset[str]
+    ) -> Select:
+        return (
             select(
                 self.model,
-                func.count(distinct(Proposal.id)).label("proposals_count"),
-                func.count(distinct(all_job_views.id)).label("views"),
-                (
-                    func.count(distinct(Proposal.id)).label("proposals_count")
-                    - func.coalesce(subquery.c.proposals_views, 0)
-                ).label("new_proposals_count"),
-                func.bool_or(subquery.c.existing_view).label("existing_view"),
+                *self._get_counter_columns(nulls, user_flags=False),
                 func.count(self.model.id).over().label("total_count"),
             )
-            .outerjoin(all_job_views, all_job_views.job_id == self.model.id)
-            .outerjoin(subquery, subquery.c.job_id == self.model.id)
-            .outerjoin(self.model.proposals)
-            .outerjoin(City, City.id == self.model.city_id)
-            .outerjoin(Country, City.country_id == Country.id)
-            .outerjoin(
-                JobSpecializations, JobSpecializations.job_id == self.model.id
-            )
-            .outerjoin(
-                Specialization,
-                JobSpecializations.specialization_id == Specialization.id,
+            .where(
+                equals_param(self.model.author_id, "current_user_id", nulls)
             )
-            .where(self.model.author_id == author_id)
             .options(
                 joinedload(self.model.author),
                 joinedload(self.model.coauthors),
@@ -335,27 +329,8 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
                 ),
             )
             .order_by(desc(self.model.created_at))
-            .group_by(
-                self.model.id, subquery.c.job_id, subquery.c.proposals_views
-            )
-            .offset(skip)
-            .limit(limit)
         )
 
-        if filters is not None:
-            if filters.accepted_languages__in:
-                statement = statement.filter(
-                    self.model.accepted_languages.overlap(
-                        filters.accepted_languages__in
-                    )
-                )
-                filters.accepted_languages__in = None
-            statement = filters.filter(statement)
-
-        result = await db.execute(statement)
-        rows = result.unique().mappings().all()
-        return await response_with_count(limit, skip, rows)
-
     async def get_jobs_applied_by_specialist(
         self,
         db: AsyncSession,
@@ -365,63 +340,41 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
         skip: int = 0,
         limit: int = 100,
     ) -> Dict:
-        subquery = await self._get_subquery_for_job_view(
-            obj_id=self.model.id, current_user_id=current_user_id
-        )
-        favorite_subquery = await self._get_subquery_for_favorite_job(
-            job_id=self.model.id,
-            current_user_id=current_user_id,
-        )
-        proposal_subquery = await self._get_subquery_for_job_proposal(
-            job_id=self.model.id, current_user_id=current_user_id
+        params = {"current_user_id": current_user_id, "current_user_ip": None}
+        statement = self.get_statement(
+            ("get_jobs_applied_by_specialist", favorite),
+            partial(
+                self._build_get_jobs_applied_by_specialist, favorite=favorite
+            ),
+            params,
+        ).options(
+            with_loader_criteria(
+                self.model.proposals,
+                Proposal.user_id == current_user_id,
+            ),
         )
-        all_job_views = aliased(JobView)
-        proposals_alias = aliased(Proposal)
+        if filters:
+            statement = self._apply_filters(statement, filters)
+        statement = statement.offset(skip).limit(limit)
+        result = await db.execute(statement, params)
+        rows = result.unique().mappings().all()
+        return await response_with_count(limit, skip, rows)
+
+    def _build_get_jobs_applied_by_specialist(
+        self, nulls: frozenset[str], favorite: bool
+    ) -> Select:
         statement = (
             select(
                 self.model,
-                func.count(distinct(proposals_alias.id)).label(
-                    "proposals_count"
-                ),
-                func.count(distinct(all_job_views.id)).label("views"),
-                (
-                    func.count(distinct(proposals_alias.id)).label(
-                        "proposals_count"
-                    )
-                    - func.coalesce(subquery.c.proposals_views, 0)
-                ).label("new_proposals_count"),
-                func.bool_or(subquery.c.existing_view).label("existing_view"),
+                *self._get_counter_columns(nulls),
                 func.count(self.model.id).over().label("total_count"),
-                favorite_subquery.c.is_favorite.label("is_favorite"),
-                proposal_subquery.c.is_applied.label("is_applied"),
-            )
-            .outerjoin(all_job_views, all_job_views.job_id == self.model.id)
-            .outerjoin(
-                proposals_alias, proposals_alias.job_id == self.model.id
-            )
-            .outerjoin(subquery, subquery.c.job_id == self.model.id)
-            .outerjoin(
-                favorite_subquery, favorite_subquery.c.job_id == self.model.id
-            )
-            .outerjoin(
-                proposal_subquery, proposal_subquery.c.job_id == self.model.id
-            )
-            .outerjoin(self.model.proposals)
-            .outerjoin(City, City.id == self.model.city_id)
-            .outerjoin(Country, City.country_id == Country.id)
-            .outerjoin(
-                JobSpecializations, JobSpecializations.job_id == self.model.id
-            )
-            .outerjoin(
-                Specialization,
-                JobSpecializations.specialization_id == Specialization.id,
             )
             .where(
                 self.model.is_draft.is_(False),
                 self.model.is_archived.is_(False),
-                and_(
-                    Proposal.user_id == current_user_id,
+                exists().where(
                     Proposal.job_id == self.model.id,
+                    equals_param(Proposal.user_id, "current_user_id", nulls),
                 ),
             )
             .options(
@@ -433,52 +386,130 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
                     Specialization.direction
                 ),
                 selectinload(self.model.proposals).load_only(Proposal.id),
-                with_loader_criteria(
-                    self.model.proposals,
-                    Proposal.user_id == current_user_id,
-                ),
             )
             .order_by(desc(self.model.created_at))
-            .group_by(
-                self.model.id,
-                subquery.c.job_id,
-                subquery.c.proposals_views,
-                favorite_subquery.c.is_favorite,
-                proposal_subquery.c.is_applied,
-            )
-            .offset(skip)
-            .limit(limit)
         )
         if favorite:
             statement = statement.where(
                 and_(
                     Favorite.job_id == self.model.id,
-                    Favorite.user_id == current_user_id,
+                    equals_param(Favorite.user_id, "current_user_id", nulls),
                 )
             )
-        if filters:
-            if filters.accepted_languages__in:
+        return statement
+
+    def _get_counter_columns(
+        self, nulls: frozenset[str], user_flags: bool = True
+    ) -> list[ColumnElement]:
+        """
+        Счётчики строки списка вакансий коррелированными подзапросами.
+
+        Каждая вакансия остаётся одной строкой, поэтому списку не нужны
+        GROUP BY и count(distinct) по размноженным JOIN.
+        """
+
+        proposals_count = (
+            select(func.count(Proposal.id))
+            .where(Proposal.job_id == self.model.id)
+            .scalar_subquery()
+        )
+        proposals_views = (
+            select(func.max(JobView.proposals_views))
+            .where(
+                JobView.job_id == self.model.id,
+                equals_param(JobView.user_id, "current_user_id", nulls),
+            )
+            .scalar_subquery()
+        )
+        if "current_user_id" in nulls:
+            existing_view = JobView.user_id.is_(None)
+        else:
+            existing_view = equals_param(
+                JobView.ip_address, "current_user_ip", nulls
+            )
+        columns = [
+            proposals_count.label("proposals_count"),
+            select(func.count(JobView.id))
+            .where(JobView.job_id == self.model.id)
+            .scalar_subquery()
+            .label("views"),
+            (proposals_count - func.coalesce(proposals_views, 0)).label(
+                "new_proposals_count"
+            ),
+            exists()
+            .where(JobView.job_id == self.model.id, existing_view)
+            .label("existing_view"),
+        ]
+        if not user_flags:
+            return columns
+        if "current_user_id" in nulls:
+            return [
+                *columns,
+                literal(False).label("is_favorite"),
+                literal(False).label("is_applied"),
+            ]
+        return [
+            *columns,
+            exists()
+            .where(
+                Favorite.job_id == self.model.id,
+                Favorite.user_id == bindparam("current_user_id"),
+            )
+            .label("is_favorite"),
+            exists()
+            .where(
+                Proposal.job_id == self.model.id,
+                Proposal.user_id == bindparam("current_user_id"),
+            )
+            .label("is_applied"),
+        ]
+
+    def _apply_filters(self, statement: Select, filters: JobFilter) -> Select:
+        """
+        Фильтры списка вакансий.
+
+        Языки, специализации, направления и страна проверяются по
+        денормализованным колонкам job без JOIN, остальное - JobFilter.
+        """
+
+        if filters.accepted_languages__in:
+            statement = statement.filter(
+                self.model.accepted_languages.overlap(
+                    filters.accepted_languages__in
+                )
+            )
+            filters.accepted_languages__in = None
+        specializations = filters.specializations
+        if specializations is not None:
+            if specializations.id__in:
                 statement = statement.filter(
-                    self.model.accepted_languages.overlap(
-                        filters.accepted_languages__in
+                    self.model.specialization_ids.overlap(
+                        specializations.id__in
                     )
                 )
-                filters.accepted_languages__in = None
-            statement = filters.filter(statement)
-        result = await db.execute(statement)
-        rows = result.unique().mappings().all()
-        return await response_with_count(limit, skip, rows)
+            if specializations.direction_id__in:
+                statement = statement.filter(
+                    self.model.direction_ids.overlap(
+                        specializations.direction_id__in
+                    )
+                )
+            filters.specializations = None
+        if filters.country is not None:
+            if filters.country.id__in:
+                statement = statement.filter(
+                    self.model.country_id.in_(filters.country.id__in)
+                )
+            filters.country = None
+        return filters.filter(statement)
 
     @staticmethod
-    async def _get_subquery_for_job_view(
-        obj_id: Union[int, InstrumentedAttribute],
-        current_user_id: Optional[int] = None,
-        current_user_ip: Optional[str] = None,
+    def _get_subquery_for_job_view(
+        obj_id: ColumnElement[int], nulls: frozenset[str]
     ) -> Subquery:
-        if current_user_id is None:
-            case_ = JobView.user_id == current_user_id
+        if "current_user_id" in nulls:
+            case_ = JobView.user_id.is_(None)
         else:
-            case_ = JobView.ip_address == current_user_ip
+            case_ = equals_param(JobView.ip_address, "current_user_ip", nulls)
         return (
             select(
                 JobView.job_id,
@@ -493,18 +524,17 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
         )
 
     @staticmethod
-    async def _get_subquery_for_favorite_job(
-        job_id: int,
-        current_user_id: Optional[int] = None,
-    ) -> Select:
-        if current_user_id:
+    def _get_subquery_for_favorite_job(
+        job_id: ColumnElement[int], nulls: frozenset[str]
+    ) -> Subquery:
+        if "current_user_id" not in nulls:
             favorite_subquery = (
                 select(
                     Favorite.job_id,
                     literal(True).label("is_favorite"),
                 )
                 .where(
-                    Favorite.user_id == current_user_id,
+                    Favorite.user_id == bindparam("current_user_id"),
                     Favorite.job_id == job_id,
                 )
                 .subquery()
@@ -517,18 +547,17 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
         return favorite_subquery
 
     @staticmethod
-    async def _get_subquery_for_job_proposal(
-        job_id: int,
-        current_user_id: Optional[int] = None,
-    ) -> Select:
-        if current_user_id:
+    def _get_subquery_for_job_proposal(
+        job_id: ColumnElement[int], nulls: frozenset[str]
+    ) -> Subquery:
+        if "current_user_id" not in nulls:
             is_applied_subquery = (
                 select(
                     Proposal.job_id,
                     literal(True).label("is_applied"),
                 )
                 .where(
-                    Proposal.user_id == current_user_id,
+                    Proposal.user_id == bindparam("current_user_id"),
                     Proposal.job_id == job_id,
                 )
                 .subquery()
@@ -571,16 +600,16 @@ class CRUDJobWithCounters(BaseCRUD[Job], ReadAsync[Job]):
         return result.fetchone()
 
     @staticmethod
-    async def _apply_sorting(
+    def _apply_sorting(
         statement: Select,
-        sort_by: Optional[str],
+        sort_by: Optional[JobSortField],
         sort_order: SortOrder = SortOrder.asc,
         context: Optional[dict] = None,
     ) -> Select:
         model, field_name = context.get(sort_by, (User, "last_visited_at"))
         order_field = getattr(model, field_name)
 
-        if sort_by == "price":
+        if sort_by == JobSortField.PRICE:
             order_expression = (
                 order_field.asc()
                 if sort_order == SortOrder.asc
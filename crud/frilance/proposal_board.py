@@ -0,0 +1,204 @@
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy import func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import Load, aliased, noload, selectinload
+
+from api.filters.proposal import ProposalBoardFilter
+from constants.frilance.proposal import (
+    PROPOSAL_EXPORT_BATCH_SIZE,
+    ProposalAnswerRelation,
+    ProposalSortField,
+)
+from constants.sorting import SortOrder
+from crud.crud_mixins import BaseCRUD
+from models import (
+    FileAnswer,
+    MultipleChoiceAnswer,
+    NumberAnswer,
+    Proposal,
+    ProposalStatus,
+    SingleChoiceAnswer,
+    TextAnswer,
+)
+
+
+ANSWER_MODELS = {
+    ProposalAnswerRelation.TEXT: TextAnswer,
+    ProposalAnswerRelation.NUMBER: NumberAnswer,
+    ProposalAnswerRelation.SINGLE_CHOICE: SingleChoiceAnswer,
+    ProposalAnswerRelation.MULTIPLE_CHOICE: MultipleChoiceAnswer,
+    ProposalAnswerRelation.FILE: FileAnswer,
+}
+
+# Значение, по которому сортируются отклики при сортировке по ответам.
+ANSWER_SORT_COLUMNS = {
+    ProposalSortField.NUMBER_ANSWER: NumberAnswer.value,
+    ProposalSortField.CHOICE_ANSWER: SingleChoiceAnswer.choice_id,
+}
+
+
+class CRUDProposalBoard(BaseCRUD[Proposal]):
+    """
+    Доска откликов автора вакансии.
+
+    Отклики выбираются по ключу (`id > after_id`), а не через OFFSET,
+    с проекцией колонок; из таблиц ответов подгружаются только ответы
+    на поля из конфигурации таблицы автора. Без таких полей таблицы
+    ответов не запрашиваются.
+    """
+
+    columns = (
+        Proposal.id,
+        Proposal.text,
+        Proposal.notes,
+        Proposal.price,
+        Proposal.user_id,
+        Proposal.job_id,
+        Proposal.status_id,
+        Proposal.is_hidden,
+        Proposal.created_at,
+        Proposal.updated_at,
+    )
+
+    def _get_statement(self, *, job_id: int, field_ids: Sequence[int]):
+        return (
+            select(self.model)
+            .where(self.model.job_id == job_id)
+            .options(
+                Load(self.model).load_only(*self.columns),
+                selectinload(self.model.status),
+                *self._get_answer_options(field_ids),
+            )
+            .order_by(self.model.id)
+        )
+
+    def _get_answer_options(self, field_ids: Sequence[int]) -> list:
+        if not field_ids:
+            return [
+                noload(getattr(self.model, relation.value))
+                for relation in ANSWER_MODELS
+            ]
+        return [
+            selectinload(
+                getattr(self.model, relation.value).and_(
+                    model.field_id.in_(field_ids)
+                )
+            )
+            for relation, model in ANSWER_MODELS.items()
+        ]
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        job_id: int,
+        field_ids: Sequence[int] = (),
+        after_id: Optional[int] = None,
+        limit: int,
+        filters: Optional[ProposalBoardFilter] = None,
+        sort_by: Optional[ProposalSortField] = None,
+        sort_field_id: Optional[int] = None,
+        sort_order: SortOrder = SortOrder.asc,
+    ) -> Sequence[Proposal]:
+        """
+        Страница откликов после `after_id` в выбранном порядке.
+
+        Курсор - это id последнего отклика предыдущей страницы: значение
+        сортировки для него берётся подзапросом, и страница начинается
+        строго после пары (значение, id). При сортировке по ответам
+        значением служит ответ на поле `sort_field_id`, отклики без
+        ответа считаются нулём.
+        """
+
+        statement = self._get_statement(job_id=job_id, field_ids=field_ids)
+        if filters:
+            statement = filters.filter(statement)
+
+        order_key = self._get_order_key(
+            self.model, ProposalStatus, sort_by, sort_field_id
+        )
+        if sort_by == ProposalSortField.STATUS:
+            statement = statement.outerjoin(
+                ProposalStatus, ProposalStatus.id == self.model.status_id
+            )
+        descending = sort_order == SortOrder.desc
+        statement = statement.order_by(None).order_by(
+            *(
+                column.desc() if descending else column.asc()
+                for column in order_key
+            )
+        )
+
+        if after_id is not None:
+            cursor_proposal = aliased(Proposal)
+            cursor_status = aliased(ProposalStatus)
+            cursor_key = (
+                select(
+                    *self._get_order_key(
+                        cursor_proposal, cursor_status, sort_by, sort_field_id
+                    )
+                )
+                .outerjoin(
+                    cursor_status,
+                    cursor_status.id == cursor_proposal.status_id,
+                )
+                .where(cursor_proposal.id == after_id)
+                .scalar_subquery()
+            )
+            key = tuple_(*order_key)
+            statement = statement.where(
+                key < cursor_key if descending else key > cursor_key
+            )
+        result = await db.execute(statement.limit(limit))
+        return result.scalars().all()
+
+    @staticmethod
+    def _get_order_key(
+        proposal: type[Proposal],
+        status: type[ProposalStatus],
+        sort_by: Optional[ProposalSortField],
+        sort_field_id: Optional[int] = None,
+    ) -> tuple:
+        if sort_by in ANSWER_SORT_COLUMNS:
+            column = ANSWER_SORT_COLUMNS[sort_by]
+            answer = column.class_
+            value = (
+                select(column)
+                .where(
+                    answer.proposal_id == proposal.id,
+                    answer.field_id == sort_field_id,
+                )
+                .limit(1)
+                .scalar_subquery()
+            )
+            return func.coalesce(value, 0), proposal.id
+        columns = {
+            ProposalSortField.CREATED_AT: proposal.created_at,
+            ProposalSortField.UPDATED_AT: proposal.updated_at,
+            ProposalSortField.PRICE: func.coalesce(proposal.price, 0),
+            ProposalSortField.STATUS: func.coalesce(status.order, 0),
+        }
+        if sort_by is None:
+            return (proposal.id,)
+        return columns[sort_by], proposal.id
+
+    async def stream(
+        self,
+        db: AsyncSession,
+        *,
+        job_id: int,
+        field_ids: Sequence[int] = (),
+    ) -> AsyncIterator[Proposal]:
+        """Отдаёт все отклики вакансии пачками серверного курсора."""
+
+        statement = self._get_statement(
+            job_id=job_id, field_ids=field_ids
+        ).execution_options(yield_per=PROPOSAL_EXPORT_BATCH_SIZE)
+        result = await db.stream_scalars(statement)
+        async for proposal in result:
+            yield proposal
+
+
+crud_proposal_board = CRUDProposalBoard(Proposal)
@@ -0,0 +1,96 @@
+from typing import TYPE_CHECKING, Iterable
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.crud_mixins import BaseCRUD
+from models import StoredBlob
+
+if TYPE_CHECKING:
+    from services.storage import StoredFile
+
+# Имена без имени файла пользователя: uuid и расширение. Объекты,
+# загруженные до дедупликации, называются `<uuid>_<имя файла>` и не
+# переиспользуются, чтобы не показывать чужое имя файла.
+ANONYMOUS_NAME_PATTERN = r"(^|/)[0-9a-f]{32}(\.[^/_]*)?$"
+
+
+class CRUDStoredBlob(BaseCRUD[StoredBlob]):
+    """
+    Учёт файлов, адресуемых по содержимому.
+
+    Используемые файлы выбираются с FOR SHARE: очистка удаляет
+    строки с ref_count = 0 и ждёт, пока транзакция, которая
+    ссылается на файл, не зафиксирует новую ссылку.
+    """
+
+    async def get_names_by_hashes(
+        self, db: AsyncSession, *, source: str, hashes: Iterable[str]
+    ) -> dict[str, str]:
+        statement = (
+            select(self.model.sha256, self.model.name)
+            .where(
+                self.model.source == source,
+                self.model.sha256.in_(hashes),
+                self.model.ref_count > 0,
+                self.model.name.regexp_match(ANONYMOUS_NAME_PATTERN),
+            )
+            .with_for_update(read=True)
+        )
+        result = await db.execute(statement)
+        return {sha256: name for sha256, name in result.all()}
+
+    async def get_tracked_names(
+        self, db: AsyncSession, *, source: str, names: Iterable[str]
+    ) -> set[str]:
+        statement = (
+            select(self.model.name)
+            .where(
+                self.model.source == source,
+                self.model.name.in_(names),
+                self.model.ref_count > 0,
+            )
+            .with_for_update(read=True)
+        )
+        result = await db.scalars(statement)
+        return set(result.all())
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        source: str,
+        files: Iterable["StoredFile"],
+    ) -> None:
+        values = [
+            {
+                "source": source,
+                "name": file.name,
+                "sha256": file.sha256,
+                "size": file.size,
+            }
+            for file in files
+        ]
+        if values:
+            await db.execute(
+                insert(self.model)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=["source", "name"])
+            )
+
+    async def delete_unreferenced(
+        self, db: AsyncSession, *, source: str
+    ) -> list[str]:
+        """Удаляет неиспользуемые файлы из учёта и возвращает их имена."""
+
+        statement = (
+            delete(self.model)
+            .where(self.model.source == source, self.model.ref_count <= 0)
+            .returning(self.model.name)
+        )
+        result = await db.scalars(statement)
+        return list(result.all())
+
+
+crud_stored_blob = CRUDStoredBlob(StoredBlob)
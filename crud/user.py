@@ -1,9 +1,9 @@
-from datetime import datetime, timedelta, UTC
+from datetime import datetime, UTC
 from typing import Optional, Type, Union
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import delete, or_, update
+from sqlalchemy import or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload, load_only, selectinload
@@ -166,20 +166,21 @@ class CRUDUser(BaseAsyncCRUD[User, UserCreateDB, UserUpdateDB]):
         result = await db.execute(statement)
         return result.scalars().first()
 
-    async def remove_after_30_days(
-        self,
-        db: AsyncSession,
-    ) -> int:
-        one_month_ago = datetime.now(tz=UTC) - timedelta(days=30)
-        statement = delete(self.model).where(
-            self.model.is_deleted.is_(True),
-            self.model.deleted_at <= one_month_ago,
+    async def get_by_uid_full(
+        self, db: AsyncSession, *, uid: UUID
+    ) -> Optional[User]:
+        statement = (
+            select(self.model)
+            .where(
+                self.model.uid == uid,
+                self.model.is_deleted.is_(False),
+            )
+            .options(*self.full_options)
         )
         result = await db.execute(statement)
-        await db.commit()
-        return result.rowcount
+        return result.scalars().first()
 
-    async def get_by_uid_full(
+    async def get_by_uid_with_contacts(
         self, db: AsyncSession, *, uid: UUID
     ) -> Optional[User]:
         statement = (
@@ -188,7 +189,15 @@ class CRUDUser(BaseAsyncCRUD[User, UserCreateDB, UserUpdateDB]):
                 self.model.uid == uid,
                 self.model.is_deleted.is_(False),
             )
-            .options(*self.full_options)
+            .options(
+                load_only(
+                    self.model.id,
+                    self.model.uid,
+                    self.model.contact_info,
+                ),
+                selectinload(self.model.links),
+                joinedload(self.model.private_site),
+            )
         )
         result = await db.execute(statement)
         return result.scalars().first()
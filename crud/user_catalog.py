@@ -1,15 +1,19 @@
+from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel
+from sqlalchemy import nullslast
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import Load, joinedload
+from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.sql.selectable import Select
 
 from api.filters.user_expert import UserExpertFilter
 from api.filters.user_specialist import UserSpecialistFilter
 from constants.orm.load_onlys.user import USER_LOAD_ONLY
 from constants.orm.load_onlys.user_experience import USER_EXPERIENCE_LOAD_ONLY
+from constants.sorting import SortOrder
 from crud.async_crud import BaseAsyncCRUD
 from models import (
     City,
@@ -67,18 +71,28 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
         skip: int = 0,
         limit: int = 100,
         filters: Optional[UserSpecialistFilter] = None,
+        price_order: Optional[SortOrder] = None,
+        price_gte: Optional[Decimal] = None,
+        price_lte: Optional[Decimal] = None,
     ) -> list[User]:
         statement = await self._get_base_query_for_specialists()
         statement = (
             statement.offset(skip)
             .limit(limit)
-            .order_by(self.model.id)
             .options(*self.specialists_options)
-            .distinct(self.model.id)
+        )
+        statement = self._apply_price_order(
+            statement, UserSpecialization.normalized_price, price_order
+        )
+        statement = self._apply_price_range(
+            statement,
+            UserSpecialization.normalized_price,
+            price_gte,
+            price_lte,
         )
         if filters:
-            filtered_statement = filters.filter(statement)
-        result = await db.execute(filtered_statement)
+            statement = filters.filter(statement)
+        result = await db.execute(statement)
         return result.scalars().unique().all()
 
     async def get_experts(
@@ -87,14 +101,21 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
         skip: int = 0,
         limit: int = 100,
         filters: Optional[UserExpertFilter] = None,
+        price_order: Optional[SortOrder] = None,
+        price_gte: Optional[Decimal] = None,
+        price_lte: Optional[Decimal] = None,
     ) -> list[User]:
         statement = await self._get_base_query_for_experts()
         statement = (
             statement.offset(skip)
             .limit(limit)
-            .order_by(self.model.id)
             .options(*self.experts_options)
-            .distinct(self.model.id)
+        )
+        statement = self._apply_price_order(
+            statement, Mentorship.normalized_price, price_order
+        )
+        statement = self._apply_price_range(
+            statement, Mentorship.normalized_price, price_gte, price_lte
         )
         if filters:
             if filters.grades__in:
@@ -102,8 +123,8 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
                     Mentorship.grades.overlap(filters.grades__in)
                 )
                 filters.grades__in = None
-            filtered_statement = filters.filter(statement)
-        result = await db.execute(filtered_statement)
+            statement = filters.filter(statement)
+        result = await db.execute(statement)
         return result.scalars().unique().all()
 
     async def get_specialists_favorite(
@@ -113,6 +134,9 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
         skip: int = 0,
         limit: int = 100,
         filters: Optional[UserSpecialistFilter] = None,
+        price_order: Optional[SortOrder] = None,
+        price_gte: Optional[Decimal] = None,
+        price_lte: Optional[Decimal] = None,
     ) -> list[User]:
         statement = await self._get_base_query_for_specialists()
         statement = (
@@ -122,13 +146,20 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
             .filter(Favorite.user_id == user_id)
             .offset(skip)
             .limit(limit)
-            .order_by(self.model.id)
             .options(*self.specialists_options)
-            .distinct(self.model.id)
+        )
+        statement = self._apply_price_order(
+            statement, UserSpecialization.normalized_price, price_order
+        )
+        statement = self._apply_price_range(
+            statement,
+            UserSpecialization.normalized_price,
+            price_gte,
+            price_lte,
         )
         if filters:
-            filtered_statement = filters.filter(statement)
-        result = await db.execute(filtered_statement)
+            statement = filters.filter(statement)
+        result = await db.execute(statement)
         return result.scalars().unique().all()
 
     async def get_experts_favorite(
@@ -138,6 +169,9 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
         skip: int = 0,
         limit: int = 100,
         filters: Optional[UserExpertFilter] = None,
+        price_order: Optional[SortOrder] = None,
+        price_gte: Optional[Decimal] = None,
+        price_lte: Optional[Decimal] = None,
     ) -> list[User]:
         statement = await self._get_base_query_for_experts()
         statement = (
@@ -147,9 +181,13 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
             .where(Favorite.user_id == user_id)
             .offset(skip)
             .limit(limit)
-            .order_by(self.model.id)
             .options(*self.experts_options)
-            .distinct(self.model.id)
+        )
+        statement = self._apply_price_order(
+            statement, Mentorship.normalized_price, price_order
+        )
+        statement = self._apply_price_range(
+            statement, Mentorship.normalized_price, price_gte, price_lte
         )
         if filters:
             if filters.grades__in:
@@ -157,8 +195,8 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
                     Mentorship.grades.overlap(filters.grades__in)
                 )
                 filters.grades__in = None
-            filtered_statement = filters.filter(statement)
-        result = await db.execute(filtered_statement)
+            statement = filters.filter(statement)
+        result = await db.execute(statement)
         return result.scalars().unique().all()
 
     async def _get_base_query_for_experts(self) -> Select:
@@ -215,5 +253,44 @@ class CRUDUserCatalog(BaseAsyncCRUD[User, BaseModel, BaseModel]):
             )
         )
 
+    def _apply_price_order(
+        self,
+        statement: Select,
+        price_column: InstrumentedAttribute,
+        price_order: Optional[SortOrder],
+    ) -> Select:
+        """
+        Сортирует каталог по цене в рублях, иначе по id.
+
+        У пользователя одна специализация и одно менторство, поэтому
+        DISTINCT ON по (цена, id) убирает только дубли от JOIN.
+        """
+
+        if price_order is None:
+            return statement.order_by(self.model.id).distinct(self.model.id)
+        price = (
+            price_column.asc()
+            if price_order == SortOrder.asc
+            else price_column.desc()
+        )
+        return statement.order_by(nullslast(price), self.model.id).distinct(
+            price_column, self.model.id
+        )
+
+    @staticmethod
+    def _apply_price_range(
+        statement: Select,
+        price_column: InstrumentedAttribute,
+        price_gte: Optional[Decimal],
+        price_lte: Optional[Decimal],
+    ) -> Select:
+        """Ограничивает каталог диапазоном цены в рублях."""
+
+        if price_gte is not None:
+            statement = statement.where(price_column >= price_gte)
+        if price_lte is not None:
+            statement = statement.where(price_column <= price_lte)
+        return statement
+
 
 crud_user_catalog = CRUDUserCatalog(User)
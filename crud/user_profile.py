@@ -0,0 +1,193 @@
+import asyncio
+from typing import Any, Optional, Sequence, Type
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.future import select
+from sqlalchemy.orm import Load, joinedload, selectinload
+from sqlalchemy.orm.attributes import (
+    InstrumentedAttribute,
+    set_committed_value,
+)
+
+from constants.crud_types import ModelType
+from constants.orm.load_onlys.user_full import USER_FULL_LOAD_ONLY
+from crud.crud_mixins import BaseCRUD
+from crud.options import (
+    city_and_country,
+    specialisations,
+    user_specialisation,
+)
+from models import (
+    City,
+    Education,
+    Event,
+    Mentorship,
+    Project,
+    User,
+    UserExperience,
+)
+
+
+class CRUDUserProfile(BaseCRUD[User]):
+    """
+    Сборка полного профиля пользователя для UserResponseFull.
+
+    Корневой объект User загружается только с колонками из ответа
+    и many-to-one связями, а независимые коллекции подгружаются
+    параллельно, каждая в своей сессии из общего пула соединений.
+    """
+
+    def __init__(self, model: Type[ModelType]) -> None:
+        super().__init__(model)
+        self.root_options = (
+            Load(self.model).load_only(*USER_FULL_LOAD_ONLY),
+            joinedload(self.model.city).options(*city_and_country),
+            joinedload(self.model.timezone),
+            joinedload(self.model.private_site),
+        )
+        self.relation_options = {
+            "authored_projects": (
+                selectinload(self.model.authored_projects).options(
+                    selectinload(Project.coauthors),
+                    selectinload(Project.keywords),
+                    joinedload(Project.image),
+                    joinedload(Project.organisation),
+                    selectinload(Project.specializations).options(
+                        *specialisations
+                    ),
+                ),
+            ),
+            "mentorship": (
+                joinedload(self.model.mentorship).options(
+                    selectinload(Mentorship.specializations).options(
+                        *specialisations
+                    ),
+                    selectinload(Mentorship.translations),
+                    selectinload(Mentorship.keywords),
+                    selectinload(Mentorship.demands),
+                ),
+            ),
+            "created_events": (
+                selectinload(self.model.created_events).options(
+                    joinedload(Event.city).joinedload(City.country),
+                    selectinload(Event.specializations),
+                    selectinload(Event.organizers),
+                    selectinload(Event.speakers),
+                    selectinload(Event.contact_persons),
+                ),
+            ),
+            "links": (selectinload(self.model.links),),
+            "education": (
+                selectinload(self.model.education).options(
+                    joinedload(Education.city).joinedload(City.country),
+                    selectinload(Education.certificates),
+                ),
+            ),
+            "experience": (
+                selectinload(self.model.experience).options(
+                    joinedload(UserExperience.city).joinedload(City.country),
+                ),
+            ),
+            "specialization": (user_specialisation,),
+        }
+
+    async def get_by_uid_full(
+        self, db: AsyncSession, *, uid: UUID
+    ) -> Optional[User]:
+        statement = (
+            select(self.model)
+            .where(
+                self.model.uid == uid,
+                self.model.is_deleted.is_(False),
+            )
+            .options(*self.root_options)
+        )
+        result = await db.execute(statement)
+        user = result.scalars().first()
+        if not user:
+            return None
+
+        session_maker = async_sessionmaker(
+            bind=db.bind, expire_on_commit=False
+        )
+        relations = await asyncio.gather(
+            *(
+                self._load_relation(
+                    session_maker,
+                    user_id=user.id,
+                    relation=relation,
+                    options=options,
+                )
+                for relation, options in self.relation_options.items()
+            )
+        )
+        if any(
+            value is None and getattr(self.model, relation).property.uselist
+            for relation, value in relations
+        ):
+            # Пользователя удалили, пока грузились связи.
+            return None
+        for relation, value in relations:
+            set_committed_value(user, relation, value)
+        return user
+
+    async def get_relations(
+        self,
+        db: AsyncSession,
+        *,
+        uid: UUID,
+        relations: Sequence[str],
+        columns: Sequence[InstrumentedAttribute] = (),
+    ) -> Optional[User]:
+        """Загружает только перечисленные связи и колонки пользователя."""
+
+        options = []
+        for relation in relations:
+            options.extend(
+                self.relation_options.get(
+                    relation, (joinedload(getattr(self.model, relation)),)
+                )
+            )
+        statement = (
+            select(self.model)
+            .where(
+                self.model.uid == uid,
+                self.model.is_deleted.is_(False),
+            )
+            .options(
+                Load(self.model).load_only(self.model.id, *columns),
+                *options,
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(statement)
+        return result.scalars().first()
+
+    async def _load_relation(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        user_id: int,
+        relation: str,
+        options: tuple,
+    ) -> tuple[str, Any]:
+        """Связь пользователя; None, если его уже нет."""
+
+        async with session_maker() as session:
+            statement = (
+                select(self.model)
+                .where(
+                    self.model.id == user_id,
+                    self.model.is_deleted.is_(False),
+                )
+                .options(Load(self.model).load_only(self.model.id), *options)
+            )
+            result = await session.execute(statement)
+            user = result.scalars().first()
+            if user is None:
+                return relation, None
+            return relation, getattr(user, relation)
+
+
+crud_user_profile = CRUDUserProfile(User)
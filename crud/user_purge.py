@@ -0,0 +1,174 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, delete, or_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import Select
+
+from crud.crud_mixins import BaseCRUD
+from models import (
+    Education,
+    Event,
+    EventView,
+    Favorite,
+    Job,
+    JobView,
+    MediaFile,
+    Proposal,
+    User,
+)
+from models.base import Base
+from models.event_participants import EventParticipants
+from models.user.education_file import EducationCertificateFile
+
+
+class CRUDUserPurge(BaseCRUD[User]):
+    """
+    Окончательное удаление пользователей, помеченных удалёнными.
+
+    Зависимые строки удаляются отдельными пачками до удаления самого
+    пользователя, чтобы каскад не превращался в одну долгую транзакцию.
+    Заблокированные строки пропускаются (SKIP LOCKED): пользовательские
+    запросы не ждут очистки, а пропущенное удалится следующей пачкой
+    или каскадом.
+    """
+
+    async def get_batch(
+        self,
+        db: AsyncSession,
+        *,
+        deleted_before: datetime,
+        after_id: int = 0,
+        limit: int,
+    ) -> list[int]:
+        statement = (
+            select(self.model.id)
+            .where(
+                self.model.is_deleted.is_(True),
+                self.model.deleted_at <= deleted_before,
+                self.model.id > after_id,
+            )
+            .order_by(self.model.id)
+            .limit(limit)
+        )
+        result = await db.scalars(statement)
+        return list(result.all())
+
+    def get_purged_users(
+        self, user_ids: Sequence[int], deleted_before: datetime
+    ) -> Select:
+        """
+        Пользователи пачки, которые всё ещё помечены удалёнными.
+
+        Подзапрос вычисляется в каждом DELETE, поэтому восстановленный
+        пользователь выпадает из очистки со следующей же порции.
+        """
+
+        return select(self.model.id).where(
+            self.model.id.in_(user_ids),
+            self.model.is_deleted.is_(True),
+            self.model.deleted_at <= deleted_before,
+        )
+
+    def get_dependents(
+        self, user_ids: Sequence[int], deleted_before: datetime
+    ) -> tuple[tuple[type[Base], ColumnElement[bool]], ...]:
+        """Зависимые таблицы в порядке очистки."""
+
+        users = self.get_purged_users(user_ids, deleted_before)
+        events = select(Event.id).where(Event.creator_id.in_(users))
+        jobs = select(Job.id).where(Job.author_id.in_(users))
+        educations = select(Education.id).where(Education.user_id.in_(users))
+        return (
+            (EventView, EventView.user_id.in_(users)),
+            (EventView, EventView.event_id.in_(events)),
+            (JobView, JobView.user_id.in_(users)),
+            (JobView, JobView.job_id.in_(jobs)),
+            (
+                Favorite,
+                or_(
+                    Favorite.user_id.in_(users),
+                    Favorite.favorite_user_id.in_(users),
+                ),
+            ),
+            (MediaFile, MediaFile.job_id.in_(jobs)),
+            (
+                EducationCertificateFile,
+                EducationCertificateFile.education_id.in_(educations),
+            ),
+            # У event.creator_id нет ON DELETE CASCADE.
+            (Event, Event.creator_id.in_(users)),
+            (Job, Job.author_id.in_(users)),
+        )
+
+    async def get_affected_authors(
+        self,
+        db: AsyncSession,
+        *,
+        user_ids: Sequence[int],
+        deleted_before: datetime,
+    ) -> list[int]:
+        """
+        Авторы, чьи счётчики изменит очистка пачки: сами пользователи и
+        авторы вакансий и мероприятий, где они оставили отклики,
+        просмотры или участие.
+        """
+
+        users = self.get_purged_users(user_ids, deleted_before)
+        statement = union(
+            users,
+            select(Job.author_id)
+            .join(JobView, JobView.job_id == Job.id)
+            .where(JobView.user_id.in_(users)),
+            select(Job.author_id)
+            .join(Proposal, Proposal.job_id == Job.id)
+            .where(Proposal.user_id.in_(users)),
+            select(Event.creator_id)
+            .join(EventParticipants, EventParticipants.event_id == Event.id)
+            .where(EventParticipants.user_id.in_(users)),
+        )
+        result = await db.scalars(statement)
+        return list(result.all())
+
+    async def delete_chunk(
+        self,
+        db: AsyncSession,
+        *,
+        model: type[Base],
+        condition: ColumnElement[bool],
+        limit: int,
+    ) -> int:
+        chunk = (
+            select(model.id)
+            .where(condition)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            delete(model)
+            .where(model.id.in_(chunk))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def delete_users(
+        self,
+        db: AsyncSession,
+        *,
+        user_ids: Sequence[int],
+        deleted_before: datetime,
+    ) -> int:
+        """Удаляет пользователей, если их не восстановили за время очистки."""
+
+        users = self.get_purged_users(
+            user_ids, deleted_before
+        ).with_for_update(skip_locked=True)
+        result = await db.execute(
+            delete(self.model)
+            .where(self.model.id.in_(users))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+
+crud_user_purge = CRUDUserPurge(User)
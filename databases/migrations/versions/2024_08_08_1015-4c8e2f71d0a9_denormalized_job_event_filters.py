@@ -0,0 +1,195 @@
+"""denormalized job and event filter columns
+
+Revision ID: 4c8e2f71d0a9
+Revises: b7d41e9c2a63
+Create Date: 2024-08-08 10:15:41.207316
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "4c8e2f71d0a9"
+down_revision: Union[str, None] = "b7d41e9c2a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("job", "event")
+
+SYNC_SPECIALIZATIONS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION sync_{table}_specialization_ids()
+    RETURNS trigger AS $$
+    DECLARE
+        target_id integer;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            target_id := OLD.{table}_id;
+        ELSE
+            target_id := NEW.{table}_id;
+        END IF;
+        UPDATE {table}
+        SET
+            specialization_ids = coalesce(
+                (
+                    SELECT array_agg(
+                        m2m.specialization_id
+                        ORDER BY m2m.specialization_id
+                    )
+                    FROM {table}_specializations m2m
+                    WHERE m2m.{table}_id = target_id
+                ),
+                '{{}}'
+            ),
+            direction_ids = coalesce(
+                (
+                    SELECT array_agg(
+                        DISTINCT specialization.direction_id
+                    )
+                    FROM {table}_specializations m2m
+                    JOIN specialization
+                        ON specialization.id = m2m.specialization_id
+                    WHERE m2m.{table}_id = target_id
+                ),
+                '{{}}'
+            )
+        WHERE id = target_id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+SYNC_SPECIALIZATIONS_TRIGGER = """
+    CREATE TRIGGER {table}_specializations_sync
+    AFTER INSERT OR UPDATE OR DELETE ON {table}_specializations
+    FOR EACH ROW EXECUTE FUNCTION sync_{table}_specialization_ids();
+"""
+
+SYNC_COUNTRY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION sync_{table}_country_id()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.country_id := (
+            SELECT city.country_id FROM city WHERE city.id = NEW.city_id
+        );
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+SYNC_COUNTRY_TRIGGER = """
+    CREATE TRIGGER {table}_country_sync
+    BEFORE INSERT OR UPDATE OF city_id ON {table}
+    FOR EACH ROW EXECUTE FUNCTION sync_{table}_country_id();
+"""
+
+BACKFILL = """
+    UPDATE {table}
+    SET
+        specialization_ids = coalesce(
+            (
+                SELECT array_agg(
+                    m2m.specialization_id ORDER BY m2m.specialization_id
+                )
+                FROM {table}_specializations m2m
+                WHERE m2m.{table}_id = {table}.id
+            ),
+            '{{}}'
+        ),
+        direction_ids = coalesce(
+            (
+                SELECT array_agg(DISTINCT specialization.direction_id)
+                FROM {table}_specializations m2m
+                JOIN specialization
+                    ON specialization.id = m2m.specialization_id
+                WHERE m2m.{table}_id = {table}.id
+            ),
+            '{{}}'
+        ),
+        country_id = (
+            SELECT city.country_id FROM city WHERE city.id = {table}.city_id
+        );
+"""
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "specialization_ids",
+                postgresql.ARRAY(sa.Integer()),
+                server_default="{}",
+                nullable=False,
+            ),
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                "direction_ids",
+                postgresql.ARRAY(sa.Integer()),
+                server_default="{}",
+                nullable=False,
+            ),
+        )
+        op.add_column(
+            table, sa.Column("country_id", sa.Integer(), nullable=True)
+        )
+        op.create_foreign_key(
+            f"{table}_country_id_fkey",
+            table,
+            "country",
+            ["country_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+        op.execute(BACKFILL.format(table=table))
+        op.execute(SYNC_SPECIALIZATIONS_FUNCTION.format(table=table))
+        op.execute(SYNC_SPECIALIZATIONS_TRIGGER.format(table=table))
+        op.execute(SYNC_COUNTRY_FUNCTION.format(table=table))
+        op.execute(SYNC_COUNTRY_TRIGGER.format(table=table))
+        op.create_index(
+            f"ix_{table}_specialization_ids",
+            table,
+            ["specialization_ids"],
+            unique=False,
+            postgresql_using="gin",
+        )
+        op.create_index(
+            f"ix_{table}_direction_ids",
+            table,
+            ["direction_ids"],
+            unique=False,
+            postgresql_using="gin",
+        )
+        op.create_index(
+            op.f(f"ix_{table}_country_id"),
+            table,
+            ["country_id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_country_sync ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS sync_{table}_country_id()")
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {table}_specializations_sync"
+            f" ON {table}_specializations"
+        )
+        op.execute(
+            f"DROP FUNCTION IF EXISTS sync_{table}_specialization_ids()"
+        )
+        op.drop_index(op.f(f"ix_{table}_country_id"), table_name=table)
+        op.drop_index(f"ix_{table}_direction_ids", table_name=table)
+        op.drop_index(f"ix_{table}_specialization_ids", table_name=table)
+        op.drop_constraint(
+            f"{table}_country_id_fkey", table, type_="foreignkey"
+        )
+        op.drop_column(table, "country_id")
+        op.drop_column(table, "direction_ids")
+        op.drop_column(table, "specialization_ids")
@@ -0,0 +1,143 @@
+"""exchange rate and normalized prices
+
+Revision ID: 9a3f5c6e2b17
+Revises: 4c8e2f71d0a9
+Create Date: 2024-08-09 12:40:05.831942
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9a3f5c6e2b17"
+down_revision: Union[str, None] = "4c8e2f71d0a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Таблица, исходная колонка цены и нормализованная колонка.
+PRICED_TABLES = (
+    ("job", "budget", "normalized_budget"),
+    ("user_specialization", "price", "normalized_price"),
+    ("mentorship", "price", "normalized_price"),
+)
+
+NORMALIZE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION normalize_{table}_{source}()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.{target} := NEW.{source} * (
+            SELECT exchange_rate.rate
+            FROM exchange_rate
+            WHERE exchange_rate.currency = NEW.currency
+        );
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+NORMALIZE_TRIGGER = """
+    CREATE TRIGGER {table}_{target}_sync
+    BEFORE INSERT OR UPDATE OF {source}, currency ON {table}
+    FOR EACH ROW EXECUTE FUNCTION normalize_{table}_{source}();
+"""
+
+RENORMALIZE_STATEMENT = """
+        UPDATE {table}
+        SET {target} = {source} * changed_rate
+        WHERE currency = changed_currency;
+"""
+
+RENORMALIZE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION renormalize_prices()
+    RETURNS trigger AS $$
+    DECLARE
+        changed_currency currency;
+        changed_rate numeric;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            changed_currency := OLD.currency;
+        ELSE
+            changed_currency := NEW.currency;
+            changed_rate := NEW.rate;
+        END IF;
+        {statements}
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+RENORMALIZE_TRIGGER = """
+    CREATE TRIGGER exchange_rate_renormalize
+    AFTER INSERT OR UPDATE OR DELETE ON exchange_rate
+    FOR EACH ROW EXECUTE FUNCTION renormalize_prices();
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "exchange_rate",
+        sa.Column(
+            "currency",
+            postgresql.ENUM(
+                "rub",
+                "euro",
+                "dollar",
+                "yuan",
+                name="currency",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("rate", sa.Numeric(precision=18, scale=6), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("currency"),
+    )
+    for table, source, target in PRICED_TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                target, sa.Numeric(precision=18, scale=2), nullable=True
+            ),
+        )
+        op.create_index(
+            op.f(f"ix_{table}_{target}"), table, [target], unique=False
+        )
+        names = {"table": table, "source": source, "target": target}
+        op.execute(NORMALIZE_FUNCTION.format(**names))
+        op.execute(NORMALIZE_TRIGGER.format(**names))
+    op.execute(
+        RENORMALIZE_FUNCTION.format(
+            statements="".join(
+                RENORMALIZE_STATEMENT.format(
+                    table=table, source=source, target=target
+                )
+                for table, source, target in PRICED_TABLES
+            )
+        )
+    )
+    op.execute(RENORMALIZE_TRIGGER)
+    # Рубль - базовая валюта, остальные курсы заполняются в админке.
+    # Вставка запускает триггер и заполняет normalized_* для рублей.
+    op.execute("INSERT INTO exchange_rate (currency, rate) VALUES ('rub', 1)")
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS exchange_rate_renormalize ON exchange_rate"
+    )
+    op.execute("DROP FUNCTION IF EXISTS renormalize_prices()")
+    for table, source, target in reversed(PRICED_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_{target}_sync ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS normalize_{table}_{source}()")
+        op.drop_index(op.f(f"ix_{table}_{target}"), table_name=table)
+        op.drop_column(table, target)
+    op.drop_table("exchange_rate")
@@ -0,0 +1,44 @@
+"""favorites unique targets
+
+Revision ID: e51b7d2c8f40
+Revises: 9a3f5c6e2b17
+Create Date: 2024-08-12 09:30:27.640158
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e51b7d2c8f40"
+down_revision: Union[str, None] = "9a3f5c6e2b17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TARGET_COLUMNS = ("event_id", "job_id", "organisation_id", "favorite_user_id")
+
+
+def upgrade() -> None:
+    for column in TARGET_COLUMNS:
+        op.execute(
+            f"""
+                DELETE FROM favorites duplicate
+                USING favorites original
+                WHERE duplicate.id > original.id
+                    AND duplicate.user_id = original.user_id
+                    AND duplicate.{column} = original.{column};
+            """
+        )
+        op.create_unique_constraint(
+            f"favorites_user_id_{column}_key",
+            "favorites",
+            ["user_id", column],
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(TARGET_COLUMNS):
+        op.drop_constraint(
+            f"favorites_user_id_{column}_key", "favorites", type_="unique"
+        )
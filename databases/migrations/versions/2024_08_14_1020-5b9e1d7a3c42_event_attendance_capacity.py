@@ -0,0 +1,104 @@
+"""event attendance capacity
+
+Revision ID: 5b9e1d7a3c42
+Revises: 0d6a93b4c1e8
+Create Date: 2024-08-14 10:20:37.514208
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b9e1d7a3c42"
+down_revision: Union[str, None] = "0d6a93b4c1e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEDUPLICATE = """
+    DELETE FROM event_participants duplicate
+    USING event_participants original
+    WHERE duplicate.event_id = original.event_id
+        AND duplicate.user_id = original.user_id
+        AND duplicate.ctid > original.ctid;
+"""
+
+BACKFILL = """
+    UPDATE event
+    SET registered_count = (
+        SELECT count(*)
+        FROM event_participants
+        WHERE event_participants.event_id = event.id
+    );
+"""
+
+COUNT_PARTICIPANTS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_event_participants()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE event
+            SET registered_count = registered_count + 1
+            WHERE id = NEW.event_id;
+        ELSE
+            UPDATE event
+            SET registered_count = registered_count - 1
+            WHERE id = OLD.event_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_PARTICIPANTS_TRIGGER = """
+    CREATE TRIGGER event_participants_count
+    AFTER INSERT OR DELETE ON event_participants
+    FOR EACH ROW EXECUTE FUNCTION count_event_participants();
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event", sa.Column("max_participants", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "event",
+        sa.Column(
+            "registered_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+    op.execute(DEDUPLICATE)
+    op.create_index(
+        "ux_event_participants_event_id_user_id",
+        "event_participants",
+        ["event_id", "user_id"],
+        unique=True,
+    )
+    op.execute(BACKFILL)
+    op.execute(COUNT_PARTICIPANTS_FUNCTION)
+    op.execute(COUNT_PARTICIPANTS_TRIGGER)
+    op.create_check_constraint(
+        "event_capacity_check",
+        "event",
+        "max_participants IS NULL OR registered_count <= max_participants",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("event_capacity_check", "event", type_="check")
+    op.execute(
+        "DROP TRIGGER IF EXISTS event_participants_count"
+        " ON event_participants"
+    )
+    op.execute("DROP FUNCTION IF EXISTS count_event_participants()")
+    op.drop_index(
+        "ux_event_participants_event_id_user_id",
+        table_name="event_participants",
+    )
+    op.drop_column("event", "registered_count")
+    op.drop_column("event", "max_participants")
@@ -0,0 +1,144 @@
+"""content addressed media
+
+Revision ID: 8d2f6a1c9e57
+Revises: 5b9e1d7a3c42
+Create Date: 2024-08-15 14:10:52.640117
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f6a1c9e57"
+down_revision: Union[str, None] = "5b9e1d7a3c42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger(__name__)
+
+COUNT_BLOB_REFS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_{table}_blob_refs()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE stored_blob
+            SET ref_count = ref_count + 1
+            WHERE source = '{table}' AND name = NEW.{column};
+        END IF;
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            UPDATE stored_blob
+            SET ref_count = ref_count - 1
+            WHERE source = '{table}' AND name = OLD.{column};
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_BLOB_REFS_TRIGGER = """
+    CREATE TRIGGER {table}_blob_refs_count
+    AFTER INSERT OR DELETE OR UPDATE OF {column} ON {table}
+    FOR EACH ROW EXECUTE FUNCTION count_{table}_blob_refs();
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stored_blob",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("source", sa.String(length=64), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "ref_count", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("source", "name"),
+    )
+    op.create_index(
+        "ix_stored_blob_source_sha256",
+        "stored_blob",
+        ["source", "sha256"],
+        unique=False,
+    )
+    for column in _get_blob_columns():
+        table = column.class_.__tablename__
+        _backfill(column)
+        names = {"table": table, "column": column.key}
+        op.execute(COUNT_BLOB_REFS_FUNCTION.format(**names))
+        op.execute(COUNT_BLOB_REFS_TRIGGER.format(**names))
+
+
+def downgrade() -> None:
+    for column in _get_blob_columns():
+        table = column.class_.__tablename__
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {table}_blob_refs_count ON {table}"
+        )
+        op.execute(f"DROP FUNCTION IF EXISTS count_{table}_blob_refs()")
+    op.drop_index("ix_stored_blob_source_sha256", table_name="stored_blob")
+    op.drop_table("stored_blob")
+
+
+def _get_blob_columns() -> tuple:
+    """Колонки FileType, файлы которых учитываются по содержимому."""
+
+    from models import MediaFile
+    from models.user.education_file import EducationCertificateFile
+
+    return MediaFile.file, EducationCertificateFile.file
+
+
+def _backfill(column) -> None:
+    """
+    Считает хеши уже загруженных файлов, читая их из хранилища.
+
+    Одинаковые файлы под разными именами остаются отдельными
+    объектами; новые загрузки будут ссылаться на любой из них.
+    Недоступные в хранилище файлы пропускаются и не учитываются.
+    """
+
+    from services.storage import get_storage, hash_file
+
+    bind = op.get_bind()
+    table = column.class_.__tablename__
+    storage = get_storage(column)
+    rows = bind.execute(
+        sa.text(
+            f"SELECT {column.key}, count(*) FROM {table}"
+            f" WHERE {column.key} IS NOT NULL GROUP BY {column.key}"
+        )
+    ).all()
+    for name, ref_count in rows:
+        try:
+            with storage.open(name) as file:
+                sha256 = hash_file(file)
+                size = file.seek(0, 2)
+        except Exception as ex:
+            logger.warning("Skipping %s from %s: %s", name, table, ex)
+            continue
+        bind.execute(
+            sa.text(
+                "INSERT INTO stored_blob"
+                " (source, name, sha256, size, ref_count)"
+                " VALUES (:source, :name, :sha256, :size, :ref_count)"
+            ),
+            {
+                "source": table,
+                "name": name,
+                "sha256": sha256,
+                "size": size,
+                "ref_count": ref_count,
+            },
+        )
@@ -0,0 +1,48 @@
+"""active listing partial indexes
+
+Revision ID: 3f7c2b9d4e61
+Revises: 8d2f6a1c9e57
+Create Date: 2024-08-16 09:40:18.207364
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f7c2b9d4e61"
+down_revision: Union[str, None] = "8d2f6a1c9e57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_active_end_datetime",
+        "event",
+        ["end_datetime"],
+        unique=False,
+        postgresql_where=sa.text("is_archived IS false"),
+    )
+    op.create_index(
+        "ix_job_active_created_at",
+        "job",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("is_draft IS false AND is_archived IS false"),
+    )
+    op.create_index(
+        "ix_job_active_deadline",
+        "job",
+        ["deadline"],
+        unique=False,
+        postgresql_where=sa.text("is_archived IS false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_active_deadline", table_name="job")
+    op.drop_index("ix_job_active_created_at", table_name="job")
+    op.drop_index("ix_event_active_end_datetime", table_name="event")
@@ -0,0 +1,37 @@
+"""image variants
+
+Revision ID: 6e2a8c4f1b93
+Revises: 3f7c2b9d4e61
+Create Date: 2024-08-17 11:30:52.871904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "6e2a8c4f1b93"
+down_revision: Union[str, None] = "3f7c2b9d4e61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ("event", "user"):
+        op.add_column(
+            table,
+            sa.Column(
+                "image_variants",
+                postgresql.JSONB(astext_type=sa.Text()),
+                server_default="{}",
+                nullable=False,
+            ),
+        )
+
+
+def downgrade() -> None:
+    for table in ("user", "event"):
+        op.drop_column(table, "image_variants")
@@ -0,0 +1,106 @@
+"""proposal answer field indexes
+
+Revision ID: 683e71b3983f
+Revises: 6e2a8c4f1b93
+Create Date: 2024-08-18 09:15:26.730512
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "683e71b3983f"
+down_revision: Union[str, None] = "6e2a8c4f1b93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ANSWER_INDEX_COLUMNS = (
+    ("number_answer", "value"),
+    ("single_choice_answer", "choice_id"),
+    ("multiple_choice_answer", "choice_id"),
+)
+
+CUSTOM_FIELD_INDEXES_FUNCTION = """
+    CREATE OR REPLACE FUNCTION sync_custom_field_indexes()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {create}
+        ELSE
+            {drop}
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+CREATE_ANSWER_INDEX = """
+            EXECUTE format(
+                'CREATE INDEX IF NOT EXISTS %I ON {table} '
+                '(proposal_id, {column}) WHERE field_id = %s',
+                'ix_{table}_field_' || NEW.id,
+                NEW.id
+            );
+"""
+
+DROP_ANSWER_INDEX = """
+            EXECUTE format(
+                'DROP INDEX IF EXISTS %I', 'ix_{table}_field_' || OLD.id
+            );
+"""
+
+CUSTOM_FIELD_INDEXES_TRIGGER = """
+    CREATE TRIGGER proposal_table_custom_field_answer_indexes
+    AFTER INSERT OR DELETE ON proposal_table_custom_field
+    FOR EACH ROW EXECUTE FUNCTION sync_custom_field_indexes();
+"""
+
+
+def _get_field_ids() -> list[int]:
+    result = op.get_bind().execute(
+        sa.text("SELECT id FROM proposal_table_custom_field")
+    )
+    return list(result.scalars())
+
+
+def upgrade() -> None:
+    op.execute(
+        CUSTOM_FIELD_INDEXES_FUNCTION.format(
+            create="".join(
+                CREATE_ANSWER_INDEX.format(table=table, column=column)
+                for table, column in ANSWER_INDEX_COLUMNS
+            ),
+            drop="".join(
+                DROP_ANSWER_INDEX.format(table=table)
+                for table, _ in ANSWER_INDEX_COLUMNS
+            ),
+        )
+    )
+    op.execute(CUSTOM_FIELD_INDEXES_TRIGGER)
+    for field_id in _get_field_ids():
+        for table, column in ANSWER_INDEX_COLUMNS:
+            op.create_index(
+                f"ix_{table}_field_{field_id}",
+                table,
+                ["proposal_id", column],
+                unique=False,
+                postgresql_where=sa.text(f"field_id = {field_id}"),
+            )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS proposal_table_custom_field_answer_indexes"
+        " ON proposal_table_custom_field"
+    )
+    op.execute("DROP FUNCTION IF EXISTS sync_custom_field_indexes()")
+    for field_id in _get_field_ids():
+        for table, _ in ANSWER_INDEX_COLUMNS:
+            op.drop_index(
+                f"ix_{table}_field_{field_id}",
+                table_name=table,
+                if_exists=True,
+            )
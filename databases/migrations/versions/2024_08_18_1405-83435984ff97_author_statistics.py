@@ -0,0 +1,401 @@
+"""author statistics
+
+Revision ID: 83435984ff97
+Revises: 683e71b3983f
+Create Date: 2024-08-18 14:05:41.260375
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "83435984ff97"
+down_revision: Union[str, None] = "683e71b3983f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BUMP_AUTHOR_STATISTICS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION bump_author_statistics(
+        target_author integer, counter text, delta integer
+    )
+    RETURNS void AS $$
+    BEGIN
+        IF target_author IS NULL OR delta = 0 THEN
+            RETURN;
+        END IF;
+        -- Уменьшение строку не создаёт: при каскадном удалении
+        -- автора вставка нарушила бы внешний ключ.
+        IF delta < 0 THEN
+            EXECUTE format(
+                'UPDATE author_statistics SET %1$I = %1$I + $2 '
+                'WHERE user_id = $1',
+                counter
+            ) USING target_author, delta;
+        ELSE
+            EXECUTE format(
+                'INSERT INTO author_statistics (user_id, %1$I) '
+                'VALUES ($1, $2) ON CONFLICT (user_id) DO UPDATE '
+                'SET %1$I = author_statistics.%1$I + $2',
+                counter
+            ) USING target_author, delta;
+        END IF;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_AUTHOR_STATUS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_{table}_statistics()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM bump_author_statistics(
+                OLD.{author}, 'archived_{table}s_count', -OLD.is_archived::int
+            );
+            PERFORM bump_author_statistics(
+                OLD.{author}, 'draft_{table}s_count', -OLD.is_draft::int
+            );
+            PERFORM bump_author_statistics(
+                OLD.{author},
+                'published_{table}s_count',
+                -(NOT OLD.is_draft AND NOT OLD.is_archived)::int
+            );
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM bump_author_statistics(
+                NEW.{author}, 'archived_{table}s_count', NEW.is_archived::int
+            );
+            PERFORM bump_author_statistics(
+                NEW.{author}, 'draft_{table}s_count', NEW.is_draft::int
+            );
+            PERFORM bump_author_statistics(
+                NEW.{author},
+                'published_{table}s_count',
+                (NOT NEW.is_draft AND NOT NEW.is_archived)::int
+            );
+        END IF;
+        IF TG_OP = 'UPDATE' AND NEW.{author} IS DISTINCT FROM OLD.{author}
+        THEN
+            PERFORM count_{table}_children(OLD.id, OLD.{author}, -1);
+            PERFORM count_{table}_children(NEW.id, NEW.{author}, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_AUTHOR_STATUS_TRIGGER = """
+    CREATE TRIGGER {table}_author_statistics
+    AFTER INSERT OR DELETE OR UPDATE OF is_draft, is_archived, {author}
+    ON {table}
+    FOR EACH ROW EXECUTE FUNCTION count_{table}_statistics();
+"""
+
+# Дочерние строки удаляются каскадом уже после удаления родителя, и их
+# триггеры автора не находят, поэтому вклад детей вычитается до DELETE.
+DISCOUNT_CHILDREN_FUNCTION = """
+    CREATE OR REPLACE FUNCTION discount_{table}_children()
+    RETURNS trigger AS $$
+    BEGIN
+        PERFORM count_{table}_children(OLD.id, OLD.{author}, -1);
+        RETURN OLD;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+DISCOUNT_CHILDREN_TRIGGER = """
+    CREATE TRIGGER {table}_children_statistics
+    BEFORE DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION discount_{table}_children();
+"""
+
+COUNT_JOB_CHILDREN_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_job_children(
+        target_id integer, target_author integer, delta integer
+    )
+    RETURNS void AS $$
+    BEGIN
+        PERFORM bump_author_statistics(
+            target_author,
+            'proposals_count',
+            delta * (
+                SELECT count(*) FROM proposal WHERE job_id = target_id
+            )::int
+        );
+        PERFORM bump_author_statistics(
+            target_author,
+            'jobs_views',
+            delta * (
+                SELECT count(*) FROM job_view WHERE job_id = target_id
+            )::int
+        );
+        PERFORM bump_author_statistics(
+            target_author,
+            'proposals_views',
+            delta * (
+                SELECT coalesce(sum(proposals_views), 0)
+                FROM job_view
+                WHERE job_id = target_id AND user_id = target_author
+            )::int
+        );
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_EVENT_CHILDREN_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_event_children(
+        target_id integer, target_author integer, delta integer
+    )
+    RETURNS void AS $$
+    BEGIN
+        PERFORM bump_author_statistics(
+            target_author,
+            'participants_count',
+            delta * (
+                SELECT count(*)
+                FROM event_participants
+                WHERE event_id = target_id
+            )::int
+        );
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_CHILD_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_{table}_statistics()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM bump_author_statistics(
+                (
+                    SELECT {parent}.{author} FROM {parent}
+                    WHERE {parent}.id = NEW.{parent}_id
+                ),
+                '{counter}',
+                1
+            );
+        ELSE
+            PERFORM bump_author_statistics(
+                (
+                    SELECT {parent}.{author} FROM {parent}
+                    WHERE {parent}.id = OLD.{parent}_id
+                ),
+                '{counter}',
+                -1
+            );
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_CHILD_TRIGGER = """
+    CREATE TRIGGER {table}_author_statistics
+    AFTER INSERT OR DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION count_{table}_statistics();
+"""
+
+COUNT_JOB_VIEW_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_job_view_statistics()
+    RETURNS trigger AS $$
+    DECLARE
+        target_author integer;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            target_author := (
+                SELECT job.author_id FROM job WHERE job.id = OLD.job_id
+            );
+            PERFORM bump_author_statistics(target_author, 'jobs_views', -1);
+            IF OLD.user_id = target_author THEN
+                PERFORM bump_author_statistics(
+                    target_author, 'proposals_views', -OLD.proposals_views
+                );
+            END IF;
+            RETURN NULL;
+        END IF;
+        target_author := (
+            SELECT job.author_id FROM job WHERE job.id = NEW.job_id
+        );
+        IF TG_OP = 'INSERT' THEN
+            PERFORM bump_author_statistics(target_author, 'jobs_views', 1);
+            IF NEW.user_id = target_author THEN
+                PERFORM bump_author_statistics(
+                    target_author, 'proposals_views', NEW.proposals_views
+                );
+            END IF;
+        ELSIF NEW.user_id = target_author THEN
+            PERFORM bump_author_statistics(
+                target_author,
+                'proposals_views',
+                NEW.proposals_views - OLD.proposals_views
+            );
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_JOB_VIEW_TRIGGER = """
+    CREATE TRIGGER job_view_author_statistics
+    AFTER INSERT OR DELETE OR UPDATE OF proposals_views ON job_view
+    FOR EACH ROW EXECUTE FUNCTION count_job_view_statistics();
+"""
+
+BACKFILL = """
+    INSERT INTO author_statistics (
+        user_id,
+        archived_jobs_count,
+        draft_jobs_count,
+        published_jobs_count,
+        proposals_count,
+        proposals_views,
+        jobs_views,
+        archived_events_count,
+        draft_events_count,
+        published_events_count,
+        participants_count
+    )
+    SELECT
+        author.id,
+        (
+            SELECT count(*) FROM job
+            WHERE job.author_id = author.id AND job.is_archived
+        ),
+        (
+            SELECT count(*) FROM job
+            WHERE job.author_id = author.id AND job.is_draft
+        ),
+        (
+            SELECT count(*) FROM job
+            WHERE job.author_id = author.id
+                AND NOT job.is_draft AND NOT job.is_archived
+        ),
+        (
+            SELECT count(*) FROM proposal
+            JOIN job ON job.id = proposal.job_id
+            WHERE job.author_id = author.id
+        ),
+        (
+            SELECT coalesce(sum(job_view.proposals_views), 0) FROM job_view
+            JOIN job ON job.id = job_view.job_id
+            WHERE job.author_id = author.id AND job_view.user_id = author.id
+        ),
+        (
+            SELECT count(*) FROM job_view
+            JOIN job ON job.id = job_view.job_id
+            WHERE job.author_id = author.id
+        ),
+        (
+            SELECT count(*) FROM event
+            WHERE event.creator_id = author.id AND event.is_archived
+        ),
+        (
+            SELECT count(*) FROM event
+            WHERE event.creator_id = author.id AND event.is_draft
+        ),
+        (
+            SELECT count(*) FROM event
+            WHERE event.creator_id = author.id
+                AND NOT event.is_draft AND NOT event.is_archived
+        ),
+        (
+            SELECT count(*) FROM event_participants
+            JOIN event ON event.id = event_participants.event_id
+            WHERE event.creator_id = author.id
+        )
+    FROM (
+        SELECT author_id AS id FROM job WHERE author_id IS NOT NULL
+        UNION
+        SELECT creator_id FROM event WHERE creator_id IS NOT NULL
+    ) AS author;
+"""
+
+COUNTERS = (
+    "archived_jobs_count",
+    "draft_jobs_count",
+    "published_jobs_count",
+    "proposals_count",
+    "proposals_views",
+    "jobs_views",
+    "archived_events_count",
+    "draft_events_count",
+    "published_events_count",
+    "participants_count",
+)
+
+LISTINGS = (
+    ("job", "author_id", COUNT_JOB_CHILDREN_FUNCTION),
+    ("event", "creator_id", COUNT_EVENT_CHILDREN_FUNCTION),
+)
+
+CHILDREN = (
+    ("proposal", "job", "author_id", "proposals_count"),
+    ("event_participants", "event", "creator_id", "participants_count"),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "author_statistics",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        *(
+            sa.Column(
+                counter, sa.Integer(), server_default="0", nullable=False
+            )
+            for counter in COUNTERS
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(BACKFILL)
+    op.execute(BUMP_AUTHOR_STATISTICS_FUNCTION)
+    for table, author, children in LISTINGS:
+        names = {"table": table, "author": author}
+        op.execute(children)
+        op.execute(COUNT_AUTHOR_STATUS_FUNCTION.format(**names))
+        op.execute(COUNT_AUTHOR_STATUS_TRIGGER.format(**names))
+        op.execute(DISCOUNT_CHILDREN_FUNCTION.format(**names))
+        op.execute(DISCOUNT_CHILDREN_TRIGGER.format(**names))
+    for table, parent, author, counter in CHILDREN:
+        names = {
+            "table": table,
+            "parent": parent,
+            "author": author,
+            "counter": counter,
+        }
+        op.execute(COUNT_CHILD_FUNCTION.format(**names))
+        op.execute(COUNT_CHILD_TRIGGER.format(**names))
+    op.execute(COUNT_JOB_VIEW_FUNCTION)
+    op.execute(COUNT_JOB_VIEW_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS job_view_author_statistics ON job_view"
+    )
+    op.execute("DROP FUNCTION IF EXISTS count_job_view_statistics()")
+    for table, *_ in CHILDREN:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {table}_author_statistics ON {table}"
+        )
+        op.execute(f"DROP FUNCTION IF EXISTS count_{table}_statistics()")
+    for table, *_ in LISTINGS:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {table}_children_statistics ON {table}"
+        )
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {table}_author_statistics ON {table}"
+        )
+        op.execute(f"DROP FUNCTION IF EXISTS discount_{table}_children()")
+        op.execute(f"DROP FUNCTION IF EXISTS count_{table}_statistics()")
+        op.execute(
+            f"DROP FUNCTION IF EXISTS count_{table}_children"
+            "(integer, integer, integer)"
+        )
+    op.execute(
+        "DROP FUNCTION IF EXISTS bump_author_statistics"
+        "(integer, text, integer)"
+    )
+    op.drop_table("author_statistics")
@@ -0,0 +1,48 @@
+"""favorite events count indexes
+
+Revision ID: 5b7e1c9d2a64
+Revises: 83435984ff97
+Create Date: 2024-08-19 10:20:37.418205
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e1c9d2a64"
+down_revision: Union[str, None] = "83435984ff97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_favorites_user_id_id", table_name="favorites")
+    op.create_index(
+        "ix_favorites_user_id_id",
+        "favorites",
+        ["user_id", "id"],
+        unique=False,
+        postgresql_include=["event_id"],
+    )
+    op.create_index(
+        "ix_event_published_id_end_datetime",
+        "event",
+        ["id", "end_datetime"],
+        unique=False,
+        postgresql_where=sa.text("is_draft IS false AND is_archived IS false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_event_published_id_end_datetime",
+        table_name="event",
+        postgresql_where=sa.text("is_draft IS false AND is_archived IS false"),
+    )
+    op.drop_index("ix_favorites_user_id_id", table_name="favorites")
+    op.create_index(
+        "ix_favorites_user_id_id", "favorites", ["user_id", "id"], unique=False
+    )
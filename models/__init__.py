@@ -3,6 +3,7 @@ from .city import City
 from .contact_person import ContactPerson
 from .country import Country
 from .event import Event
+from .exchange_rate import ExchangeRate
 from .favorite import Favorite
 from .frilance import (
     BaseAnswer,
@@ -30,9 +31,11 @@ from .media_file import MediaFile
 from .organisation import Organisation, OrganisationOffice
 from .project.project import Project
 from .project.project_views import ProjectView
+from .stored_blob import StoredBlob
 from .text_document import TextDocument
 from .timezone import Timezone
 from .user import (
+    AuthorStatistics,
     Direction,
     Education,
     Link,
@@ -48,6 +51,7 @@ from .user import (
 from .views import EventView
 from .status import Status
 from .event_participants import EventParticipants
+from . import triggers  # noqa: F401
 
 
 __all__ = [
@@ -63,10 +67,12 @@ __all__ = [
     "VerificationCode",
     "Project",
     "ProjectView",
+    "StoredBlob",
     "ProjectsCoauthors",
     "Keyword",
     "ProjectsKeywords",
     "Event",
+    "ExchangeRate",
     "MentorshipDemands",
     "Mentorship",
     "Education",
@@ -98,4 +104,5 @@ __all__ = [
     "CalendarEventUsers",
     "Status",
     "EventParticipants",
+    "AuthorStatistics",
 ]
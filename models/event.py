@@ -5,12 +5,15 @@ from fastapi_storages.integrations.sqlalchemy import FileType
 from sqlalchemy import (
     ARRAY,
     Boolean,
+    CheckConstraint,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -53,6 +56,8 @@ class Event(Base):
         - creator: User - Объект пользователя, являющегося создателем события.
         - photo: FileType - Поле для хранения фотографии события.
         - event_cover: FileType - Поле для хранения обложки события.
+        - image_variants: dict - Созданные варианты изображений по имени
+            файла.
         - title: str - Название события, до 120 символов.
         - description: str - Подробное описание события.
         - event_type: EventType - Тип события, определенный перечислением.
@@ -82,9 +87,45 @@ class Event(Base):
         - organisations: Organisation - Компании партнёры.
         - participants: User - список пользователей, ивента
         - published_at: DateTime - Дата и время опубликования события.
+        - specialization_ids: list[int] - Копия id специализаций.
+        - direction_ids: list[int] - Копия id направлений специализаций.
+        - country_id: int - Копия страны города проведения события.
+        - max_participants: int - Лимит участников, None - без лимита.
+        - registered_count: int - Число участников, ведётся триггером.
     """
 
     __tablename__ = "event"
+    __table_args__ = (
+        Index(
+            "ix_event_specialization_ids",
+            "specialization_ids",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_event_direction_ids", "direction_ids", postgresql_using="gin"
+        ),
+        CheckConstraint(
+            "max_participants IS NULL OR registered_count <= max_participants",
+            name="event_capacity_check",
+        ),
+        # Только активные мероприятия: завершившиеся архивирует
+        # services.archiver.
+        Index(
+            "ix_event_active_end_datetime",
+            "end_datetime",
+            postgresql_where=text("is_archived IS false"),
+        ),
+        # Опубликованные мероприятия для index-only проверок по id,
+        # например при подсчёте избранного.
+        Index(
+            "ix_event_published_id_end_datetime",
+            "id",
+            "end_datetime",
+            postgresql_where=text(
+                "is_draft IS false AND is_archived IS false"
+            ),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -95,6 +136,9 @@ class Event(Base):
     event_cover: Mapped[Optional[FileType]] = mapped_column(
         FileType(storage=events_storage)
     )
+    image_variants: Mapped[dict[str, list[str]]] = mapped_column(
+        JSONB, default=dict, server_default="{}"
+    )
     event_type: Mapped[Optional[EventType]] = mapped_column(
         ENUM(EventType, create_type=False), nullable=True
     )
@@ -126,6 +170,23 @@ class Event(Base):
         ForeignKey("city.id"), nullable=True
     )
     city: Mapped["City"] = relationship("City", back_populates="events")
+    # Денормализованные копии связей для фильтров без JOIN.
+    # Поддерживаются триггерами в БД, из кода не изменяются.
+    specialization_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), server_default="{}"
+    )
+    direction_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), server_default="{}"
+    )
+    country_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("country.id", ondelete="SET NULL"), index=True
+    )
+    max_participants: Mapped[Optional[int]] = mapped_column(Integer)
+    # Счётчик участников поддерживается триггером на event_participants,
+    # лимит проверяется ограничением event_capacity_check.
+    registered_count: Mapped[int] = mapped_column(
+        Integer, server_default="0"
+    )
     places: Mapped[list] = mapped_column(JSONB, default=JSONB.NULL)
     online_links: Mapped[Optional[list[str]]] = mapped_column(
         ARRAY(String), default=[], nullable=True
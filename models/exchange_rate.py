@@ -0,0 +1,38 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, Numeric, func
+from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy.orm import Mapped, mapped_column
+
+from constants.finance import Currency
+from models.base import Base
+
+
+class ExchangeRate(Base):
+    """
+    Локальный курс валют для сравнения цен.
+
+    # Attrs:
+        - currency: Currency - Валюта.
+        - rate: Decimal - Стоимость единицы валюты в рублях.
+        - updated_at: DateTime - Дата и время последнего изменения курса.
+
+    Колонки normalized_* у заказов, специализаций и менторства
+    пересчитываются триггерами в БД при изменении курса или цены.
+    """
+
+    __tablename__ = "exchange_rate"
+
+    currency: Mapped[Currency] = mapped_column(
+        ENUM(Currency, create_type=False), primary_key=True
+    )
+    rate: Mapped[Decimal] = mapped_column(Numeric(18, 6))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __str__(self) -> str:
+        return f"{self.currency}: {self.rate}"
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from models.base import Base
@@ -12,6 +12,20 @@ if TYPE_CHECKING:
 
 class Favorite(Base):
     __tablename__ = "favorites"
+    __table_args__ = (
+        UniqueConstraint("user_id", "event_id"),
+        UniqueConstraint("user_id", "job_id"),
+        UniqueConstraint("user_id", "organisation_id"),
+        UniqueConstraint("user_id", "favorite_user_id"),
+        # event_id в индексе: total_count избранных мероприятий
+        # считается без обращения к таблице.
+        Index(
+            "ix_favorites_user_id_id",
+            "user_id",
+            "id",
+            postgresql_include=["event_id"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(
@@ -1,8 +1,19 @@
 import logging
 from datetime import datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Text, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import ARRAY, ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import expression
@@ -23,6 +34,28 @@ if TYPE_CHECKING:
 
 class Job(Base):
     __tablename__ = "job"
+    __table_args__ = (
+        Index(
+            "ix_job_specialization_ids",
+            "specialization_ids",
+            postgresql_using="gin",
+        ),
+        Index("ix_job_direction_ids", "direction_ids", postgresql_using="gin"),
+        # Только активные вакансии: с истёкшим сроком архивирует
+        # services.archiver.
+        Index(
+            "ix_job_active_created_at",
+            "created_at",
+            postgresql_where=text(
+                "is_draft IS false AND is_archived IS false"
+            ),
+        ),
+        Index(
+            "ix_job_active_deadline",
+            "deadline",
+            postgresql_where=text("is_archived IS false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str]
@@ -41,6 +74,10 @@ class Job(Base):
     payment_per: Mapped[Optional[PaymentPer]] = mapped_column(
         ENUM(PaymentPer, create_type=False)
     )
+    # Бюджет в рублях по курсу ExchangeRate, считается триггером.
+    normalized_budget: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(18, 2), index=True
+    )
     is_negotiable_price: Mapped[bool] = mapped_column(
         Boolean, server_default=expression.false()
     )
@@ -80,6 +117,17 @@ class Job(Base):
         "City",
         back_populates="jobs",
     )
+    # Денормализованные копии связей для фильтров без JOIN.
+    # Поддерживаются триггерами в БД, из кода не изменяются.
+    specialization_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), server_default="{}"
+    )
+    direction_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), server_default="{}"
+    )
+    country_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("country.id", ondelete="SET NULL"), index=True
+    )
     author: Mapped["User"] = relationship(
         "User", back_populates="authored_jobs"
     )
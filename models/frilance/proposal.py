@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Optional
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Text,
     UniqueConstraint,
@@ -11,6 +12,7 @@ from sqlalchemy import (
     Boolean,
     event,
     Connection,
+    text,
 )
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Mapper
@@ -54,7 +56,19 @@ class ProposalStatus(NameTranslations):
 
 class Proposal(Base):
     __tablename__ = "proposal"
-    __table_args__ = (UniqueConstraint("user_id", "job_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "job_id"),
+        Index("ix_proposal_job_id_id", "job_id", "id"),
+        Index("ix_proposal_job_id_created_at", "job_id", "created_at", "id"),
+        Index("ix_proposal_job_id_updated_at", "job_id", "updated_at", "id"),
+        Index("ix_proposal_job_id_status_id", "job_id", "status_id"),
+        Index(
+            "ix_proposal_job_id_price",
+            "job_id",
+            text("coalesce(price, 0)"),
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     text: Mapped[str] = mapped_column(Text)
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models.base import Base
+
+
+class StoredBlob(Base):
+    """
+    Файл в хранилище, адресуемый по содержимому.
+
+    # Attrs:
+        - id: int
+        - source: str - Таблица, колонка FileType которой ссылается
+          на файл; у каждой такой колонки своё хранилище.
+        - name: str - Имя объекта в хранилище.
+        - sha256: str - Хеш содержимого.
+        - size: int - Размер в байтах.
+        - ref_count: int - Число строк source, ссылающихся на файл.
+        - created_at: DateTime - Дата и время загрузки.
+
+    ref_count ведётся триггерами на таблицах source. Объекты
+    с ref_count = 0 больше никем не используются и удаляются
+    из хранилища.
+    """
+
+    __tablename__ = "stored_blob"
+    __table_args__ = (
+        UniqueConstraint("source", "name"),
+        Index("ix_stored_blob_source_sha256", "source", "sha256"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    source: Mapped[str] = mapped_column(String(64))
+    name: Mapped[str] = mapped_column(String)
+    sha256: Mapped[str] = mapped_column(String(64))
+    size: Mapped[int] = mapped_column(BigInteger)
+    ref_count: Mapped[int] = mapped_column(Integer, server_default="0")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    def __str__(self) -> str:
+        return f"{self.source}: {self.name}"
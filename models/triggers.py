@@ -0,0 +1,599 @@
+"""
+Триггеры, поддерживающие денормализованные колонки.
+
+В рабочей БД триггеры создаются миграциями, а здесь те же DDL
+привязаны к созданию таблиц, чтобы схема из metadata.create_all()
+(например, в тестах) вела себя так же.
+"""
+
+from sqlalchemy import DDL, Table, event
+
+from models.event import Event
+from models.event_participants import EventParticipants
+from models.exchange_rate import ExchangeRate
+from models.frilance import (
+    MultipleChoiceAnswer,
+    NumberAnswer,
+    ProposalTableCustomField,
+    SingleChoiceAnswer,
+)
+from models.frilance.job import Job
+from models.frilance.job_views import JobView
+from models.frilance.proposal import Proposal
+from models.m2m import EventSpecializations, JobSpecializations
+from models.media_file import MediaFile
+from models.user.author_statistics import AuthorStatistics
+from models.user.education_file import EducationCertificateFile
+from models.user.mentorship import Mentorship
+from models.user.user_specialization import UserSpecialization
+
+SYNC_SPECIALIZATIONS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION sync_{table}_specialization_ids()
+    RETURNS trigger AS $$
+    DECLARE
+        target_id integer;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            target_id := OLD.{table}_id;
+        ELSE
+            target_id := NEW.{table}_id;
+        END IF;
+        UPDATE {table}
+        SET
+            specialization_ids = coalesce(
+                (
+                    SELECT array_agg(
+                        m2m.specialization_id
+                        ORDER BY m2m.specialization_id
+                    )
+                    FROM {table}_specializations m2m
+                    WHERE m2m.{table}_id = target_id
+                ),
+                '{{}}'
+            ),
+            direction_ids = coalesce(
+                (
+                    SELECT array_agg(
+                        DISTINCT specialization.direction_id
+                    )
+                    FROM {table}_specializations m2m
+                    JOIN specialization
+                        ON specialization.id = m2m.specialization_id
+                    WHERE m2m.{table}_id = target_id
+                ),
+                '{{}}'
+            )
+        WHERE id = target_id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+SYNC_SPECIALIZATIONS_TRIGGER = """
+    CREATE TRIGGER {table}_specializations_sync
+    AFTER INSERT OR UPDATE OR DELETE ON {table}_specializations
+    FOR EACH ROW EXECUTE FUNCTION sync_{table}_specialization_ids();
+"""
+
+SYNC_COUNTRY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION sync_{table}_country_id()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.country_id := (
+            SELECT city.country_id FROM city WHERE city.id = NEW.city_id
+        );
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+SYNC_COUNTRY_TRIGGER = """
+    CREATE TRIGGER {table}_country_sync
+    BEFORE INSERT OR UPDATE OF city_id ON {table}
+    FOR EACH ROW EXECUTE FUNCTION sync_{table}_country_id();
+"""
+
+NORMALIZE_PRICE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION normalize_{table}_{source}()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.{target} := NEW.{source} * (
+            SELECT exchange_rate.rate
+            FROM exchange_rate
+            WHERE exchange_rate.currency = NEW.currency
+        );
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+NORMALIZE_PRICE_TRIGGER = """
+    CREATE TRIGGER {table}_{target}_sync
+    BEFORE INSERT OR UPDATE OF {source}, currency ON {table}
+    FOR EACH ROW EXECUTE FUNCTION normalize_{table}_{source}();
+"""
+
+RENORMALIZE_STATEMENT = """
+        UPDATE {table}
+        SET {target} = {source} * changed_rate
+        WHERE currency = changed_currency;
+"""
+
+RENORMALIZE_PRICES_FUNCTION = """
+    CREATE OR REPLACE FUNCTION renormalize_prices()
+    RETURNS trigger AS $$
+    DECLARE
+        changed_currency currency;
+        changed_rate numeric;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            changed_currency := OLD.currency;
+        ELSE
+            changed_currency := NEW.currency;
+            changed_rate := NEW.rate;
+        END IF;
+        {statements}
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+RENORMALIZE_PRICES_TRIGGER = """
+    CREATE TRIGGER exchange_rate_renormalize
+    AFTER INSERT OR UPDATE OR DELETE ON exchange_rate
+    FOR EACH ROW EXECUTE FUNCTION renormalize_prices();
+"""
+
+PARTICIPANTS_UNIQUE_INDEX = """
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_event_participants_event_id_user_id
+    ON event_participants (event_id, user_id);
+"""
+
+COUNT_PARTICIPANTS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_event_participants()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE event
+            SET registered_count = registered_count + 1
+            WHERE id = NEW.event_id;
+        ELSE
+            UPDATE event
+            SET registered_count = registered_count - 1
+            WHERE id = OLD.event_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_PARTICIPANTS_TRIGGER = """
+    CREATE TRIGGER event_participants_count
+    AFTER INSERT OR DELETE ON event_participants
+    FOR EACH ROW EXECUTE FUNCTION count_event_participants();
+"""
+
+COUNT_BLOB_REFS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_{table}_blob_refs()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE stored_blob
+            SET ref_count = ref_count + 1
+            WHERE source = '{table}' AND name = NEW.{column};
+        END IF;
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            UPDATE stored_blob
+            SET ref_count = ref_count - 1
+            WHERE source = '{table}' AND name = OLD.{column};
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_BLOB_REFS_TRIGGER = """
+    CREATE TRIGGER {table}_blob_refs_count
+    AFTER INSERT OR DELETE OR UPDATE OF {column} ON {table}
+    FOR EACH ROW EXECUTE FUNCTION count_{table}_blob_refs();
+"""
+
+CUSTOM_FIELD_INDEXES_FUNCTION = """
+    CREATE OR REPLACE FUNCTION sync_custom_field_indexes()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {create}
+        ELSE
+            {drop}
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+CREATE_ANSWER_INDEX = """
+            EXECUTE format(
+                'CREATE INDEX IF NOT EXISTS %I ON {table} '
+                '(proposal_id, {column}) WHERE field_id = %s',
+                'ix_{table}_field_' || NEW.id,
+                NEW.id
+            );
+"""
+
+DROP_ANSWER_INDEX = """
+            EXECUTE format(
+                'DROP INDEX IF EXISTS %I', 'ix_{table}_field_' || OLD.id
+            );
+"""
+
+CUSTOM_FIELD_INDEXES_TRIGGER = """
+    CREATE TRIGGER {table}_answer_indexes
+    AFTER INSERT OR DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION sync_custom_field_indexes();
+"""
+
+BUMP_AUTHOR_STATISTICS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION bump_author_statistics(
+        target_author integer, counter text, delta integer
+    )
+    RETURNS void AS $$
+    BEGIN
+        IF target_author IS NULL OR delta = 0 THEN
+            RETURN;
+        END IF;
+        -- Уменьшение строку не создаёт: при каскадном удалении
+        -- автора вставка нарушила бы внешний ключ.
+        IF delta < 0 THEN
+            EXECUTE format(
+                'UPDATE author_statistics SET %1$I = %1$I + $2 '
+                'WHERE user_id = $1',
+                counter
+            ) USING target_author, delta;
+        ELSE
+            EXECUTE format(
+                'INSERT INTO author_statistics (user_id, %1$I) '
+                'VALUES ($1, $2) ON CONFLICT (user_id) DO UPDATE '
+                'SET %1$I = author_statistics.%1$I + $2',
+                counter
+            ) USING target_author, delta;
+        END IF;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_AUTHOR_STATUS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_{table}_statistics()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM bump_author_statistics(
+                OLD.{author}, 'archived_{table}s_count', -OLD.is_archived::int
+            );
+            PERFORM bump_author_statistics(
+                OLD.{author}, 'draft_{table}s_count', -OLD.is_draft::int
+            );
+            PERFORM bump_author_statistics(
+                OLD.{author},
+                'published_{table}s_count',
+                -(NOT OLD.is_draft AND NOT OLD.is_archived)::int
+            );
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM bump_author_statistics(
+                NEW.{author}, 'archived_{table}s_count', NEW.is_archived::int
+            );
+            PERFORM bump_author_statistics(
+                NEW.{author}, 'draft_{table}s_count', NEW.is_draft::int
+            );
+            PERFORM bump_author_statistics(
+                NEW.{author},
+                'published_{table}s_count',
+                (NOT NEW.is_draft AND NOT NEW.is_archived)::int
+            );
+        END IF;
+        IF TG_OP = 'UPDATE' AND NEW.{author} IS DISTINCT FROM OLD.{author}
+        THEN
+            PERFORM count_{table}_children(OLD.id, OLD.{author}, -1);
+            PERFORM count_{table}_children(NEW.id, NEW.{author}, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_AUTHOR_STATUS_TRIGGER = """
+    CREATE TRIGGER {table}_author_statistics
+    AFTER INSERT OR DELETE OR UPDATE OF is_draft, is_archived, {author}
+    ON {table}
+    FOR EACH ROW EXECUTE FUNCTION count_{table}_statistics();
+"""
+
+# Дочерние строки удаляются каскадом уже после удаления родителя, и их
+# триггеры автора не находят, поэтому вклад детей вычитается до DELETE.
+DISCOUNT_CHILDREN_FUNCTION = """
+    CREATE OR REPLACE FUNCTION discount_{table}_children()
+    RETURNS trigger AS $$
+    BEGIN
+        PERFORM count_{table}_children(OLD.id, OLD.{author}, -1);
+        RETURN OLD;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+DISCOUNT_CHILDREN_TRIGGER = """
+    CREATE TRIGGER {table}_children_statistics
+    BEFORE DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION discount_{table}_children();
+"""
+
+COUNT_JOB_CHILDREN_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_job_children(
+        target_id integer, target_author integer, delta integer
+    )
+    RETURNS void AS $$
+    BEGIN
+        PERFORM bump_author_statistics(
+            target_author,
+            'proposals_count',
+            delta * (
+                SELECT count(*) FROM proposal WHERE job_id = target_id
+            )::int
+        );
+        PERFORM bump_author_statistics(
+            target_author,
+            'jobs_views',
+            delta * (
+                SELECT count(*) FROM job_view WHERE job_id = target_id
+            )::int
+        );
+        PERFORM bump_author_statistics(
+            target_author,
+            'proposals_views',
+            delta * (
+                SELECT coalesce(sum(proposals_views), 0)
+                FROM job_view
+                WHERE job_id = target_id AND user_id = target_author
+            )::int
+        );
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_EVENT_CHILDREN_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_event_children(
+        target_id integer, target_author integer, delta integer
+    )
+    RETURNS void AS $$
+    BEGIN
+        PERFORM bump_author_statistics(
+            target_author,
+            'participants_count',
+            delta * (
+                SELECT count(*)
+                FROM event_participants
+                WHERE event_id = target_id
+            )::int
+        );
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_CHILD_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_{table}_statistics()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM bump_author_statistics(
+                (
+                    SELECT {parent}.{author} FROM {parent}
+                    WHERE {parent}.id = NEW.{parent}_id
+                ),
+                '{counter}',
+                1
+            );
+        ELSE
+            PERFORM bump_author_statistics(
+                (
+                    SELECT {parent}.{author} FROM {parent}
+                    WHERE {parent}.id = OLD.{parent}_id
+                ),
+                '{counter}',
+                -1
+            );
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_CHILD_TRIGGER = """
+    CREATE TRIGGER {table}_author_statistics
+    AFTER INSERT OR DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION count_{table}_statistics();
+"""
+
+COUNT_JOB_VIEW_FUNCTION = """
+    CREATE OR REPLACE FUNCTION count_job_view_statistics()
+    RETURNS trigger AS $$
+    DECLARE
+        target_author integer;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            target_author := (
+                SELECT job.author_id FROM job WHERE job.id = OLD.job_id
+            );
+            PERFORM bump_author_statistics(target_author, 'jobs_views', -1);
+            IF OLD.user_id = target_author THEN
+                PERFORM bump_author_statistics(
+                    target_author, 'proposals_views', -OLD.proposals_views
+                );
+            END IF;
+            RETURN NULL;
+        END IF;
+        target_author := (
+            SELECT job.author_id FROM job WHERE job.id = NEW.job_id
+        );
+        IF TG_OP = 'INSERT' THEN
+            PERFORM bump_author_statistics(target_author, 'jobs_views', 1);
+            IF NEW.user_id = target_author THEN
+                PERFORM bump_author_statistics(
+                    target_author, 'proposals_views', NEW.proposals_views
+                );
+            END IF;
+        ELSIF NEW.user_id = target_author THEN
+            PERFORM bump_author_statistics(
+                target_author,
+                'proposals_views',
+                NEW.proposals_views - OLD.proposals_views
+            );
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+COUNT_JOB_VIEW_TRIGGER = """
+    CREATE TRIGGER job_view_author_statistics
+    AFTER INSERT OR DELETE OR UPDATE OF proposals_views ON job_view
+    FOR EACH ROW EXECUTE FUNCTION count_job_view_statistics();
+"""
+
+# Колонки ответов, по которым фильтруется и сортируется доска откликов;
+# на каждое поле строится частичный индекс (proposal_id, колонка).
+ANSWER_INDEX_COLUMNS = (
+    NumberAnswer.value,
+    SingleChoiceAnswer.choice_id,
+    MultipleChoiceAnswer.choice_id,
+)
+
+# Колонки FileType, файлы которых хранятся по содержимому.
+BLOB_COLUMNS = (MediaFile.file, EducationCertificateFile.file)
+
+# Модель, исходная колонка цены и нормализованная колонка.
+PRICED_MODELS = (
+    (Job, Job.budget, Job.normalized_budget),
+    (
+        UserSpecialization,
+        UserSpecialization.price,
+        UserSpecialization.normalized_price,
+    ),
+    (Mentorship, Mentorship.price, Mentorship.normalized_price),
+)
+
+
+def _listen(table: Table, *statements: str) -> None:
+    for statement in statements:
+        # DDL подставляет %(table)s и т.п., литеральный % экранируется.
+        event.listen(
+            table, "after_create", DDL(statement.replace("%", "%%"))
+        )
+
+
+for model, m2m in ((Job, JobSpecializations), (Event, EventSpecializations)):
+    table = model.__tablename__
+    _listen(
+        m2m.__table__,
+        SYNC_SPECIALIZATIONS_FUNCTION.format(table=table),
+        SYNC_SPECIALIZATIONS_TRIGGER.format(table=table),
+    )
+    _listen(
+        model.__table__,
+        SYNC_COUNTRY_FUNCTION.format(table=table),
+        SYNC_COUNTRY_TRIGGER.format(table=table),
+    )
+
+for model, source, target in PRICED_MODELS:
+    names = {
+        "table": model.__tablename__,
+        "source": source.key,
+        "target": target.key,
+    }
+    _listen(
+        model.__table__,
+        NORMALIZE_PRICE_FUNCTION.format(**names),
+        NORMALIZE_PRICE_TRIGGER.format(**names),
+    )
+
+_listen(
+    ExchangeRate.__table__,
+    RENORMALIZE_PRICES_FUNCTION.format(
+        statements="".join(
+            RENORMALIZE_STATEMENT.format(
+                table=model.__tablename__,
+                source=source.key,
+                target=target.key,
+            )
+            for model, source, target in PRICED_MODELS
+        )
+    ),
+    RENORMALIZE_PRICES_TRIGGER,
+)
+
+_listen(
+    EventParticipants.__table__,
+    PARTICIPANTS_UNIQUE_INDEX,
+    COUNT_PARTICIPANTS_FUNCTION,
+    COUNT_PARTICIPANTS_TRIGGER,
+)
+
+for column in BLOB_COLUMNS:
+    names = {"table": column.class_.__tablename__, "column": column.key}
+    _listen(
+        column.class_.__table__,
+        COUNT_BLOB_REFS_FUNCTION.format(**names),
+        COUNT_BLOB_REFS_TRIGGER.format(**names),
+    )
+
+_listen(
+    ProposalTableCustomField.__table__,
+    CUSTOM_FIELD_INDEXES_FUNCTION.format(
+        create="".join(
+            CREATE_ANSWER_INDEX.format(
+                table=column.class_.__tablename__, column=column.key
+            )
+            for column in ANSWER_INDEX_COLUMNS
+        ),
+        drop="".join(
+            DROP_ANSWER_INDEX.format(table=column.class_.__tablename__)
+            for column in ANSWER_INDEX_COLUMNS
+        ),
+    ),
+    CUSTOM_FIELD_INDEXES_TRIGGER.format(
+        table=ProposalTableCustomField.__tablename__
+    ),
+)
+
+_listen(AuthorStatistics.__table__, BUMP_AUTHOR_STATISTICS_FUNCTION)
+
+for author, children in (
+    (Job.author_id, COUNT_JOB_CHILDREN_FUNCTION),
+    (Event.creator_id, COUNT_EVENT_CHILDREN_FUNCTION),
+):
+    names = {"table": author.class_.__tablename__, "author": author.key}
+    _listen(
+        author.class_.__table__,
+        children,
+        COUNT_AUTHOR_STATUS_FUNCTION.format(**names),
+        COUNT_AUTHOR_STATUS_TRIGGER.format(**names),
+        DISCOUNT_CHILDREN_FUNCTION.format(**names),
+        DISCOUNT_CHILDREN_TRIGGER.format(**names),
+    )
+
+for model, author, counter in (
+    (Proposal, Job.author_id, "proposals_count"),
+    (EventParticipants, Event.creator_id, "participants_count"),
+):
+    names = {
+        "table": model.__tablename__,
+        "parent": author.class_.__tablename__,
+        "author": author.key,
+        "counter": counter,
+    }
+    _listen(
+        model.__table__,
+        COUNT_CHILD_FUNCTION.format(**names),
+        COUNT_CHILD_TRIGGER.format(**names),
+    )
+
+_listen(JobView.__table__, COUNT_JOB_VIEW_FUNCTION, COUNT_JOB_VIEW_TRIGGER)
@@ -1,3 +1,4 @@
+from .author_statistics import AuthorStatistics
 from .direction import Direction
 from .education import Education
 from .link import Link
@@ -23,4 +24,5 @@ __all__ = [
     "Mentorship",
     "Education",
     "PrivateSite",
+    "AuthorStatistics",
 ]
@@ -0,0 +1,48 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models.base import Base
+
+
+class AuthorStatistics(Base):
+    """
+    Счётчики дашборда автора вакансий и мероприятий.
+
+    Строки поддерживаются триггерами на job, event, proposal, job_view
+    и event_participants (см. models/triggers.py), поэтому чтение - это
+    поиск по первичному ключу.
+
+    # Attrs:
+        - user_id: int (PK, FK) - Идентификатор автора
+        - proposals_views: int - Сумма proposals_views из просмотров
+          автором своих вакансий; новые отклики - proposals_count минус
+          это значение
+    """
+
+    __tablename__ = "author_statistics"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    archived_jobs_count: Mapped[int] = mapped_column(
+        Integer, server_default="0"
+    )
+    draft_jobs_count: Mapped[int] = mapped_column(Integer, server_default="0")
+    published_jobs_count: Mapped[int] = mapped_column(
+        Integer, server_default="0"
+    )
+    proposals_count: Mapped[int] = mapped_column(Integer, server_default="0")
+    proposals_views: Mapped[int] = mapped_column(Integer, server_default="0")
+    jobs_views: Mapped[int] = mapped_column(Integer, server_default="0")
+    archived_events_count: Mapped[int] = mapped_column(
+        Integer, server_default="0"
+    )
+    draft_events_count: Mapped[int] = mapped_column(
+        Integer, server_default="0"
+    )
+    published_events_count: Mapped[int] = mapped_column(
+        Integer, server_default="0"
+    )
+    participants_count: Mapped[int] = mapped_column(
+        Integer, server_default="0"
+    )
@@ -1,6 +1,7 @@
+from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Integer, Numeric, String
 from sqlalchemy.dialects.postgresql import ARRAY, ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import expression
@@ -50,6 +51,7 @@ class Mentorship(Base, CustomTranslatableMixin):
         - first_is_free: bool - Сначала бесплатно или нет.
         - currency: Currency - Валюта для оплаты (из констант).
         - payment_per: PaymentPer - За какой период оплата (из констант).
+        - normalized_price: Decimal - Цена в рублях по курсу ExchangeRate.
         - user_id: int (FK) - Идентификатор пользователя.
         - user: User - Пользователи связанные с наставничеством.
         - demands: list[Keyword] - Требования для наставничества.
@@ -82,6 +84,10 @@ class Mentorship(Base, CustomTranslatableMixin):
     payment_per: Mapped[Optional[PaymentPer]] = mapped_column(
         ENUM(PaymentPer, create_type=False)
     )
+    # Цена в рублях по курсу ExchangeRate, считается триггером.
+    normalized_price: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(18, 2), index=True
+    )
 
     user_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("user.id", ondelete="CASCADE")
@@ -80,6 +80,10 @@ class User(Base):
     profile_cover: Mapped[Optional[FileType]] = mapped_column(
         FileType(storage=users_storage)
     )
+    # Созданные варианты изображений по имени файла, см. services.images.
+    image_variants: Mapped[dict[str, list[str]]] = mapped_column(
+        JSONB, default=dict, server_default="{}"
+    )
     schedule: Mapped[Optional[dict]] = mapped_column(JSONB, default=JSONB.NULL)
     hashed_password: Mapped[str] = mapped_column(String, nullable=True)
     is_email_verified: Mapped[bool] = mapped_column(
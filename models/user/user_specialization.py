@@ -1,7 +1,8 @@
 import uuid
+from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Integer, Numeric, String
 from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import expression
@@ -41,6 +42,10 @@ class UserSpecialization(Base, CustomTranslatableMixin):
     payment_per: Mapped[Optional[PaymentPer]] = mapped_column(
         ENUM(PaymentPer, create_type=False)
     )
+    # Цена в рублях по курсу ExchangeRate, считается триггером.
+    normalized_price: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(18, 2), index=True
+    )
     is_ready_to_move: Mapped[bool] = mapped_column(
         Boolean, server_default=expression.false()
     )
@@ -1,8 +1,7 @@
 from datetime import datetime, UTC
-from typing import List, Optional, Self, Any, Dict
+from typing import List, Optional, Self, Any, ClassVar, Dict
 from uuid import UUID
 
-from fastapi import UploadFile
 from fastapi.exceptions import RequestValidationError
 from pydantic import (
     BaseModel,
@@ -14,12 +13,15 @@ from pydantic import (
     model_validator,
     validator,
 )
+from sqlalchemy.orm import InstrumentedAttribute
 
 from constants.event import EventType, RegistrationEndType, ReminderUnits
 from constants.i18n import EventLanguage
+from constants.images import ImageVariant
 from models import Event, EventParticipants
 from schemas.city import CityWithCountryResponse
 from schemas.frilance.proposal_status import ProposalStatusResponse
+from schemas.images import PhotoVariantsMixin
 from schemas.mixins import ExplicitFieldsParseJsonMixin, ParseFromJsonMixin
 from schemas.organisation.organisation import OrganisationShortResponse
 from schemas.specialization import SpecializationWithDirectionResponse
@@ -234,6 +236,7 @@ class EventCreate(EventValidationMixin, BaseEvent):
     is_free: bool
     is_online: bool
     timezone_id: int
+    max_participants: Optional[PositiveInt] = None
     city_id: Optional[PositiveInt] = None
     places: Optional[List[EventPlacesBase]] = Field(default_factory=list)
     online_links: Optional[List[str]] = Field(default_factory=list)
@@ -261,6 +264,7 @@ class EventUpdate(ExplicitFieldsParseJsonMixin):
     is_free: Optional[bool] = None
     is_online: Optional[bool] = None
     timezone: Optional[TimezoneCreate] = None
+    max_participants: Optional[PositiveInt] = None
     city_id: Optional[PositiveInt] = None
     places: Optional[List[EventPlacesBase]] = None
     online_links: Optional[List[str]] = None
@@ -288,6 +292,7 @@ class EventCreateDraft(ParseFromJsonMixin):
     is_free: Optional[bool] = None
     is_online: Optional[bool] = None
     timezone: Optional[TimezoneCreate] = None
+    max_participants: Optional[PositiveInt] = None
     city_id: Optional[PositiveInt] = None
     places: Optional[List[EventPlacesBase]] = Field(default_factory=list)
     online_links: Optional[List[str]] = Field(default_factory=list)
@@ -311,8 +316,8 @@ class EventCreateDraft(ParseFromJsonMixin):
 
 class EventCreateDB(BaseModel):
     creator_id: Optional[int] = None
-    photo: Optional[UploadFile] = None
-    event_cover: Optional[UploadFile] = None
+    photo: Optional[str] = None
+    event_cover: Optional[str] = None
     title: str
     description: Optional[str] = ""
     language: Optional[EventLanguage] = None
@@ -321,6 +326,7 @@ class EventCreateDB(BaseModel):
     is_free: Optional[bool] = True
     is_online: Optional[bool] = False
     timezone_id: Optional[PositiveInt] = None
+    max_participants: Optional[PositiveInt] = None
     city_id: Optional[PositiveInt] = None
     places: Optional[List[EventPlacesBase]] = None
     online_links: Optional[List[str]] = None
@@ -343,6 +349,7 @@ class EventUpdateDB(BaseModel):
     is_free: Optional[bool] = None
     is_online: Optional[bool] = None
     timezone_id: Optional[PositiveInt] = None
+    max_participants: Optional[PositiveInt] = None
     city_id: Optional[PositiveInt] = None
     places: Optional[List[EventPlacesBase]] = None
     online_links: Optional[List[str]] = None
@@ -355,13 +362,21 @@ class EventUpdateDB(BaseModel):
     is_archived: Optional[bool] = None
 
 
-class EventSimpleResponse(BaseEvent):
+class EventSimpleResponse(PhotoVariantsMixin, BaseEvent):
+    image_fields: ClassVar[dict[str, InstrumentedAttribute]] = {
+        "photo": Event.photo,
+        "event_cover": Event.event_cover,
+    }
+
     id: int
     photo: Optional[str] = None
     event_cover: Optional[str] = None
+    event_cover_variants: dict[ImageVariant, str] = {}
     event_type: Optional[EventType] = None
     places: Optional[List[EventPlacesBase]] = []
     online_links: Optional[List[str]]
+    max_participants: Optional[int] = None
+    registered_count: Optional[int] = None
     reminders: Optional[List[EventReminderResponse]] = []
 
 
@@ -448,6 +463,20 @@ class EventParticipantCreate(BaseModel):
     event_id: int
 
 
+class EventParticipantShortResponse(PhotoVariantsMixin):
+    uid: UUID
+    first_name: str
+    second_name: str
+    username: Optional[str] = None
+    photo: Optional[str] = None
+
+
+class EventParticipantsPageResponse(BaseModel):
+    objects: List[EventParticipantShortResponse]
+    total: int
+    next_after_id: Optional[int] = None
+
+
 class EventParticipantResponse(BaseModel):
     user: UserEventResponse
     updated_by: Optional[UserEventResponse] = None
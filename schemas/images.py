@@ -0,0 +1,55 @@
+from typing import Any, ClassVar, Mapping, Optional
+
+from pydantic import (
+    BaseModel,
+    ValidatorFunctionWrapHandler,
+    model_validator,
+)
+from sqlalchemy.orm import InstrumentedAttribute
+
+from constants.images import ImageVariant
+from models import User
+from services.storage import get_storage
+from utilities.images import get_file_name, get_variant_urls
+
+
+class PhotoVariantsMixin(BaseModel):
+    """
+    Ссылки на созданные варианты изображений: `<поле>_variants`.
+
+    Варианты берутся из image_variants объекта из базы. Если исходные
+    данные не из базы (например, ответ из кэша), ссылки остаются
+    такими, какими пришли.
+    """
+
+    image_fields: ClassVar[dict[str, InstrumentedAttribute]] = {
+        "photo": User.photo,
+    }
+
+    photo: Optional[str] = None
+    photo_variants: dict[ImageVariant, str] = {}
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def add_image_variants(
+        cls, values: Any, handler: ValidatorFunctionWrapHandler
+    ) -> Any:
+        obj = handler(values)
+        # Только загруженные атрибуты, без ленивой загрузки.
+        data = (
+            values
+            if isinstance(values, Mapping)
+            else getattr(values, "__dict__", {})
+        )
+        variants = data.get("image_variants")
+        if variants is None:
+            return obj
+        for field, column in cls.image_fields.items():
+            storage = get_storage(column)
+            name = get_file_name(storage, data.get(field))
+            setattr(
+                obj,
+                f"{field}_variants",
+                get_variant_urls(storage, name, variants.get(name, ())),
+            )
+        return obj
@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, PositiveInt
+
+from constants.publication import (
+    PUBLICATION_BULK_MAX_SIZE,
+    PublicationErrorCode,
+)
+
+
+class PublicationBulkRequest(BaseModel):
+    ids: List[PositiveInt] = Field(
+        min_length=1, max_length=PUBLICATION_BULK_MAX_SIZE
+    )
+
+
+class PublicationStateResponse(BaseModel):
+    id: int
+    is_draft: bool
+    is_archived: bool
+    published_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PublicationBulkResponse(BaseModel):
+    objects: List[PublicationStateResponse]
+    errors: dict[int, PublicationErrorCode]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class AuthorStatisticsResponse(BaseModel):
+    archived_jobs_count: int = 0
+    draft_jobs_count: int = 0
+    published_jobs_count: int = 0
+    proposals_count: int = 0
+    new_proposals_count: int = 0
+    jobs_views: int = 0
+    archived_events_count: int = 0
+    draft_events_count: int = 0
+    published_events_count: int = 0
+    participants_count: int = 0
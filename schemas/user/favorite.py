@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PositiveInt
+
+from constants.favorite import FAVORITES_BULK_LIMIT
 
 
 class FavoriteBase(BaseModel):
@@ -9,3 +11,9 @@ class FavoriteBase(BaseModel):
     organisation_id: Optional[int]
     event_id: Optional[int]
     job_id: Optional[int]
+
+
+class FavoriteIds(BaseModel):
+    ids: list[PositiveInt] = Field(
+        min_length=1, max_length=FAVORITES_BULK_LIMIT
+    )
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from constants.favorite import FavoriteTarget
+from schemas.event import EventSimpleResponse
+from schemas.frilance.job import JobSimpleResponse
+from schemas.organisation.organisation import OrganisationFavoriteResponse
+from schemas.user.user import UserSimpleResponse
+
+
+class FavoriteFeedItem(BaseModel):
+    id: int
+    target: FavoriteTarget
+    event: Optional[EventSimpleResponse] = None
+    job: Optional[JobSimpleResponse] = None
+    organisation: Optional[OrganisationFavoriteResponse] = None
+    user: Optional[UserSimpleResponse] = None
+
+
+class FavoriteFeedResponse(BaseModel):
+    objects: list[FavoriteFeedItem]
+    totals: dict[FavoriteTarget, int]
+    next_after_id: Optional[int] = None
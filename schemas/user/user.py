@@ -1,15 +1,19 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import ClassVar, Optional
 from uuid import UUID
 
 from email_validator import validate_email
 from pydantic import BaseModel, PositiveInt, model_validator
 from pydantic.class_validators import validator
+from sqlalchemy.orm import InstrumentedAttribute
 
 from constants.i18n import Languages
+from constants.images import ImageVariant
+from models import User
 from schemas.city import CityWithCountryResponse
 from schemas.common import PasswordBase
 from schemas.email_validator import EmailStrLower
+from schemas.images import PhotoVariantsMixin
 from schemas.social_network import SocialNetworkResponse
 from schemas.specialization import SpecializationWithDirectionResponse
 from schemas.timezone import TimezoneResponse
@@ -50,12 +54,18 @@ class UserUpdate(BaseModel):
     timezone_id: Optional[PositiveInt] = None
 
 
-class UserSimpleResponse(UserBase):
+class UserSimpleResponse(PhotoVariantsMixin, UserBase):
+    image_fields: ClassVar[dict[str, InstrumentedAttribute]] = {
+        "photo": User.photo,
+        "profile_cover": User.profile_cover,
+    }
+
     uid: UUID
     username: Optional[str] = None
     photo: Optional[str] = None
     last_visited_at: Optional[datetime] = None
     profile_cover: Optional[str] = None
+    profile_cover_variants: dict[ImageVariant, str] = {}
 
 
 class UserResponse(UserSimpleResponse):
@@ -86,7 +96,7 @@ class UserPhotosResponse(BaseModel):
     profile_cover: Optional[str] = None
 
 
-class UserParticipantResponse(UserBase):
+class UserParticipantResponse(PhotoVariantsMixin, UserBase):
     id: int
     photo: Optional[str] = None
     social_networks: list[SocialNetworkResponse]
@@ -96,7 +106,7 @@ class UserParticipantResponse(UserBase):
         from_attributes = True
 
 
-class UserEventResponse(BaseModel):
+class UserEventResponse(PhotoVariantsMixin):
     first_name: str
     second_name: str
     photo: Optional[str] = None
@@ -0,0 +1,88 @@
+"""
+Архивация завершившихся мероприятий и вакансий с истёкшим сроком.
+
+Запускается отдельным процессом и повторяется каждые
+ARCHIVE_INTERVAL секунд:
+
+    python -m services.archiver
+"""
+
+import asyncio
+from typing import Optional
+
+from redis import Redis
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from configs.loggers import logger
+from constants.archive import ARCHIVE_BATCH_SIZE, ARCHIVE_INTERVAL
+from crud.crud_mixins import ArchiveAsync
+from crud.event import crud_event
+from crud.frilance.job import crud_job
+from models import Event, Job
+from services.user.author_statistics import invalidate_author_statistics
+
+ARCHIVE_TARGETS = (
+    (crud_event, Event.end_datetime),
+    (crud_job, Job.deadline),
+)
+
+
+async def archive_expired(
+    db: AsyncSession,
+    crud: ArchiveAsync,
+    column: InstrumentedAttribute,
+    redis: Optional[Redis] = None,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+) -> int:
+    """
+    Архивирует записи, у которых `column` в прошлом, пачками по id.
+
+    Каждая пачка фиксируется отдельной транзакцией, поэтому
+    блокировки держатся только на время одного UPDATE. Статистика
+    авторов заархивированных записей сбрасывается после фиксации.
+    """
+
+    archived = 0
+    after_id = 0
+    while True:
+        rows = await crud.archive_batch(
+            db,
+            expired=column <= func.now(),
+            after_id=after_id,
+            limit=batch_size,
+        )
+        await db.commit()
+        for owner_id in {row.owner_id for row in rows}:
+            await invalidate_author_statistics(redis=redis, user_id=owner_id)
+        archived += len(rows)
+        if len(rows) < batch_size:
+            return archived
+        after_id = rows[-1].id
+
+
+async def archive_all(db: AsyncSession, redis: Optional[Redis] = None) -> None:
+    for crud, column in ARCHIVE_TARGETS:
+        try:
+            archived = await archive_expired(db, crud, column, redis=redis)
+        except Exception as ex:
+            await db.rollback()
+            logger.error(ex)
+            continue
+        logger.info(f"{column}: archived {archived} rows")
+
+
+async def run_archiver(interval: int = ARCHIVE_INTERVAL) -> None:
+    from api.dependencies.redis import get_redis
+    from databases.database import get_async_session
+
+    while True:
+        async for db in get_async_session():
+            async for redis in get_redis():
+                await archive_all(db, redis=redis)
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_archiver())
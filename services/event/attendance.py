@@ -0,0 +1,52 @@
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.event import crud_event
+from crud.status import crud_status
+from utilities.exception import OperationConstraintError
+
+EVENT_CAPACITY_CONSTRAINT = "event_capacity_check"
+
+async def attend(
+    db: AsyncSession, event_id: int, user_id: int
+) -> Optional[int]:
+    """
+    Регистрирует пользователя на мероприятие.
+
+    Возвращает id автора мероприятия или None, если мероприятия нет
+    или пользователь уже зарегистрирован. Лимит участников
+    проверяется в БД атомарно, при его превышении поднимается
+    OperationConstraintError.
+    """
+
+    status_id = await crud_status.get_new_status_id(db)
+    try:
+        creator_id = await crud_event.add_participant(
+            db=db, event_id=event_id, user_id=user_id, status_id=status_id
+        )
+    except IntegrityError as ex:
+        await db.rollback()
+        if EVENT_CAPACITY_CONSTRAINT in str(ex.orig):
+            raise OperationConstraintError(
+                "The event has reached its participant limit."
+            ) from ex
+        raise ex
+    await db.commit()
+    return creator_id
+
+
+async def cancel_attendance(
+    db: AsyncSession, event_id: int, user_id: int
+) -> Optional[int]:
+    """
+    Отменяет регистрацию, возвращает id автора мероприятия или None,
+    если регистрации не было.
+    """
+
+    creator_id = await crud_event.remove_participant(
+        db=db, event_id=event_id, user_id=user_id
+    )
+    await db.commit()
+    return creator_id
@@ -1,15 +1,13 @@
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Union
 
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from constants.event import RegistrationEndType
-from crud.city import crud_city
 from crud.event import crud_event
-from crud.organisation.organisation import crud_organisation
-from crud.specialization import crud_specialization
-from crud.user import crud_user
-from models import Event
+from crud.existence import check_relations
+from models import City, Event, Organisation, Specialization, User
 from schemas.event import (
     EventCreate,
     EventCreateDB,
@@ -18,9 +16,19 @@ from schemas.event import (
     EventUpdateDB,
 )
 from schemas.user.contact_person import ContactPersonAddCreateMulty
+from services.images import create_variants, set_image_variants
+from services.storage import get_storage, upload_files
 from services.timezone import get_timezone_by_tzcode
 from services.user.contact_person import add_create_contact_persons
-from utilities.queryset import check_found
+from utilities.exception import OperationConstraintError
+from utilities.images import get_file_name
+
+EVENT_RELATIONS = {
+    "organizers": ("organizers_uids", User.uid),
+    "speakers": ("speakers_uids", User.uid),
+    "specializations": ("specializations_ids", Specialization.id),
+    "organisations": ("organisations_ids", Organisation.id),
+}
 
 
 async def create(
@@ -33,11 +41,7 @@ async def create(
     event_cover: Optional[UploadFile] = None,
 ) -> Event:
     try:
-        if create_data.city_id:
-            found_city = await crud_city.get_multi_by_ids(
-                db=db, ids=[create_data.city_id]
-            )
-            await check_found(found_city, [create_data.city_id])
+        members = await check_event_relations(db=db, data=create_data)
 
         create_data_dict = create_data.model_dump(exclude_unset=True)
         if create_data.timezone:
@@ -55,44 +59,23 @@ async def create(
             create_data_dict["registration_end_datetime"] = (
                 create_data.start_datetime
             )
+        images, variants = await upload_images(
+            photo=photo, event_cover=event_cover
+        )
         event_create = EventCreateDB(
-            **create_data_dict,
-            creator_id=user_id,
-            photo=photo if photo else None,
-            event_cover=event_cover if event_cover else None,
+            **create_data_dict, **images, creator_id=user_id
         )
         event = await crud_event.create(
             db=db, create_schema=event_create, commit=False
         )
-        if create_data.organizers_uids:
-            found_organizers = await crud_user.get_multi_by_uids(
-                db=db, uids=create_data.organizers_uids
-            )
-            await check_found(found_organizers, create_data.organizers_uids)
-            event.organizers = found_organizers
-
-        if create_data.speakers_uids:
-            found_speakers = await crud_user.get_multi_by_uids(
-                db=db, uids=create_data.speakers_uids
-            )
-            await check_found(found_speakers, create_data.speakers_uids)
-            event.speakers = found_speakers
-        if create_data.specializations_ids:
-            found_specializations = await crud_specialization.get_multi_by_ids(
-                db=db, ids=create_data.specializations_ids
-            )
-            await check_found(
-                found_specializations, create_data.specializations_ids
-            )
-            event.specializations = found_specializations
-        if create_data.organisations_ids:
-            found_organizations = await crud_organisation.get_multi_by_ids(
-                db=db, ids=create_data.organisations_ids
-            )
-            await check_found(
-                found_organizations, create_data.organisations_ids
-            )
-            event.organisations = found_organizations
+        set_image_variants(event, variants)
+        await crud_event.add_members(
+            db=db, event_id=event.id, members=members
+        )
+        db.expire(
+            event,
+            ["organizers", "speakers", "specializations", "organisations"],
+        )
 
         if contact_person_data.data:
             await add_create_contact_persons(
@@ -121,13 +104,17 @@ async def update(
     event_cover: Optional[UploadFile] = None,
 ) -> Event:
     try:
-        if update_data.city_id:
-            found_city = await crud_city.get_multi_by_ids(
-                db=db, ids=[update_data.city_id]
-            )
-            await check_found(found_city, [update_data.city_id])
+        members = await check_event_relations(db=db, data=update_data)
 
         update_data_dict = update_data.model_dump(exclude_unset=True)
+        if (
+            update_data.max_participants
+            and update_data.max_participants < event.registered_count
+        ):
+            raise OperationConstraintError(
+                "The participant limit is lower than the number "
+                "of registered participants."
+            )
         if update_data.timezone:
             found_timezone = await get_timezone_by_tzcode(
                 db=db, schema=update_data.timezone
@@ -159,55 +146,17 @@ async def update(
 
         await db.flush(event)
 
-        if isinstance(update_data.organisations_ids, list):
-            if update_data.organisations_ids:
-                found_organizations = await crud_organisation.get_multi_by_ids(
-                    db=db, ids=update_data.organisations_ids
-                )
-                await check_found(
-                    found_organizations, update_data.organisations_ids
-                )
-                event.organisations = found_organizations
-            else:
-                event.organisations = []
-        if isinstance(update_data.organizers_uids, list):
-            if update_data.organizers_uids:
-                found_organizers = await crud_user.get_multi_by_uids(
-                    db=db, uids=update_data.organizers_uids
-                )
-                await check_found(
-                    found_organizers, update_data.organizers_uids
-                )
-                event.organizers = found_organizers
-            else:
-                event.organizers = []
-        if isinstance(update_data.speakers_uids, list):
-            if update_data.speakers_uids:
-                found_speakers = await crud_user.get_multi_by_uids(
-                    db=db, uids=update_data.speakers_uids
-                )
-                await check_found(found_speakers, update_data.speakers_uids)
-                event.speakers = found_speakers
-            else:
-                event.speakers = []
-        if isinstance(update_data.specializations_ids, list):
-            if update_data.specializations_ids:
-                found_specializations = (
-                    await crud_specialization.get_multi_by_ids(
-                        db=db, ids=update_data.specializations_ids
-                    )
-                )
-                await check_found(
-                    found_specializations, update_data.specializations_ids
-                )
-                event.specializations = found_specializations
-            else:
-                event.specializations = []
-
-        if photo:
-            event.photo = photo
-        if event_cover:
-            event.event_cover = event_cover
+        await crud_event.set_members(
+            db=db, event_id=event.id, members=members
+        )
+        db.expire(event, list(members))
+
+        images, variants = await upload_images(
+            photo=photo, event_cover=event_cover
+        )
+        for field, name in images.items():
+            setattr(event, field, name)
+        set_image_variants(event, variants)
 
         event.contact_persons = []
         if contact_person_data.data:
@@ -226,3 +175,63 @@ async def update(
     except Exception as ex:
         await db.rollback()
         raise ex
+
+
+async def check_event_relations(
+    db: AsyncSession, data: Union[EventCreateDraft, EventUpdate]
+) -> dict[str, set[int]]:
+    """
+    Проверяет город и связи мероприятия одним запросом.
+
+    Возвращает id для каждой связи, переданной списком; связи со
+    значением None в результат не попадают.
+    """
+
+    checks = {"cities": (City.id, [data.city_id] if data.city_id else [])}
+    for relation, (field, column) in EVENT_RELATIONS.items():
+        values = getattr(data, field)
+        if isinstance(values, list):
+            checks[relation] = (column, values)
+    found = await check_relations(db, checks)
+    return {
+        relation: set(found[relation].values())
+        for relation in EVENT_RELATIONS
+        if relation in checks
+    }
+
+
+async def upload_images(
+    photo: Optional[UploadFile] = None,
+    event_cover: Optional[UploadFile] = None,
+) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """
+    Загружает фото и обложку параллельно.
+
+    Возвращает имена файлов по полям и созданные варианты по именам
+    файлов. Варианты строятся из уже полученных файлов, повторно из
+    хранилища оригиналы не читаются.
+    """
+
+    images = {
+        field: file
+        for field, file in (("photo", photo), ("event_cover", event_cover))
+        if file
+    }
+    storage = get_storage(Event.photo)
+    stored_files = await upload_files(storage, list(images.values()))
+    variants = await asyncio.gather(
+        *(
+            create_variants(storage, stored_file.name, file.file)
+            for file, stored_file in zip(images.values(), stored_files)
+        )
+    )
+    return (
+        {
+            field: stored_file.name
+            for field, stored_file in zip(images, stored_files)
+        },
+        {
+            get_file_name(storage, stored_file.name): created
+            for stored_file, created in zip(stored_files, variants)
+        },
+    )
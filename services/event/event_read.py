@@ -14,6 +14,7 @@ from models import Event
 from schemas.endpoints.paginated_response import EventPaginatedResponse
 from schemas.endpoints.pagination import DefaultPagination
 from schemas.event_view import EventView
+from services.event.event_recommendation import get_recommended_event_ids
 from services.redis import get_browsing_now_by_id
 from utilities.queryset import check_found
 
@@ -105,6 +106,32 @@ async def read_events(
     return await _add_browsing_now(events=events, redis=redis)
 
 
+async def read_recommended_events(
+    db: AsyncSession,
+    redis: Redis,
+    pagination: DefaultPagination,
+    current_user_id: int,
+    current_user_ip: Optional[str],
+    locale: Languages,
+) -> EventPaginatedResponse:
+    ids = await get_recommended_event_ids(
+        db=db, redis=redis, user_id=current_user_id
+    )
+    events = await crud_ewc.get_multi(
+        db,
+        locale=locale,
+        pagination=pagination,
+        current_user_id=current_user_id,
+        current_user_ip=current_user_ip,
+        favorite=False,
+        ids=ids,
+    )
+    events = EventPaginatedResponse.model_validate(
+        events, from_attributes=True
+    )
+    return await _add_browsing_now(events=events, redis=redis)
+
+
 async def read_events_by_author(
     db: AsyncSession,
     redis: Redis,
@@ -0,0 +1,49 @@
+import json
+from typing import Optional
+
+from redis import Redis
+from redis.asyncio import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.loggers import logger
+from constants.event_recommendation import (
+    EVENT_RECOMMENDATIONS_KEY,
+    EVENT_RECOMMENDATIONS_TOP_K,
+    EVENT_RECOMMENDATIONS_TTL,
+)
+from crud.event_recommendation import crud_event_recommendation
+
+
+async def get_recommended_event_ids(
+    db: AsyncSession, redis: Optional[Redis], user_id: int
+) -> list[int]:
+    """Возвращает top-k рекомендованных мероприятий из кэша или из БД."""
+
+    key = EVENT_RECOMMENDATIONS_KEY.format(user_id=user_id)
+    if redis is not None:
+        try:
+            if cached := await redis.get(key):
+                return json.loads(cached)
+        except RedisError as ex:
+            logger.error(ex)
+
+    ids = await crud_event_recommendation.get_ranked_ids(
+        db, user_id=user_id, limit=EVENT_RECOMMENDATIONS_TOP_K
+    )
+    if redis is not None:
+        try:
+            await redis.set(key, json.dumps(ids), ex=EVENT_RECOMMENDATIONS_TTL)
+        except RedisError as ex:
+            logger.error(ex)
+    return ids
+
+
+async def invalidate_event_recommendations(
+    redis: Optional[Redis], user_id: int
+) -> None:
+    if redis is None:
+        return
+    try:
+        await redis.delete(EVENT_RECOMMENDATIONS_KEY.format(user_id=user_id))
+    except RedisError as ex:
+        logger.error(ex)
@@ -0,0 +1,58 @@
+from typing import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.favorite import FavoriteTarget
+from crud.favorite import crud_favorite
+from utilities.exception import SomeObjectsNotFoundError
+
+
+async def add_favorites(
+    db: AsyncSession,
+    user_id: int,
+    target: FavoriteTarget,
+    ids: Iterable[int],
+) -> list[int]:
+    """
+    Добавляет объекты в избранное одним INSERT ... ON CONFLICT.
+
+    Возвращает id добавленных объектов: уже избранные пропускаются,
+    а несуществующие приводят к SomeObjectsNotFoundError.
+    """
+
+    ids = set(ids)
+    found_ids = await crud_favorite.get_target_ids(
+        db=db, target=target, ids=ids
+    )
+    if missing_ids := ids - found_ids:
+        raise SomeObjectsNotFoundError(
+            f"{target} with ids {sorted(missing_ids)} not found"
+        )
+    return await crud_favorite.add_many(
+        db=db, user_id=user_id, target=target, ids=sorted(ids)
+    )
+
+
+async def remove_favorites(
+    db: AsyncSession,
+    user_id: int,
+    target: FavoriteTarget,
+    ids: Iterable[int],
+) -> list[int]:
+    """Удаляет объекты из избранного и возвращает id удалённых."""
+
+    return await crud_favorite.remove_many(
+        db=db, user_id=user_id, target=target, ids=set(ids)
+    )
+
+
+async def is_favorite(
+    db: AsyncSession,
+    user_id: int,
+    target: FavoriteTarget,
+    obj_id: int,
+) -> bool:
+    favorite_ids = await crud_favorite.get_favorite_ids(
+        db=db, user_id=user_id, target=target, ids=[obj_id]
+    )
+    return obj_id in favorite_ids
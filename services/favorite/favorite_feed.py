@@ -0,0 +1,86 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from constants.favorite import FavoriteTarget
+from crud.favorite import crud_favorite
+from models import Favorite
+from schemas.user.favorite_feed import FavoriteFeedItem, FavoriteFeedResponse
+
+
+async def get_favorites_feed(
+    db: AsyncSession,
+    user_id: int,
+    limit: int,
+    after_id: Optional[int] = None,
+) -> FavoriteFeedResponse:
+    """
+    Общая лента избранного с ключевой пагинацией по id записи.
+
+    Итоги по типам считаются одним запросом, а объекты текущей
+    страницы подгружаются параллельно, по сессии на каждый тип.
+    Записи, чьи объекты не проходят условия цели (например, ставшие
+    черновиками мероприятия), в страницу не попадают; next_after_id
+    всё равно считается по записям, поэтому пропусков нет.
+    """
+
+    totals = await crud_favorite.get_totals(db=db, user_id=user_id)
+    favorites = await crud_favorite.get_feed_page(
+        db=db, user_id=user_id, limit=limit + 1, after_id=after_id
+    )
+    next_after_id = favorites[limit - 1].id if len(favorites) > limit else None
+    favorites = favorites[:limit]
+
+    ids_by_target = defaultdict(list)
+    page = []
+    for favorite in favorites:
+        target, obj_id = _get_target(favorite)
+        ids_by_target[target].append(obj_id)
+        page.append((favorite.id, target, obj_id))
+
+    session_maker = async_sessionmaker(bind=db.bind, expire_on_commit=False)
+    loaded = dict(
+        await asyncio.gather(
+            *(
+                _load_targets(session_maker, target=target, ids=ids)
+                for target, ids in ids_by_target.items()
+            )
+        )
+    )
+    return FavoriteFeedResponse(
+        objects=[
+            FavoriteFeedItem.model_validate(
+                {
+                    "id": favorite_id,
+                    "target": target,
+                    target.value: loaded[target][obj_id],
+                },
+                from_attributes=True,
+            )
+            for favorite_id, target, obj_id in page
+            if obj_id in loaded[target]
+        ],
+        totals=totals,
+        next_after_id=next_after_id,
+    )
+
+
+def _get_target(favorite: Favorite) -> tuple[FavoriteTarget, int]:
+    for target, (column, _, _) in crud_favorite.targets.items():
+        if (obj_id := getattr(favorite, column.key)) is not None:
+            return target, obj_id
+    raise ValueError(f"Favorite {favorite.id} has no target")
+
+
+async def _load_targets(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    target: FavoriteTarget,
+    ids: list[int],
+) -> tuple[FavoriteTarget, dict[int, Any]]:
+    async with session_maker() as session:
+        return target, await crud_favorite.get_targets(
+            db=session, target=target, ids=ids
+        )
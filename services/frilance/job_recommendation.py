@@ -0,0 +1,58 @@
+import json
+from typing import Optional
+
+from redis import Redis
+from redis.asyncio import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.loggers import logger
+from constants.frilance.recommendation import (
+    JOB_RECOMMENDATIONS_GENERATION_KEY,
+    JOB_RECOMMENDATIONS_KEY,
+    JOB_RECOMMENDATIONS_TOP_K,
+    JOB_RECOMMENDATIONS_TTL,
+)
+from crud.frilance.job_recommendation import crud_job_recommendation
+
+
+async def get_recommended_job_ids(
+    db: AsyncSession, redis: Optional[Redis], user_id: int
+) -> list[int]:
+    """
+    Возвращает top-k рекомендованных вакансий из кэша или считает заново.
+
+    Ключ кэша содержит номер поколения, который увеличивается при
+    публикации и снятии вакансий с публикации, поэтому устаревшие
+    списки перестают читаться без обхода всех пользователей.
+    """
+
+    key = None
+    if redis is not None:
+        try:
+            generation = await redis.get(JOB_RECOMMENDATIONS_GENERATION_KEY)
+            key = JOB_RECOMMENDATIONS_KEY.format(
+                generation=int(generation or 0), user_id=user_id
+            )
+            if cached := await redis.get(key):
+                return json.loads(cached)
+        except RedisError as ex:
+            logger.error(ex)
+
+    ids = await crud_job_recommendation.get_ranked_ids(
+        db, user_id=user_id, limit=JOB_RECOMMENDATIONS_TOP_K
+    )
+    if key is not None:
+        try:
+            await redis.set(key, json.dumps(ids), ex=JOB_RECOMMENDATIONS_TTL)
+        except RedisError as ex:
+            logger.error(ex)
+    return ids
+
+
+async def invalidate_job_recommendations(redis: Optional[Redis]) -> None:
+    if redis is None:
+        return
+    try:
+        await redis.incr(JOB_RECOMMENDATIONS_GENERATION_KEY)
+    except RedisError as ex:
+        logger.error(ex)
@@ -6,11 +6,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.filters.job import JobFilter
 from configs.loggers import logger
+from constants.frilance.job import JobSortField
+from constants.sorting import SortOrder
 from crud.frilance.job_with_counters import crud_job as crud_jwc
 from schemas.endpoints.paginated_response import (
     JobPaginatedAuthorResponse,
     JobPaginatedResponse,
 )
+from services.frilance.job_recommendation import get_recommended_job_ids
 from services.redis import get_browsing_now_by_job
 
 
@@ -23,6 +26,8 @@ async def read_jobs(
     current_user_ip: Optional[str],
     filters: JobFilter,
     favorite: bool,
+    sort_by: Optional[JobSortField] = None,
+    sort_order: SortOrder = SortOrder.asc,
 ) -> JobPaginatedResponse:
     jobs = await crud_jwc.get_multi(
         db,
@@ -32,6 +37,8 @@ async def read_jobs(
         current_user_ip=current_user_ip,
         filters=filters,
         favorite=favorite,
+        sort_by=sort_by,
+        sort_order=sort_order,
     )
     jobs = JobPaginatedResponse.model_validate(jobs, from_attributes=True)
     return await _add_browsing_now(jobs=jobs, redis=redis)
@@ -79,6 +86,30 @@ async def read_jobs_by_author(
     return await _add_browsing_now(jobs=jobs, redis=redis)
 
 
+async def read_recommended_jobs(
+    db: AsyncSession,
+    redis: Redis,
+    limit: int,
+    skip: int,
+    current_user_id: int,
+    current_user_ip: Optional[str],
+) -> JobPaginatedResponse:
+    ids = await get_recommended_job_ids(
+        db=db, redis=redis, user_id=current_user_id
+    )
+    jobs = await crud_jwc.get_multi(
+        db,
+        ids=ids,
+        limit=limit,
+        skip=skip,
+        current_user_id=current_user_id,
+        current_user_ip=current_user_ip,
+        favorite=False,
+    )
+    jobs = JobPaginatedResponse.model_validate(jobs, from_attributes=True)
+    return await _add_browsing_now(jobs=jobs, redis=redis)
+
+
 async def _add_browsing_now(
     jobs: Union[JobPaginatedAuthorResponse, JobPaginatedResponse],
     redis: Redis,
@@ -0,0 +1,221 @@
+"""
+Варианты изображений: уменьшенные копии в WebP рядом с оригиналом.
+
+Декодирование и сжатие выполняются в пуле процессов, чтобы не
+блокировать цикл событий. Варианты для уже загруженных файлов:
+
+    python -m services.images
+
+Созданные варианты записываются в image_variants строки по имени
+файла: ссылки отдаются только на них. Pillow импортируется только
+там, где изображения декодируются.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import BinaryIO, Mapping, Optional, Union
+
+from fastapi_storages.base import BaseStorage
+from sqlalchemy import literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from configs.loggers import logger
+from constants.images import (
+    IMAGE_BACKFILL_BATCH_SIZE,
+    IMAGE_BACKFILL_CONCURRENCY,
+    IMAGE_VARIANT_FORMAT,
+    IMAGE_VARIANT_QUALITY,
+    IMAGE_VARIANT_SIZES,
+    IMAGE_WORKERS,
+    ImageVariant,
+)
+from models import Event, User
+from services.storage import get_storage
+from utilities.images import get_file_name, get_variant_name
+
+IMAGE_COLUMNS = {
+    Event: (Event.photo, Event.event_cover),
+    User: (User.photo, User.profile_cover),
+}
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> ProcessPoolExecutor:
+    """Пул процессов создаётся при первой обработке изображения."""
+
+    return ProcessPoolExecutor(max_workers=IMAGE_WORKERS)
+
+
+class UnreadableImageError(Exception):
+    pass
+
+
+def render_variants(data: bytes) -> dict[ImageVariant, bytes]:
+    """Строит все варианты изображения, выполняется в пуле процессов."""
+
+    from PIL import Image, ImageOps
+
+    variants = {}
+    try:
+        with Image.open(BytesIO(data)) as original:
+            # JPEG сразу декодируется в уменьшенном масштабе.
+            original.draft("RGB", max(IMAGE_VARIANT_SIZES.values()))
+            image = ImageOps.exif_transpose(original)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            for variant, size in IMAGE_VARIANT_SIZES.items():
+                resized = image.copy()
+                resized.thumbnail(size, Image.Resampling.LANCZOS)
+                output = BytesIO()
+                resized.save(
+                    output,
+                    format=IMAGE_VARIANT_FORMAT,
+                    quality=IMAGE_VARIANT_QUALITY,
+                )
+                variants[variant] = output.getvalue()
+    except (OSError, Image.DecompressionBombError) as ex:
+        raise UnreadableImageError(str(ex)) from None
+    return variants
+
+
+async def create_variants(
+    storage: BaseStorage, name: str, file: BinaryIO
+) -> list[str]:
+    """
+    Сохраняет варианты изображения `name` из уже открытого файла и
+    возвращает созданные.
+
+    Файлы, которые не удалось разобрать как изображение, пропускаются:
+    для них клиенты используют оригинал.
+    """
+
+    data = await asyncio.to_thread(_read, file)
+    loop = asyncio.get_running_loop()
+    try:
+        variants = await loop.run_in_executor(
+            get_executor(), render_variants, data
+        )
+    except UnreadableImageError as ex:
+        logger.warning(f"No image variants for {name}: {ex}")
+        return []
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                storage.write,
+                BytesIO(content),
+                get_variant_name(name, variant),
+            )
+            for variant, content in variants.items()
+        )
+    )
+    return [variant.value for variant in variants]
+
+
+def set_image_variants(
+    obj: Union[Event, User], created: Mapping[str, list[str]]
+) -> None:
+    """
+    Записывает созданные варианты в image_variants объекта и убирает
+    записи файлов, которых у объекта больше нет.
+
+    `created` - варианты по имени файла в хранилище.
+    """
+
+    known = {**(obj.image_variants or {}), **created}
+    names = {
+        get_file_name(get_storage(column), getattr(obj, column.key))
+        for column in IMAGE_COLUMNS[type(obj)]
+    }
+    obj.image_variants = {
+        name: variants for name, variants in known.items() if name in names
+    }
+
+
+async def backfill_variants(
+    db: AsyncSession, column: InstrumentedAttribute
+) -> int:
+    """
+    Создаёт варианты для загруженных ранее файлов колонки.
+
+    Файлы, для которых варианты уже записаны в image_variants (в том
+    числе пустой список у нечитаемых изображений), не читаются, поэтому
+    прерванный запуск можно просто повторить. Каждая пачка фиксируется
+    отдельной транзакцией.
+    """
+
+    model = column.class_
+    storage = get_storage(column)
+    semaphore = asyncio.Semaphore(IMAGE_BACKFILL_CONCURRENCY)
+
+    async def process(name: str) -> Optional[list[str]]:
+        async with semaphore:
+            try:
+                file = await asyncio.to_thread(storage.open, name)
+            except Exception as ex:
+                logger.warning(f"Skipping {name}: {ex}")
+                return None
+            with file:
+                return await create_variants(storage, name, file)
+
+    count = 0
+    after_id = 0
+    while True:
+        rows = (
+            await db.execute(
+                select(model.id, column, model.image_variants)
+                .where(column.isnot(None), model.id > after_id)
+                .order_by(model.id)
+                .limit(IMAGE_BACKFILL_BATCH_SIZE)
+            )
+        ).all()
+        if not rows:
+            return count
+        after_id = rows[-1][0]
+        names = {
+            obj_id: file.name
+            for obj_id, file, variants in rows
+            if file.name not in variants
+        }
+        created = await asyncio.gather(
+            *(process(name) for name in names.values())
+        )
+        for (obj_id, name), variants in zip(names.items(), created):
+            if variants is None:
+                continue
+            # Слияние в базе: строку могли изменить во время обработки.
+            await db.execute(
+                update(model)
+                .where(model.id == obj_id)
+                .values(
+                    image_variants=model.image_variants.op("||")(
+                        literal({name: variants}, JSONB)
+                    )
+                )
+            )
+        await db.commit()
+        count += len(names)
+
+
+async def backfill() -> None:
+    from databases.database import get_async_session
+
+    async for db in get_async_session():
+        for columns in IMAGE_COLUMNS.values():
+            for column in columns:
+                count = await backfill_variants(db, column)
+                logger.info(f"{column}: processed {count} images")
+
+
+def _read(file: BinaryIO) -> bytes:
+    file.seek(0)
+    data = file.read()
+    file.seek(0)
+    return data
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill())
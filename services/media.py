@@ -0,0 +1,122 @@
+"""
+Файлы с дедупликацией по содержимому.
+
+Файлы, на которые не осталось ссылок, удаляются сразу в путях
+удаления и периодически, для удалений в обход них (админка, каскады):
+
+    python -m services.media
+"""
+
+import asyncio
+from typing import Sequence
+
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from configs.loggers import logger
+from constants.files import MEDIA_PURGE_INTERVAL
+from crud.stored_blob import crud_stored_blob
+from models import MediaFile
+from models.user.education_file import EducationCertificateFile
+from services.storage import (
+    check_sizes,
+    copy_files,
+    delete_file,
+    get_storage,
+    hash_file,
+    upload_files,
+)
+
+MEDIA_COLUMNS = (MediaFile.file, EducationCertificateFile.file)
+
+
+async def store_files(
+    db: AsyncSession,
+    column: InstrumentedAttribute,
+    files: Sequence[UploadFile],
+) -> list[str]:
+    """
+    Загружает файлы для колонки FileType с дедупликацией по sha256.
+
+    Возвращает имена в хранилище в порядке `files`. Файл, содержимое
+    которого уже хранится, не загружается повторно: используется
+    имя существующего объекта, а ref_count увеличит триггер, когда
+    строка со ссылкой будет вставлена. Имена объектов не содержат
+    имён файлов, так как объект может быть чужим.
+    """
+
+    check_sizes(files)
+    source = column.class_.__tablename__
+    hashes = await asyncio.gather(
+        *(asyncio.to_thread(hash_file, file.file) for file in files)
+    )
+    names = await crud_stored_blob.get_names_by_hashes(
+        db, source=source, hashes=set(hashes)
+    )
+    new_files = {}
+    for file, sha256 in zip(files, hashes):
+        if sha256 not in names:
+            new_files.setdefault(sha256, file)
+    stored_files = await upload_files(
+        get_storage(column), list(new_files.values()), anonymous=True
+    )
+    await crud_stored_blob.create_many(db, source=source, files=stored_files)
+    names.update(
+        (sha256, stored_file.name)
+        for sha256, stored_file in zip(new_files, stored_files)
+    )
+    return [names[sha256] for sha256 in hashes]
+
+
+async def share_files(
+    db: AsyncSession, column: InstrumentedAttribute, names: Sequence[str]
+) -> list[str]:
+    """
+    Имена файлов для копии объекта.
+
+    Учтённые файлы используются повторно без копирования, остальные
+    копируются внутри хранилища.
+    """
+
+    tracked = await crud_stored_blob.get_tracked_names(
+        db, source=column.class_.__tablename__, names=names
+    )
+    untracked = [name for name in names if name not in tracked]
+    copies = dict(
+        zip(untracked, await copy_files(get_storage(column), untracked))
+    )
+    return [copies.get(name, name) for name in names]
+
+
+async def purge_unreferenced(
+    db: AsyncSession, column: InstrumentedAttribute
+) -> None:
+    """Удаляет из хранилища файлы, на которые больше нет ссылок."""
+
+    names = await crud_stored_blob.delete_unreferenced(
+        db, source=column.class_.__tablename__
+    )
+    await db.commit()
+    storage = get_storage(column)
+    await asyncio.gather(
+        *(asyncio.to_thread(delete_file, storage, name) for name in names)
+    )
+
+
+async def run_media_purge(interval: int = MEDIA_PURGE_INTERVAL) -> None:
+    from databases.database import get_async_session
+
+    while True:
+        async for db in get_async_session():
+            for column in MEDIA_COLUMNS:
+                try:
+                    await purge_unreferenced(db, column)
+                except Exception as ex:
+                    await db.rollback()
+                    logger.error(ex)
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_media_purge())
@@ -0,0 +1,80 @@
+from typing import Optional, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.publication import PublicationErrorCode
+from crud.crud_mixins import ArchiveAsync
+
+
+class PublicationError(Exception):
+    def __init__(self, code: PublicationErrorCode) -> None:
+        super().__init__(code.value)
+        self.code = code
+
+
+async def set_published(
+    db: AsyncSession,
+    crud: ArchiveAsync,
+    *,
+    obj_id: int,
+    user_id: int,
+    published: bool,
+) -> Row:
+    """Публикует или архивирует запись, возвращает её новое состояние."""
+
+    objects, errors = await set_published_many(
+        db, crud, ids=[obj_id], user_id=user_id, published=published
+    )
+    if errors:
+        raise PublicationError(errors[obj_id])
+    return objects[0]
+
+
+async def set_published_many(
+    db: AsyncSession,
+    crud: ArchiveAsync,
+    *,
+    ids: Sequence[int],
+    user_id: int,
+    published: bool,
+) -> tuple[list[Row], dict[int, PublicationErrorCode]]:
+    """
+    Меняет публикацию записей одним UPDATE.
+
+    Причины отказа выясняются отдельным лёгким запросом только для
+    записей, которые не изменились.
+    """
+
+    ids = list(dict.fromkeys(ids))
+    try:
+        objects = await crud.set_archived(
+            db, ids=ids, owner_id=user_id, is_archived=not published
+        )
+        await db.commit()
+    except Exception as ex:
+        await db.rollback()
+        raise ex
+    changed = {obj.id for obj in objects}
+    failed = [obj_id for obj_id in ids if obj_id not in changed]
+    if not failed:
+        return objects, {}
+    states = await crud.get_publication_states(db, ids=failed)
+    return objects, {
+        obj_id: get_error_code(states.get(obj_id), user_id, published)
+        for obj_id in failed
+    }
+
+
+def get_error_code(
+    state: Optional[Row], user_id: int, published: bool
+) -> PublicationErrorCode:
+    if state is None:
+        return PublicationErrorCode.NOT_FOUND
+    if state.owner_id != user_id:
+        return PublicationErrorCode.NOT_AUTHOR
+    if state.is_draft:
+        return PublicationErrorCode.DRAFT
+    if published:
+        return PublicationErrorCode.ALREADY_PUBLISHED
+    return PublicationErrorCode.NOT_PUBLISHED
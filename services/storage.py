@@ -0,0 +1,226 @@
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Sequence
+from uuid import uuid4
+
+from fastapi import UploadFile
+from fastapi_storages.base import BaseStorage
+from sqlalchemy.orm import InstrumentedAttribute
+
+from constants.files import (
+    HASH_CHUNK_SIZE,
+    MAX_UPLOAD_FILE_SIZE,
+    MAX_UPLOAD_REQUEST_SIZE,
+    UPLOAD_CONCURRENCY,
+)
+
+
+class FileTooLargeError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    name: str
+    size: int
+    sha256: str
+
+
+class _HashingReader:
+    """
+    Обёртка над файлом для записи в хранилище.
+
+    Считает размер и sha256 по мере чтения и прерывает запись,
+    как только файл превысил лимит.
+    """
+
+    def __init__(self, file: BinaryIO, limit: int) -> None:
+        self._file = file
+        self._limit = limit
+        self.size = 0
+        self.hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self.size += len(chunk)
+        if self.size > self._limit:
+            raise FileTooLargeError(
+                f"File exceeds the limit of {self._limit} bytes"
+            )
+        self.hash.update(chunk)
+        return chunk
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        # Хранилища перематывают файл перед записью.
+        position = self._file.seek(offset, whence)
+        if position == 0:
+            self.size = 0
+            self.hash = hashlib.sha256()
+        return position
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+
+def get_storage(column: InstrumentedAttribute) -> BaseStorage:
+    """Хранилище колонки FileType."""
+
+    return column.property.columns[0].type.storage
+
+
+def copy_file(storage: BaseStorage, name: str) -> str:
+    """
+    Копирует файл внутри хранилища и возвращает имя копии.
+
+    S3-хранилища копируют объект на стороне сервера, байты через
+    API не проходят. Остальные хранилища пишут копию из открытого
+    файла по частям.
+    """
+
+    new_name = _get_unique_name(storage, name)
+    if new_name == storage.get_name(name):
+        # Запись в тот же путь обрезала бы оригинал при чтении.
+        raise ValueError(f"Copy of {name} would overwrite the original")
+    s3 = getattr(storage, "_s3", None)
+    if s3 is None:
+        with storage.open(name) as file:
+            return storage.write(file, new_name)
+    # boto3 resource отдаёт клиент через meta, client - сам клиент.
+    client = getattr(s3.meta, "client", s3)
+    client.copy(
+        CopySource={
+            "Bucket": storage.AWS_S3_BUCKET_NAME,
+            "Key": storage.get_name(name),
+        },
+        Bucket=storage.AWS_S3_BUCKET_NAME,
+        Key=new_name,
+        ExtraArgs=(
+            {"ACL": storage.AWS_DEFAULT_ACL}
+            if storage.AWS_DEFAULT_ACL
+            else None
+        ),
+    )
+    return new_name
+
+
+async def copy_files(storage: BaseStorage, names: Iterable[str]) -> list[str]:
+    """Копирует файлы параллельно в потоках, boto3 синхронный."""
+
+    return list(
+        await asyncio.gather(
+            *(asyncio.to_thread(copy_file, storage, name) for name in names)
+        )
+    )
+
+
+def upload_file(
+    storage: BaseStorage,
+    file: UploadFile,
+    max_size: int = MAX_UPLOAD_FILE_SIZE,
+    anonymous: bool = False,
+) -> StoredFile:
+    """
+    Пишет загруженный файл в хранилище по частям, считая sha256.
+
+    С `anonymous` имя объекта не содержит имени файла пользователя.
+    """
+
+    reader = _HashingReader(file.file, limit=max_size)
+    if anonymous:
+        name = _get_anonymous_name(storage, file.filename)
+    else:
+        name = _get_unique_name(storage, file.filename)
+    try:
+        name = storage.write(reader, name)
+    except FileTooLargeError:
+        # Запись прервана на середине, недописанный объект не нужен.
+        delete_file(storage, name)
+        raise
+    return StoredFile(
+        name=name, size=reader.size, sha256=reader.hash.hexdigest()
+    )
+
+
+async def upload_files(
+    storage: BaseStorage,
+    files: Sequence[UploadFile],
+    max_file_size: int = MAX_UPLOAD_FILE_SIZE,
+    max_total_size: int = MAX_UPLOAD_REQUEST_SIZE,
+    anonymous: bool = False,
+) -> list[StoredFile]:
+    """
+    Загружает файлы запроса в хранилище, не более UPLOAD_CONCURRENCY
+    одновременно.
+
+    Размеры из multipart-заголовков проверяются до начала записи,
+    а при записи лимит на файл проверяется по фактически прочитанным
+    байтам.
+    """
+
+    check_sizes(files, max_file_size, max_total_size)
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def upload(file: UploadFile) -> StoredFile:
+        async with semaphore:
+            return await asyncio.to_thread(
+                upload_file, storage, file, max_file_size, anonymous
+            )
+
+    return list(await asyncio.gather(*(upload(file) for file in files)))
+
+
+def check_sizes(
+    files: Sequence[UploadFile],
+    max_file_size: int = MAX_UPLOAD_FILE_SIZE,
+    max_total_size: int = MAX_UPLOAD_REQUEST_SIZE,
+) -> None:
+    sizes = [file.size or 0 for file in files]
+    for file, size in zip(files, sizes):
+        if size > max_file_size:
+            raise FileTooLargeError(
+                f"File {file.filename} exceeds the limit "
+                f"of {max_file_size} bytes"
+            )
+    if sum(sizes) > max_total_size:
+        raise FileTooLargeError(
+            f"Files exceed the limit of {max_total_size} bytes per request"
+        )
+
+
+def hash_file(file: BinaryIO) -> str:
+    """sha256 файла, читаемого по частям; файл перематывается в начало."""
+
+    file_hash = hashlib.sha256()
+    file.seek(0)
+    while chunk := file.read(HASH_CHUNK_SIZE):
+        file_hash.update(chunk)
+    file.seek(0)
+    return file_hash.hexdigest()
+
+
+def delete_file(storage: BaseStorage, name: str) -> None:
+    s3 = getattr(storage, "_s3", None)
+    if s3 is None:
+        Path(storage.get_path(name)).unlink(missing_ok=True)
+        return
+    client = getattr(s3.meta, "client", s3)
+    client.delete_object(
+        Bucket=storage.AWS_S3_BUCKET_NAME, Key=storage.get_name(name)
+    )
+
+
+def _get_unique_name(storage: BaseStorage, name: str) -> str:
+    # FileSystemStorage.get_name отбрасывает каталоги, поэтому
+    # уникальность держится в самом имени файла.
+    path = Path(name)
+    return storage.get_name(str(path.parent / f"{uuid4().hex}_{path.name}"))
+
+
+def _get_anonymous_name(storage: BaseStorage, name: str) -> str:
+    # Объект могут переиспользовать другие пользователи с тем же
+    # содержимым, поэтому от имени файла остаётся только расширение.
+    return storage.get_name(f"{uuid4().hex}{Path(name).suffix}")
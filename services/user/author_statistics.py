@@ -0,0 +1,49 @@
+from typing import Optional
+
+from redis import Redis
+from redis.asyncio import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.loggers import logger
+from constants.user.author_statistics import (
+    AUTHOR_STATISTICS_KEY,
+    AUTHOR_STATISTICS_TTL,
+)
+from crud.author_statistics import crud_author_statistics
+from schemas.user.author_statistics import AuthorStatisticsResponse
+
+
+async def get_author_statistics(
+    db: AsyncSession, redis: Optional[Redis], user_id: int
+) -> AuthorStatisticsResponse:
+    key = AUTHOR_STATISTICS_KEY.format(user_id=user_id)
+    if redis is not None:
+        try:
+            if cached := await redis.get(key):
+                return AuthorStatisticsResponse.model_validate_json(cached)
+        except RedisError as ex:
+            logger.error(ex)
+
+    statistics = AuthorStatisticsResponse.model_validate(
+        await crud_author_statistics.get_by_author_id(db, author_id=user_id)
+        or {}
+    )
+    if redis is not None:
+        try:
+            await redis.set(
+                key, statistics.model_dump_json(), ex=AUTHOR_STATISTICS_TTL
+            )
+        except RedisError as ex:
+            logger.error(ex)
+    return statistics
+
+
+async def invalidate_author_statistics(
+    redis: Optional[Redis], user_id: Optional[int]
+) -> None:
+    if redis is None or user_id is None:
+        return
+    try:
+        await redis.delete(AUTHOR_STATISTICS_KEY.format(user_id=user_id))
+    except RedisError as ex:
+        logger.error(ex)
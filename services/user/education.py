@@ -1,12 +1,13 @@
-from typing import List, Union
+from typing import List, Optional, Union
 
 from fastapi import UploadFile
+from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from crud import file_bulk_operations
 from crud.city import crud_city
 from crud.education import crud_education
-from crud.user import crud_user
 from models import User
 from models.user.education import Education
 from models.user.education_file import EducationCertificateFile
@@ -19,6 +20,8 @@ from schemas.user.education import (
     EducationUpdateMulty,
     EducationUpdateSingle,
 )
+from services.media import purge_unreferenced, store_files
+from services.user.profile_snapshot import invalidate_profile_snapshot
 from utilities.exception import FileNotFound, ObjectNotFound, PermissionDenied
 from utilities.files import get_names_with_files
 from utilities.queryset import check_found
@@ -29,6 +32,7 @@ async def create_education(
     create_data: EducationCreateMulty,
     files: List[UploadFile],
     user: User,
+    redis: Optional[Redis] = None,
 ) -> Education:
     try:
         await check_cities(db=db, schemas=create_data.educations)
@@ -39,10 +43,12 @@ async def create_education(
             data = data.model_dump()
             filenames.append(data.pop("filenames"))
             create_data_db.append(EducationCreateDB(**data, user_id=user.id))
-        new_educations = await crud_education.create_bulk(
-            db=db, create_schemas=create_data_db, commit=False
+        new_educations = await crud_education.create_many(
+            db=db,
+            create_schemas=create_data_db,
+            options=(selectinload(Education.certificates),),
+            commit=False,
         )
-        await db.flush()
 
         if files:
             await create_certificates(
@@ -53,6 +59,7 @@ async def create_education(
             )
 
         await db.commit()
+        await invalidate_profile_snapshot(redis=redis, uid=user.uid)
         return await crud_education.get_multi_by_ids(
             db=db, ids=[e.id for e in new_educations]
         )
@@ -68,24 +75,30 @@ async def create_certificates(
     filenames: List[str],
 ) -> None:
     files_with_name = await get_names_with_files(files)
-    for education, names in zip(educations, filenames):
-        files_to_updload = []
+    for names in filenames:
         for name in names:
             if name not in files_with_name.keys():
                 raise FileNotFound(f"File with name {name} not found")
-            files_to_updload.append(files_with_name[name])
-        kwargs = {
-            "db": db,
-            "model": EducationCertificateFile,
-            "entity_column": EducationCertificateFile.education_id,
-            "entity_id": education.id,
-            "commit": False,
-        }
-        if files_to_updload:
-            created_files = await file_bulk_operations.bulk_create(
-                files=files_to_updload, **kwargs
+    # Каждый файл загружается один раз, даже если указан у нескольких
+    # записей об образовании.
+    names_to_upload = list({name for names in filenames for name in names})
+    stored_names = dict(
+        zip(
+            names_to_upload,
+            await store_files(
+                db,
+                EducationCertificateFile.file,
+                [files_with_name[name] for name in names_to_upload],
+            ),
+        )
+    )
+    for education, names in zip(educations, filenames):
+        education.certificates.extend(
+            EducationCertificateFile(
+                education_id=education.id, file=stored_names[name]
             )
-            education.certificates.extend(created_files)
+            for name in names
+        )
 
 
 async def update_education_multi(
@@ -93,9 +106,12 @@ async def update_education_multi(
     update_data: EducationUpdateMulty,
     files: List[UploadFile],
     user: User,
+    redis: Optional[Redis] = None,
 ) -> Education:
     try:
-        user = await crud_user.get_by_uid_full(db=db, uid=user.uid)
+        user_education_ids = await crud_education.get_ids_by_user_id(
+            db=db, user_id=user.id
+        )
         education_ids = {e.education_id for e in update_data.educations}
         found_educations = await crud_education.get_multi_by_ids(
             db=db, ids=education_ids
@@ -117,9 +133,12 @@ async def update_education_multi(
             education_id = data.pop("education_id")
             update_data_db.append(EducationUpdateDB(**data, id=education_id))
 
-        await crud_education.update_bulk(
+        await crud_education.update_many(
             db=db, update_schemas=update_data_db, commit=False
         )
+        await crud_education.remove_many(
+            db=db, ids=user_education_ids - education_ids, commit=False
+        )
         await delete_certificates(
             db=db,
             educations=found_educations,
@@ -132,13 +151,9 @@ async def update_education_multi(
                 educations=found_educations,
                 filenames=filenames,
             )
-        education_ids_to_delete = [
-            e.id for e in user.education if e.id not in education_ids
-        ]
-        await crud_education.remove_bulk(
-            db=db, ids=education_ids_to_delete, commit=False
-        )
         await db.commit()
+        await purge_unreferenced(db, EducationCertificateFile.file)
+        await invalidate_profile_snapshot(redis=redis, uid=user.uid)
         ids = [e.id for e in found_educations]
         db.expire_all()
 
@@ -154,6 +169,7 @@ async def update_education(
     update_data: EducationUpdateSingle,
     user: User,
     files: List[UploadFile],
+    redis: Optional[Redis] = None,
 ) -> Education:
     try:
         found_education = await crud_education.get_by_id(
@@ -215,6 +231,9 @@ async def update_education(
             )
 
         await db.commit()
+        if update_data.certificates_ids_to_delete:
+            await purge_unreferenced(db, EducationCertificateFile.file)
+        await invalidate_profile_snapshot(redis=redis, uid=user.uid)
         db.expire_all()
 
         return await crud_education.get_by_id(db=db, obj_id=education_id)
@@ -0,0 +1,110 @@
+from typing import Optional, Sequence
+from uuid import UUID
+
+from redis import Redis
+from redis.asyncio import RedisError
+from redis.exceptions import WatchError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from configs.loggers import logger
+from constants.user.profile import PROFILE_SNAPSHOT_KEY, PROFILE_SNAPSHOT_TTL
+from crud.user_profile import crud_user_profile
+from schemas.user.user_full import UserResponseFull
+
+
+async def get_profile_snapshot(
+    db: AsyncSession, redis: Optional[Redis], uid: UUID
+) -> Optional[UserResponseFull]:
+    """Возвращает сериализованный профиль из кэша или собирает его заново."""
+
+    key = PROFILE_SNAPSHOT_KEY.format(uid=uid)
+    if redis is not None:
+        try:
+            if cached := await redis.get(key):
+                return UserResponseFull.model_validate_json(cached)
+        except RedisError as ex:
+            logger.error(ex)
+
+    found_user = await crud_user_profile.get_by_uid_full(db=db, uid=uid)
+    if not found_user:
+        return None
+    snapshot = UserResponseFull.model_validate(
+        found_user, from_attributes=True
+    )
+    if redis is not None:
+        try:
+            await redis.set(
+                key, snapshot.model_dump_json(), ex=PROFILE_SNAPSHOT_TTL
+            )
+        except RedisError as ex:
+            logger.error(ex)
+    return snapshot
+
+
+async def refresh_profile_snapshot(
+    db: AsyncSession,
+    redis: Optional[Redis],
+    uid: UUID,
+    relations: Sequence[str],
+    columns: Sequence[InstrumentedAttribute] = (),
+) -> Optional[UserResponseFull]:
+    """
+    Обновляет в кэшированном профиле только изменившиеся связи.
+
+    Снимок читается под WATCH: если его сбросили или перезаписали,
+    пока загружались связи, запись отменяется и профиль собирается
+    целиком. Если снимка в кэше нет, профиль тоже собирается целиком.
+    """
+
+    if redis is None:
+        return await get_profile_snapshot(db=db, redis=redis, uid=uid)
+    key = PROFILE_SNAPSHOT_KEY.format(uid=uid)
+    try:
+        async with redis.pipeline() as pipe:
+            await pipe.watch(key)
+            if cached := await pipe.get(key):
+                found_user = await crud_user_profile.get_relations(
+                    db=db, uid=uid, relations=relations, columns=columns
+                )
+                if not found_user:
+                    return None
+                changed_fields = [
+                    *relations,
+                    *(column.key for column in columns),
+                ]
+                snapshot = UserResponseFull.model_validate(
+                    {
+                        **UserResponseFull.model_validate_json(
+                            cached
+                        ).model_dump(),
+                        **{
+                            field: getattr(found_user, field)
+                            for field in changed_fields
+                        },
+                    },
+                    from_attributes=True,
+                )
+                pipe.multi()
+                pipe.set(
+                    key, snapshot.model_dump_json(), ex=PROFILE_SNAPSHOT_TTL
+                )
+                await pipe.execute()
+                return snapshot
+    except WatchError:
+        # Снимок сбросили, пока загружались связи.
+        pass
+    except RedisError as ex:
+        logger.error(ex)
+    return await get_profile_snapshot(db=db, redis=redis, uid=uid)
+
+
+async def invalidate_profile_snapshot(
+    redis: Optional[Redis], uid: UUID
+) -> None:
+    if redis is None:
+        return
+    try:
+        await redis.delete(PROFILE_SNAPSHOT_KEY.format(uid=uid))
+    except RedisError as ex:
+        logger.error(ex)
@@ -0,0 +1,90 @@
+"""
+Окончательное удаление пользователей через PURGE_AFTER_DAYS после
+пометки удалёнными:
+
+    python -m services.user.purge
+
+Каждая пачка строк фиксируется отдельно. После сбоя запуск можно
+повторить: пользователи выбираются по тем же условиям, а уже
+удалённые зависимые строки просто не находятся.
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+
+from redis import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.loggers import logger
+from constants.user.purge import (
+    PURGE_AFTER_DAYS,
+    PURGE_ROWS_CHUNK_SIZE,
+    PURGE_USERS_BATCH_SIZE,
+)
+from crud.user_purge import crud_user_purge
+from services.media import MEDIA_COLUMNS, purge_unreferenced
+from services.user.author_statistics import invalidate_author_statistics
+
+
+async def purge_deleted_users(
+    db: AsyncSession,
+    redis: Optional[Redis] = None,
+    batch_size: int = PURGE_USERS_BATCH_SIZE,
+    chunk_size: int = PURGE_ROWS_CHUNK_SIZE,
+) -> int:
+    """
+    Удаляет пользователей пачками, возвращает число удалённых строк.
+
+    После каждой пачки сбрасывается статистика затронутых авторов.
+    """
+
+    deleted_before = datetime.now(tz=UTC) - timedelta(days=PURGE_AFTER_DAYS)
+    started = time.monotonic()
+    rows = 0
+    users = 0
+    after_id = 0
+    while user_ids := await crud_user_purge.get_batch(
+        db, deleted_before=deleted_before, after_id=after_id, limit=batch_size
+    ):
+        authors = await crud_user_purge.get_affected_authors(
+            db, user_ids=user_ids, deleted_before=deleted_before
+        )
+        dependents = crud_user_purge.get_dependents(user_ids, deleted_before)
+        for model, condition in dependents:
+            while deleted := await crud_user_purge.delete_chunk(
+                db, model=model, condition=condition, limit=chunk_size
+            ):
+                await db.commit()
+                rows += deleted
+        deleted = await crud_user_purge.delete_users(
+            db, user_ids=user_ids, deleted_before=deleted_before
+        )
+        await db.commit()
+        users += deleted
+        rows += deleted
+        for author_id in authors:
+            await invalidate_author_statistics(redis=redis, user_id=author_id)
+        after_id = user_ids[-1]
+        elapsed = time.monotonic() - started
+        logger.info(
+            f"Purged {users} users, {rows} rows, "
+            f"{rows / elapsed:.0f} rows/sec"
+        )
+    for column in MEDIA_COLUMNS:
+        await purge_unreferenced(db, column)
+    return rows
+
+
+async def run_purge() -> None:
+    from api.dependencies.redis import get_redis
+    from databases.database import get_async_session
+
+    async for db in get_async_session():
+        async for redis in get_redis():
+            await purge_deleted_users(db, redis=redis)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_purge())
@@ -1,27 +1,31 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crud.link import crud_link
 from crud.private_site import crud_private_site
 from crud.user import crud_user
-from models import User
-from schemas.link import LinkCreateDB, LinkUpdateDB
+from models import Link, User
 from schemas.private_site import (
     PrivateSiteCreate,
     PrivateSiteCreateDB,
     PrivateSiteUpdate,
 )
+from schemas.user.user_full import UserResponseFull
 from schemas.user.user_info import LinkCreateUpdate, UserInfoCreateUpdate
-from utilities.queryset import check_found
+from services.user.profile_snapshot import refresh_profile_snapshot
 
 
 async def create_update_user_info(
-    db: AsyncSession, schema: UserInfoCreateUpdate, user_uid: UUID
-) -> User:
+    db: AsyncSession,
+    schema: UserInfoCreateUpdate,
+    user_uid: UUID,
+    redis: Optional[Redis] = None,
+) -> UserResponseFull:
     try:
-        user = await crud_user.get_by_uid_full(db=db, uid=user_uid)
+        user = await crud_user.get_by_uid_with_contacts(db=db, uid=user_uid)
 
         await create_or_update_links(db=db, schemas=schema.links, user=user)
         await create_or_update_private_site(
@@ -33,8 +37,13 @@ async def create_update_user_info(
             user.contact_info = contact_info_update_data
 
         await db.commit()
-        db.expire_all()
-        return await crud_user.get_by_uid_full(db=db, uid=user_uid)
+        return await refresh_profile_snapshot(
+            db=db,
+            redis=redis,
+            uid=user_uid,
+            relations=("links", "private_site"),
+            columns=(User.contact_info, User.profile_completeness),
+        )
     except Exception:
         await db.rollback()
         raise
@@ -43,36 +52,14 @@ async def create_update_user_info(
 async def create_or_update_links(
     db: AsyncSession, schemas: List[LinkCreateUpdate], user: User
 ) -> None:
-    if not schemas and user.links:
-        await crud_link.remove_bulk(
-            db=db, ids=[link.id for link in user.links], commit=False
-        )
-    elif schemas:
-        links_ids, create_schemas, update_schemas = [], [], []
-        for link in schemas:
-            if link.id:
-                links_ids.append(link.id)
-                update_schemas.append(LinkUpdateDB(**link.model_dump()))
-            else:
-                create_schemas.append(
-                    LinkCreateDB(
-                        **link.model_dump(exclude_unset=True), user_id=user.id
-                    )
-                )
-
-        found_links = await crud_link.get_multi_by_ids(db=db, ids=links_ids)
-        await check_found(found_links, links_ids)
-        if create_schemas:
-            created_links = await crud_link.create_bulk(
-                db=db, create_schemas=create_schemas, commit=False
-            )
-            links_ids.extend([e.id for e in created_links])
-        if update_schemas:
-            await crud_link.update_bulk(
-                db=db, update_schemas=update_schemas, commit=False
-            )
-        ids_to_delete = [e.id for e in user.links if e.id not in links_ids]
-        await crud_link.remove_bulk(db=db, ids=ids_to_delete, commit=False)
+    await crud_link.sync_children(
+        db=db,
+        parent_column=Link.user_id,
+        parent_id=user.id,
+        incoming=[link.model_dump(mode="json") for link in schemas],
+        existing_ids={link.id for link in user.links},
+        commit=False,
+    )
 
 
 async def create_or_update_private_site(
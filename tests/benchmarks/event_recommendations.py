@@ -0,0 +1,172 @@
+"""
+Время расчёта рекомендаций мероприятий на 10 000 предстоящих
+мероприятий.
+
+Заполняет базу из настроек приложения мероприятиями с существующими
+специализациями, часть из них пользователь посещает и добавил
+в избранное, замеряет get_ranked_ids без кэша Redis, затем удаляет
+созданные строки:
+
+    python -m tests.benchmarks.event_recommendations
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.event_recommendation import EVENT_RECOMMENDATIONS_TOP_K
+from crud.event_recommendation import crud_event_recommendation
+from models import Event, Favorite, Specialization, User
+from models.event_participants import EventParticipants
+from models.m2m import EventSpecializations, UsersSpecializations
+from models.user.user_specialization import UserSpecialization
+
+EVENTS = 10_000
+BATCH_SIZE = 2_000
+USER_SPECIALIZATIONS = 3
+# Каждое N-е мероприятие пользователь посещает, следующее - в избранном.
+INTERACTION_STEP = 100
+NUMBER = 20
+
+
+async def seed(db: AsyncSession) -> tuple[int, int]:
+    specialization_ids = list(
+        await db.scalars(select(Specialization.id).order_by(Specialization.id))
+    )
+    if not specialization_ids:
+        raise SystemExit("No specializations to seed events with")
+    users = await db.scalars(
+        insert(User)
+        .values(
+            [
+                {
+                    "uid": uuid4(),
+                    "username": f"benchmark_{uuid4().hex}",
+                    "first_name": "Benchmark",
+                    "second_name": "User",
+                    "email": f"{uuid4().hex}@benchmark.local",
+                    "hashed_password": "password",
+                }
+                for _ in range(2)
+            ]
+        )
+        .returning(User.id)
+    )
+    author_id, user_id = users.all()
+    user_specialization_id = await db.scalar(
+        insert(UserSpecialization)
+        .values(
+            user_id=user_id,
+            is_ready_to_move=False,
+            is_ready_for_remote_work=False,
+        )
+        .returning(UserSpecialization.id)
+    )
+    await db.execute(
+        insert(UsersSpecializations).values(
+            [
+                {
+                    "user_specialization_id": user_specialization_id,
+                    "specialization_id": specialization_id,
+                }
+                for specialization_id in (
+                    specialization_ids[:USER_SPECIALIZATIONS]
+                )
+            ]
+        )
+    )
+    end_datetime = datetime.now(tz=UTC) + timedelta(days=10)
+    # asyncpg принимает не больше 32767 параметров на запрос.
+    for start in range(0, EVENTS, BATCH_SIZE):
+        event_ids = (
+            await db.scalars(
+                insert(Event)
+                .values(
+                    [
+                        {
+                            "title": f"Benchmark event {number}",
+                            "creator_id": author_id,
+                            "extra_languages": [],
+                            "is_draft": False,
+                            "end_datetime": end_datetime,
+                        }
+                        for number in range(start, start + BATCH_SIZE)
+                    ]
+                )
+                .returning(Event.id)
+            )
+        ).all()
+        await db.execute(
+            insert(EventSpecializations).values(
+                [
+                    {
+                        "event_id": event_id,
+                        "specialization_id": specialization_ids[
+                            event_id % len(specialization_ids)
+                        ],
+                    }
+                    for event_id in event_ids
+                ]
+            )
+        )
+        await db.execute(
+            insert(EventParticipants).values(
+                [
+                    {"user_id": user_id, "event_id": event_id}
+                    for event_id in event_ids[::INTERACTION_STEP]
+                ]
+            )
+        )
+        await db.execute(
+            insert(Favorite).values(
+                [
+                    {"user_id": user_id, "event_id": event_id}
+                    for event_id in event_ids[1::INTERACTION_STEP]
+                ]
+            )
+        )
+    await db.commit()
+    return author_id, user_id
+
+
+async def cleanup(db: AsyncSession, author_id: int, user_id: int) -> None:
+    await db.execute(delete(Favorite).where(Favorite.user_id == user_id))
+    await db.execute(
+        delete(EventParticipants).where(EventParticipants.user_id == user_id)
+    )
+    await db.execute(delete(Event).where(Event.creator_id == author_id))
+    await db.execute(
+        delete(UserSpecialization).where(UserSpecialization.user_id == user_id)
+    )
+    await db.execute(delete(User).where(User.id.in_((author_id, user_id))))
+    await db.commit()
+
+
+async def measure(db: AsyncSession, user_id: int) -> None:
+    started = time.perf_counter()
+    for _ in range(NUMBER):
+        ids = await crud_event_recommendation.get_ranked_ids(
+            db, user_id=user_id, limit=EVENT_RECOMMENDATIONS_TOP_K
+        )
+    elapsed = (time.perf_counter() - started) / NUMBER
+    print(f"get_ranked_ids: {elapsed * 1e3:.1f} ms, {len(ids)} ids")
+
+
+async def main() -> None:
+    from databases.database import get_async_session
+
+    async for db in get_async_session():
+        author_id, user_id = await seed(db)
+        try:
+            await measure(db, user_id)
+        finally:
+            await db.rollback()
+            await cleanup(db, author_id, user_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
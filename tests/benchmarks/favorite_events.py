@@ -0,0 +1,134 @@
+"""
+Время запроса избранных мероприятий на 10 000 избранных.
+
+Заполняет базу из настроек приложения пользователем с FAVORITES
+избранными мероприятиями, замеряет get_events_by_user_id_with_count
+и выводит план подсчёта total_count, затем удаляет созданные строки:
+
+    python -m tests.benchmarks.favorite_events
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.i18n import Languages
+from crud.favorite import crud_favorite
+from models import Event, Favorite, User
+
+FAVORITES = 10_000
+BATCH_SIZE = 2_000
+NUMBER = 20
+PAGE_SIZE = 20
+
+TOTAL_COUNT_PLAN = """
+    EXPLAIN (ANALYZE, BUFFERS)
+    SELECT count(*) FROM favorites
+    JOIN event ON event.id = favorites.event_id
+    WHERE favorites.user_id = :user_id
+        AND event.is_draft IS false
+        AND event.is_archived IS false
+        AND event.end_datetime > now()
+"""
+
+
+async def seed(db: AsyncSession) -> tuple[int, int]:
+    users = await db.scalars(
+        insert(User)
+        .values(
+            [
+                {
+                    "uid": uuid4(),
+                    "username": f"benchmark_{uuid4().hex}",
+                    "first_name": "Benchmark",
+                    "second_name": "User",
+                    "email": f"{uuid4().hex}@benchmark.local",
+                    "hashed_password": "password",
+                }
+                for _ in range(2)
+            ]
+        )
+        .returning(User.id)
+    )
+    author_id, user_id = users.all()
+    end_datetime = datetime.now(tz=UTC) + timedelta(days=10)
+    # asyncpg принимает не больше 32767 параметров на запрос.
+    for start in range(0, FAVORITES, BATCH_SIZE):
+        event_ids = await db.scalars(
+            insert(Event)
+            .values(
+                [
+                    {
+                        "title": f"Benchmark event {number}",
+                        "creator_id": author_id,
+                        "is_draft": number % 10 == 0,
+                        "end_datetime": end_datetime,
+                    }
+                    for number in range(start, start + BATCH_SIZE)
+                ]
+            )
+            .returning(Event.id)
+        )
+        await db.execute(
+            insert(Favorite).values(
+                [
+                    {"user_id": user_id, "event_id": event_id}
+                    for event_id in event_ids.all()
+                ]
+            )
+        )
+    await db.commit()
+    return author_id, user_id
+
+
+async def cleanup(db: AsyncSession, author_id: int, user_id: int) -> None:
+    await db.execute(delete(Favorite).where(Favorite.user_id == user_id))
+    await db.execute(delete(Event).where(Event.creator_id == author_id))
+    await db.execute(delete(User).where(User.id.in_((author_id, user_id))))
+    await db.commit()
+
+
+async def measure(db: AsyncSession, user_id: int) -> None:
+    # Без VACUUM видимость свежих строк не отмечена в visibility map
+    # и Index Only Scan ходит в таблицу.
+    async with db.bind.connect() as connection:
+        connection = await connection.execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+        await connection.execute(text("VACUUM ANALYZE favorites, event"))
+
+    locale = next(iter(Languages))
+    for skip in (0, FAVORITES // 2):
+        started = time.perf_counter()
+        for _ in range(NUMBER):
+            response = await crud_favorite.get_events_by_user_id_with_count(
+                db, locale=locale, user_id=user_id, skip=skip, limit=PAGE_SIZE
+            )
+        elapsed = (time.perf_counter() - started) / NUMBER
+        print(
+            f"skip={skip}: {elapsed * 1e3:.1f} ms, "
+            f"total={response['total']}"
+        )
+
+    plan = await db.scalars(text(TOTAL_COUNT_PLAN), {"user_id": user_id})
+    print("\n".join(plan.all()))
+
+
+async def main() -> None:
+    from databases.database import get_async_session
+
+    async for db in get_async_session():
+        author_id, user_id = await seed(db)
+        try:
+            await measure(db, user_id)
+        finally:
+            await db.rollback()
+            await cleanup(db, author_id, user_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+"""
+Время расчёта рекомендаций вакансий на 10 000 опубликованных вакансий.
+
+Заполняет базу из настроек приложения вакансиями с существующими
+специализациями, замеряет get_ranked_ids для специалиста без кэша
+Redis, затем удаляет созданные строки:
+
+    python -m tests.benchmarks.job_recommendations
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.frilance.recommendation import JOB_RECOMMENDATIONS_TOP_K
+from crud.frilance.job_recommendation import crud_job_recommendation
+from models import Job, Specialization, User
+from models.m2m import JobSpecializations, UsersSpecializations
+from models.user.user_specialization import UserSpecialization
+
+JOBS = 10_000
+BATCH_SIZE = 2_000
+USER_SPECIALIZATIONS = 3
+NUMBER = 20
+
+
+async def seed(db: AsyncSession) -> tuple[int, int]:
+    specialization_ids = list(
+        await db.scalars(select(Specialization.id).order_by(Specialization.id))
+    )
+    if not specialization_ids:
+        raise SystemExit("No specializations to seed jobs with")
+    users = await db.scalars(
+        insert(User)
+        .values(
+            [
+                {
+                    "uid": uuid4(),
+                    "username": f"benchmark_{uuid4().hex}",
+                    "first_name": "Benchmark",
+                    "second_name": "User",
+                    "email": f"{uuid4().hex}@benchmark.local",
+                    "hashed_password": "password",
+                }
+                for _ in range(2)
+            ]
+        )
+        .returning(User.id)
+    )
+    author_id, user_id = users.all()
+    user_specialization_id = await db.scalar(
+        insert(UserSpecialization)
+        .values(
+            user_id=user_id,
+            is_ready_to_move=False,
+            is_ready_for_remote_work=False,
+        )
+        .returning(UserSpecialization.id)
+    )
+    await db.execute(
+        insert(UsersSpecializations).values(
+            [
+                {
+                    "user_specialization_id": user_specialization_id,
+                    "specialization_id": specialization_id,
+                }
+                for specialization_id in (
+                    specialization_ids[:USER_SPECIALIZATIONS]
+                )
+            ]
+        )
+    )
+    # asyncpg принимает не больше 32767 параметров на запрос.
+    for start in range(0, JOBS, BATCH_SIZE):
+        job_ids = await db.scalars(
+            insert(Job)
+            .values(
+                [
+                    {
+                        "name": f"Benchmark job {number}",
+                        "description": "Benchmark job",
+                        "author_id": author_id,
+                        "accepted_languages": [],
+                        "is_draft": False,
+                    }
+                    for number in range(start, start + BATCH_SIZE)
+                ]
+            )
+            .returning(Job.id)
+        )
+        await db.execute(
+            insert(JobSpecializations).values(
+                [
+                    {
+                        "job_id": job_id,
+                        "specialization_id": specialization_ids[
+                            job_id % len(specialization_ids)
+                        ],
+                    }
+                    for job_id in job_ids.all()
+                ]
+            )
+        )
+    await db.commit()
+    return author_id, user_id
+
+
+async def cleanup(db: AsyncSession, author_id: int, user_id: int) -> None:
+    await db.execute(delete(Job).where(Job.author_id == author_id))
+    await db.execute(
+        delete(UserSpecialization).where(UserSpecialization.user_id == user_id)
+    )
+    await db.execute(delete(User).where(User.id.in_((author_id, user_id))))
+    await db.commit()
+
+
+async def measure(db: AsyncSession, user_id: int) -> None:
+    started = time.perf_counter()
+    for _ in range(NUMBER):
+        ids = await crud_job_recommendation.get_ranked_ids(
+            db, user_id=user_id, limit=JOB_RECOMMENDATIONS_TOP_K
+        )
+    elapsed = (time.perf_counter() - started) / NUMBER
+    print(f"get_ranked_ids: {elapsed * 1e3:.1f} ms, {len(ids)} ids")
+
+
+async def main() -> None:
+    from databases.database import get_async_session
+
+    async for db in get_async_session():
+        author_id, user_id = await seed(db)
+        try:
+            await measure(db, user_id)
+        finally:
+            await db.rollback()
+            await cleanup(db, author_id, user_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+CPU-стоимость сборки запросов списков без обращения к базе.
+
+Сравнивает сборку select() на каждый запрос с получением готового
+запроса из StatementCacheMixin. В обоих случаях считается ещё и ключ
+кэша компиляции SQLAlchemy, который строится при каждом execute:
+
+    python -m tests.benchmarks.listing_statements
+"""
+
+import timeit
+from datetime import UTC, datetime
+from functools import partial
+
+from sqlalchemy.dialects import postgresql
+
+from crud.event_with_counters import crud_ewc
+from crud.frilance.job_with_counters import crud_job
+
+NUMBER = 1000
+
+LISTINGS = (
+    (
+        crud_ewc,
+        ("get_multi", False, False),
+        partial(crud_ewc._build_get_multi, favorite=False, attended=False),
+        {
+            "author_id": None,
+            "current_user_id": 1,
+            "current_user_ip": None,
+            "now": datetime.now(tz=UTC),
+        },
+    ),
+    (
+        crud_ewc,
+        "get_multi_for_author",
+        crud_ewc._build_get_multi_for_author,
+        {"current_user_id": 1, "current_user_ip": None},
+    ),
+    (
+        crud_job,
+        ("get_multi", False),
+        partial(crud_job._build_get_multi, favorite=False),
+        {"author_id": None, "current_user_id": 1, "current_user_ip": None},
+    ),
+    (
+        crud_job,
+        "get_multi_jobs_for_author",
+        crud_job._build_get_multi_jobs_for_author,
+        {"current_user_id": 1, "current_user_ip": None},
+    ),
+    (
+        crud_job,
+        ("get_jobs_applied_by_specialist", False),
+        partial(
+            crud_job._build_get_jobs_applied_by_specialist, favorite=False
+        ),
+        {"current_user_id": 1, "current_user_ip": None},
+    ),
+)
+
+
+def main() -> None:
+    dialect = postgresql.dialect()
+    for crud, key, build, params in LISTINGS:
+        nulls = frozenset(
+            name for name, value in params.items() if value is None
+        )
+        crud.get_statement(key, build, params).compile(dialect=dialect)
+
+        built = timeit.timeit(
+            lambda: build(nulls)._generate_cache_key(), number=NUMBER
+        )
+        cached = timeit.timeit(
+            lambda: crud.get_statement(
+                key, build, params
+            )._generate_cache_key(),
+            number=NUMBER,
+        )
+        print(
+            f"{type(crud).__name__}.{key}: "
+            f"build {built / NUMBER * 1e6:.0f} us, "
+            f"cached {cached / NUMBER * 1e6:.0f} us, "
+            f"x{built / cached:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
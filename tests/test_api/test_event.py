@@ -1,11 +1,17 @@
+import asyncio
 import json
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from io import BytesIO
 from typing import Callable
+from uuid import uuid4
 
 from fastapi import UploadFile
 from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from constants.images import IMAGE_VARIANT_SIZES, ImageVariant
+from crud.event import crud_event
 from models import (
     City,
     Event,
@@ -15,6 +21,12 @@ from models import (
     User,
     Favorite,
 )
+from models.m2m import EventSpecializations
+from services import archiver
+from services.event import attendance
+from services.storage import get_storage
+from utilities.exception import OperationConstraintError
+from utilities.images import get_variant_name
 
 ROOT_ENDPOINT = "/ch/v1/event/"
 
@@ -67,6 +79,43 @@ class TestEvent:
         assert response_data["objects"][0]["is_favorite"] is True
         assert response_data["objects"][0]["is_attended"] is True
 
+    async def test_read_recommended_events_excludes_own_events(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        user_fixture_2: User,
+        event_fixture: Event,
+        specialization_fixture: Specialization,
+    ) -> None:
+        other_event = Event(
+            title="Other event",
+            creator_id=user_fixture_2.id,
+            extra_languages=[],
+            is_draft=False,
+            start_datetime=datetime.now(tz=UTC) + timedelta(days=5),
+            end_datetime=datetime.now(tz=UTC) + timedelta(days=10),
+        )
+        async_session.add(other_event)
+        await async_session.flush()
+        async_session.add(
+            EventSpecializations(
+                event_id=other_event.id,
+                specialization_id=specialization_fixture.id,
+            )
+        )
+        await async_session.commit()
+
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            f"{ROOT_ENDPOINT}recommended/", headers=user_auth_headers
+        )
+        assert response.status_code == 200, response.text
+        ids = {event["id"] for event in response.json()["objects"]}
+        assert other_event.id in ids
+        assert event_fixture.id not in ids
+
     async def test_read_event_author_by_wrong_uid(
         self,
         user_fixture: User,
@@ -129,6 +178,24 @@ class TestEvent:
         assert response_data["objects"][0]["is_favorite"] is True
         assert response_data["objects"][0]["is_attended"] is True
 
+    async def test_read_event_with_specialization_filter(
+        self,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        event_fixture: Event,
+        specialization_fixture: Specialization,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            ROOT_ENDPOINT,
+            headers=user_auth_headers,
+            params={"specialization__id__in": specialization_fixture.id},
+        )
+        assert response.status_code == 200, response.text
+        ids = [event["id"] for event in response.json()["objects"]]
+        assert ids == [event_fixture.id]
+
     async def test_get_single_event(
         self,
         user_fixture: User,
@@ -222,6 +289,29 @@ class TestEvent:
         )
         assert response.status_code == 404, response.text
 
+    async def test_delete_event_refreshes_full_profile(
+        self,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        event_fixture: Event,
+        http_client: AsyncClient,
+    ):
+        profile_endpoint = f"/ch/v1/user/full/{user_fixture.uid}/"
+        response = await http_client.get(profile_endpoint)
+        assert response.status_code == 200, response.text
+        events = response.json()["events"]
+        assert event_fixture.id in [event["id"] for event in events]
+
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.delete(
+            f"{ROOT_ENDPOINT}{event_fixture.id}/", headers=user_auth_headers
+        )
+        assert response.status_code == 204, response.text
+
+        response = await http_client.get(profile_endpoint)
+        events = response.json()["events"]
+        assert event_fixture.id not in [event["id"] for event in events]
+
     async def test_create_event(
         self,
         http_client: AsyncClient,
@@ -321,6 +411,86 @@ class TestEvent:
         ]
         assert len(response_data["organizers"]) == 2
 
+    async def test_create_event_reports_all_missing_relations(
+        self,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        missing_uid = "00000000-0000-4000-8000-000000000000"
+        event_data = json.dumps(
+            {
+                "title": "Creativehub Fest",
+                "is_free": True,
+                "is_online": True,
+                "is_draft": True,
+                "specializations_ids": [999999],
+                "organisations_ids": [999999],
+                "speakers_uids": [missing_uid],
+            }
+        )
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            headers=user_auth_headers,
+            data={
+                "create_data": event_data,
+                "contact_person_data": json.dumps({"data": []}),
+            },
+        )
+        assert response.status_code == 404, response.text
+        detail = response.json()["detail"]
+        for relation in ("specializations", "organisations", "speakers"):
+            assert relation in detail
+        assert missing_uid in detail
+
+    async def test_create_event_generates_image_variants(
+        self,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        async_session: AsyncSession,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        photo = BytesIO()
+        Image.new("RGB", (2000, 1000), "red").save(photo, format="PNG")
+        photo.seek(0)
+        event_data = json.dumps(
+            {
+                "title": "Creativehub Fest",
+                "is_free": True,
+                "is_online": True,
+                "is_draft": True,
+            }
+        )
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            headers=user_auth_headers,
+            data={
+                "create_data": event_data,
+                "contact_person_data": json.dumps({"data": []}),
+            },
+            files={"photo": ("photo.png", photo, "image/png")},
+        )
+        assert response.status_code == 201, response.text
+        response_data = response.json()
+        variants = response_data["photo_variants"]
+        assert set(variants) == {variant.value for variant in ImageVariant}
+        assert response_data["event_cover_variants"] == {}
+
+        event = await async_session.get(Event, response_data["id"])
+        storage = get_storage(Event.photo)
+        assert set(event.image_variants[event.photo.name]) == set(variants)
+        for variant, size in IMAGE_VARIANT_SIZES.items():
+            assert variants[variant.value] == storage.get_path(
+                get_variant_name(event.photo.name, variant)
+            )
+            with storage.open(
+                get_variant_name(event.photo.name, variant)
+            ) as file, Image.open(file) as image:
+                assert image.format == "WEBP"
+                assert image.width == size[0]
+
     async def test_create_event_with_language_in_extra_languages(
         self,
         http_client: AsyncClient,
@@ -1479,6 +1649,94 @@ class TestEvent:
         response = await http_client.post(endpoint, headers=user_auth_headers)
         assert response.status_code == 404, response.text
 
+    async def test_attend_draft_event_not_found(
+        self,
+        async_session: AsyncSession,
+        user_fixture: User,
+        event_fixture: Event,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+    ):
+        event_fixture.is_draft = True
+        await async_session.commit()
+
+        user_auth_headers = await get_auth_headers(user_fixture)
+        endpoint = f"{ROOT_ENDPOINT}{event_fixture.id}/attend/"
+        response = await http_client.post(endpoint, headers=user_auth_headers)
+        assert response.status_code == 404, response.text
+
+    async def test_attend_event_capacity_under_concurrency(
+        self,
+        async_session: AsyncSession,
+        event_fixture: Event,
+    ):
+        event_fixture.max_participants = 5
+        users = [
+            User(
+                uid=uuid4(),
+                username=f"attendee_{number}",
+                first_name="Attendee",
+                second_name=str(number),
+                email=f"attendee_{number}@gmail.com",
+                hashed_password="password",
+            )
+            for number in range(20)
+        ]
+        async_session.add_all(users)
+        await async_session.commit()
+        session_maker = async_sessionmaker(
+            bind=async_session.bind, expire_on_commit=False
+        )
+
+        async def register(user_id: int) -> bool:
+            async with session_maker() as session:
+                try:
+                    creator_id = await attendance.attend(
+                        db=session, event_id=event_fixture.id, user_id=user_id
+                    )
+                except OperationConstraintError:
+                    return False
+                return creator_id == event_fixture.creator_id
+
+        results = await asyncio.gather(*(register(user.id) for user in users))
+        await async_session.refresh(event_fixture)
+        # Одно место уже занято участником из event_fixture.
+        assert sum(results) == 4
+        assert event_fixture.registered_count == 5
+
+    async def test_read_event_participants_page(
+        self,
+        user_fixture: User,
+        user_fixture_2: User,
+        event_fixture: Event,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        endpoint = f"{ROOT_ENDPOINT}{event_fixture.id}/participants/page/"
+        response = await http_client.get(
+            endpoint, headers=user_auth_headers, params={"limit": 1}
+        )
+        assert response.status_code == 200, response.text
+        response_data = response.json()
+        assert response_data["total"] == 1
+        assert response_data["next_after_id"] is None
+        assert response_data["objects"][0]["uid"] == str(user_fixture_2.uid)
+        assert "email" not in response_data["objects"][0]
+
+        endpoint = f"{ROOT_ENDPOINT}{event_fixture.id}/participants/export/"
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.status_code == 200, response.text
+        header, row = response.text.splitlines()
+        assert header == "uid,first_name,second_name,username,photo"
+        assert len(row.split(",")) == len(header.split(","))
+        assert row.startswith(str(user_fixture_2.uid))
+        assert user_fixture_2.email not in row
+
+        user_auth_headers = await get_auth_headers(user_fixture_2)
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.status_code == 403, response.text
+
     async def test_attend_event_already_registered(
         self,
         user_fixture: User,
@@ -1690,6 +1948,7 @@ class TestEvent:
             == user_fixture_2.first_name
         )
         assert response_data["objects"][0]["uid"] == str(user_fixture_2.uid)
+        assert "email" not in response_data["objects"][0]
 
     async def test_read_event_participants_with_filter(
         self,
@@ -1824,6 +2083,34 @@ class TestEvent:
         )
         assert response.status_code == 403
 
+    async def test_publish_bulk(
+        self,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        event_fixture: Event,
+        event_fixture_2: Event,
+        event_fixture_3: Event,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        ids = [event_fixture.id, event_fixture_2.id, event_fixture_3.id, 999]
+        response = await http_client.patch(
+            f"{ROOT_ENDPOINT}publish/",
+            headers=user_auth_headers,
+            json={"ids": ids},
+        )
+        assert response.status_code == 200, response.text
+        response_data = response.json()
+        assert [obj["id"] for obj in response_data["objects"]] == [
+            event_fixture_3.id
+        ]
+        assert response_data["objects"][0]["is_archived"] is False
+        assert response_data["errors"] == {
+            str(event_fixture.id): "already_published",
+            str(event_fixture_2.id): "draft",
+            "999": "not_found",
+        }
+
     async def test_unpublish(
         self,
         http_client: AsyncClient,
@@ -1903,3 +2190,24 @@ class TestEvent:
             endpoint,
         )
         assert response.status_code == 401
+
+    async def test_archive_finished_events(
+        self,
+        async_session: AsyncSession,
+        event_fixture: Event,
+    ) -> None:
+        event_fixture.end_datetime = datetime.now(tz=UTC) - timedelta(days=1)
+        await async_session.commit()
+
+        archived = await archiver.archive_expired(
+            async_session, crud_event, Event.end_datetime, batch_size=1
+        )
+        assert archived == 1
+        await async_session.refresh(event_fixture)
+        assert event_fixture.is_archived is True
+
+        # повторный запуск не трогает уже архивные мероприятия
+        archived = await archiver.archive_expired(
+            async_session, crud_event, Event.end_datetime
+        )
+        assert archived == 0
@@ -1,8 +1,12 @@
 from typing import Callable, List
 
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import Event, User
+from constants.favorite import FavoriteTarget
+from crud.favorite import crud_favorite
+from models import Event, Favorite, Job, Organisation, User
 from schemas.event import EventSimpleResponse
 
 ROOT_ENDPOINT = "/ch/v1/favorite-events/"
@@ -143,3 +147,128 @@ class TestFavoriteEvent:
             headers=user_auth_headers,
         )
         assert response.status_code == 404, response.text
+
+    async def test_add_and_remove_favorite_events_in_bulk(
+        self,
+        user_fixture: User,
+        event_fixture: Event,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        for expected_ids in ([event_fixture.id], []):
+            response = await http_client.post(
+                ROOT_ENDPOINT,
+                headers=user_auth_headers,
+                json={"ids": [event_fixture.id]},
+            )
+            assert response.status_code == 201, response.text
+            assert response.json() == expected_ids
+
+        response = await http_client.delete(
+            ROOT_ENDPOINT,
+            headers=user_auth_headers,
+            params={"ids": [event_fixture.id]},
+        )
+        assert response.status_code == 200, response.text
+        assert response.json() == [event_fixture.id]
+
+    async def test_read_favorites_feed(
+        self,
+        user_fixture: User,
+        event_fixture: Event,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        event_favorites_list_fixture: List[EventSimpleResponse],
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            "/ch/v1/favorites/", headers=user_auth_headers
+        )
+        assert response.status_code == 200, response.text
+        response_data = response.json()
+        assert response_data["totals"]["event"] == 1
+        assert response_data["objects"][0]["target"] == "event"
+        assert response_data["objects"][0]["event"]["id"] == event_fixture.id
+        assert response_data["next_after_id"] is None
+
+    async def test_read_favorite_event_counters(
+        self,
+        user_fixture: User,
+        event_fixture: Event,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        event_favorites_list_fixture: List[EventSimpleResponse],
+    ):
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            ROOT_ENDPOINT, headers=user_auth_headers
+        )
+        assert response.status_code == 200, response.text
+        response_data = response.json()
+        assert response_data["total"] == 1
+        assert response_data["objects"][0]["participants_count"] == 1
+        assert response_data["objects"][0]["is_favorite"] is True
+
+    async def test_read_favorites_feed_pages(
+        self,
+        async_session: AsyncSession,
+        user_fixture: User,
+        user_fixture_2: User,
+        event_fixture: Event,
+        event_fixture_2: Event,
+        job_fixture: Job,
+        organisation_fixture: Organisation,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+    ):
+        # Черновик добавляется в обход проверок, как если бы мероприятие
+        # стало черновиком уже после добавления в избранное.
+        assert event_fixture_2.is_draft
+        for target, obj_id in (
+            (FavoriteTarget.event, event_fixture.id),
+            (FavoriteTarget.event, event_fixture_2.id),
+            (FavoriteTarget.job, job_fixture.id),
+            (FavoriteTarget.organisation, organisation_fixture.id),
+            (FavoriteTarget.user, user_fixture_2.id),
+        ):
+            await crud_favorite.add_many(
+                async_session,
+                user_id=user_fixture.id,
+                target=target,
+                ids=[obj_id],
+            )
+        draft_favorite_id = await async_session.scalar(
+            select(Favorite.id).where(
+                Favorite.user_id == user_fixture.id,
+                Favorite.event_id == event_fixture_2.id,
+            )
+        )
+        favorite_ids = await async_session.scalars(
+            select(Favorite.id)
+            .where(Favorite.user_id == user_fixture.id)
+            .order_by(Favorite.id.desc())
+        )
+        expected_ids = [
+            favorite_id
+            for favorite_id in favorite_ids.all()
+            if favorite_id != draft_favorite_id
+        ]
+
+        user_auth_headers = await get_auth_headers(user_fixture)
+        params = {"limit": 2}
+        seen_ids = []
+        for _ in range(len(expected_ids) + 1):
+            response = await http_client.get(
+                "/ch/v1/favorites/", params=params, headers=user_auth_headers
+            )
+            assert response.status_code == 200, response.text
+            response_data = response.json()
+            for item in response_data["objects"]:
+                assert item[item["target"]] is not None
+                seen_ids.append(item["id"])
+            if response_data["next_after_id"] is None:
+                break
+            params["after_id"] = response_data["next_after_id"]
+
+        assert seen_ids == expected_ids
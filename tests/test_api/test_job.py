@@ -1,20 +1,28 @@
 import json
 from datetime import datetime, UTC
 from io import BytesIO
+from pathlib import Path
 from typing import Callable
 
 from fastapi import UploadFile
+from fastapi_storages import FileSystemStorage
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from constants.finance import Currency
 from models import (
     City,
     ContactPerson,
+    ExchangeRate,
     Job,
     Proposal,
     Specialization,
     User,
     Favorite,
 )
+from models.m2m import JobSpecializations, UsersSpecializations
+from models.user.user_specialization import UserSpecialization
+from services.storage import copy_file
 
 ROOT_ENDPOINT = "/ch/v1/job/"
 
@@ -42,6 +50,136 @@ class TestJob:
         for job in response_data["objects"]:
             assert job["is_applied"] is False
 
+    async def test_read_recommended_jobs_excludes_own_jobs(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        user_fixture_2: User,
+        job_fixture: Job,
+        specialization_fixture: Specialization,
+        user_specialization_fixture: UserSpecialization,
+    ) -> None:
+        other_job = Job(
+            name="Other job",
+            description="Job of another author",
+            author_id=user_fixture_2.id,
+            accepted_languages=[],
+            is_draft=False,
+        )
+        async_session.add(other_job)
+        await async_session.flush()
+        async_session.add_all(
+            [
+                JobSpecializations(
+                    job_id=job.id,
+                    specialization_id=specialization_fixture.id,
+                )
+                for job in (job_fixture, other_job)
+            ]
+        )
+        async_session.add(
+            UsersSpecializations(
+                user_specialization_id=user_specialization_fixture.id,
+                specialization_id=specialization_fixture.id,
+            )
+        )
+        await async_session.commit()
+
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(
+            f"{ROOT_ENDPOINT}recommended/",
+            headers=user_auth_headers,
+        )
+        assert response.status_code == 200, response.text
+        ids = {job["id"] for job in response.json()["objects"]}
+        assert other_job.id in ids
+        assert job_fixture.id not in ids
+
+    async def test_read_jobs_with_specialization_filter(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture_2: User,
+        job_fixture: Job,
+        specialization_fixture: Specialization,
+    ) -> None:
+        async_session.add(
+            JobSpecializations(
+                job_id=job_fixture.id,
+                specialization_id=specialization_fixture.id,
+            )
+        )
+        await async_session.commit()
+        user_auth_headers = await get_auth_headers(user_fixture_2)
+        params = {
+            "specialization__id__in": specialization_fixture.id,
+            "specialization__direction_id__in": (
+                specialization_fixture.direction_id
+            ),
+        }
+        response = await http_client.get(
+            ROOT_ENDPOINT, headers=user_auth_headers, params=params
+        )
+        assert response.status_code == 200, response.text
+        response_data = response.json()
+        assert [job["id"] for job in response_data["objects"]] == [
+            job_fixture.id
+        ]
+        assert response_data["total"] == 1
+
+        params = {"specialization__id__in": specialization_fixture.id + 1}
+        response = await http_client.get(
+            ROOT_ENDPOINT, headers=user_auth_headers, params=params
+        )
+        assert response.status_code == 200, response.text
+        assert response.json()["objects"] == []
+
+    async def test_read_jobs_sorted_by_normalized_budget(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        user_fixture_2: User,
+    ) -> None:
+        async_session.add_all(
+            [
+                ExchangeRate(currency=Currency.rub, rate=1),
+                ExchangeRate(currency=Currency.dollar, rate=90),
+            ]
+        )
+        # 100 долларов - 9 000 рублей, дешевле 20 000 рублей.
+        cheap_job, expensive_job = (
+            Job(
+                name=f"Job in {currency.value}",
+                description="Job with budget",
+                author_id=user_fixture.id,
+                accepted_languages=[],
+                budget=budget,
+                currency=currency,
+                is_draft=False,
+            )
+            for budget, currency in (
+                (100, Currency.dollar),
+                (20_000, Currency.rub),
+            )
+        )
+        async_session.add_all([cheap_job, expensive_job])
+        await async_session.commit()
+
+        user_auth_headers = await get_auth_headers(user_fixture_2)
+        response = await http_client.get(
+            ROOT_ENDPOINT,
+            headers=user_auth_headers,
+            params={"sort_by": "price", "sort_order": "asc"},
+        )
+        assert response.status_code == 200, response.text
+        ids = [job["id"] for job in response.json()["objects"]]
+        assert ids.index(cheap_job.id) < ids.index(expensive_job.id)
+
     async def test_read_jobs_by_specialist(
         self,
         http_client: AsyncClient,
@@ -803,6 +941,18 @@ class TestJob:
         )
         assert response.status_code == 201, response.text
 
+    def test_copy_file_keeps_original(self, tmp_path: Path) -> None:
+        storage = FileSystemStorage(path=str(tmp_path))
+        name = storage.write(BytesIO(b"original"), "file.txt")
+
+        new_name = copy_file(storage, name)
+
+        assert new_name != name
+        with storage.open(name) as file:
+            assert file.read() == b"original"
+        with storage.open(new_name) as file:
+            assert file.read() == b"original"
+
     async def test_read_job_views_count(
         self,
         http_client: AsyncClient,
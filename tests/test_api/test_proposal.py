@@ -0,0 +1,223 @@
+import json
+from typing import Callable
+from uuid import uuid4
+
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import (
+    Job,
+    NumberAnswer,
+    Proposal,
+    ProposalTableConfig,
+    ProposalTableCustomField,
+    User,
+)
+
+ROOT_ENDPOINT = "/ch/v1/job-proposal/"
+
+
+async def create_proposals(
+    async_session: AsyncSession, job: Job, count: int
+) -> list[Proposal]:
+    users = [
+        User(
+            uid=uuid4(),
+            username=f"applicant_{number}",
+            first_name="Applicant",
+            second_name=str(number),
+            email=f"applicant_{number}@gmail.com",
+            hashed_password="password",
+        )
+        for number in range(count)
+    ]
+    async_session.add_all(users)
+    await async_session.flush()
+    proposals = [
+        Proposal(text=f"Proposal {user.id}", user_id=user.id, job_id=job.id)
+        for user in users
+    ]
+    async_session.add_all(proposals)
+    await async_session.commit()
+    return proposals
+
+
+async def create_custom_field(
+    async_session: AsyncSession, job: Job, author: User
+) -> ProposalTableCustomField:
+    config = ProposalTableConfig(job_id=job.id, user_id=author.id)
+    field = ProposalTableCustomField(name="Years of experience", config=config)
+    async_session.add(field)
+    await async_session.commit()
+    return field
+
+
+class TestProposalBoard:
+    async def test_read_job_proposals_page(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        job_fixture: Job,
+        proposal_fixture: Proposal,
+    ) -> None:
+        proposals = await create_proposals(async_session, job_fixture, 2)
+        expected_ids = sorted(
+            [proposal_fixture.id, *(proposal.id for proposal in proposals)]
+        )
+        user_auth_headers = await get_auth_headers(user_fixture)
+        endpoint = f"{ROOT_ENDPOINT}{job_fixture.id}/page/"
+
+        response = await http_client.get(
+            endpoint, headers=user_auth_headers, params={"limit": 2}
+        )
+        assert response.status_code == 200, response.text
+        first_page = [item["id"] for item in response.json()["proposals"]]
+        assert first_page == expected_ids[:2]
+        after_id = response.headers["X-Next-After-Id"]
+        assert after_id == str(expected_ids[1])
+
+        response = await http_client.get(
+            endpoint,
+            headers=user_auth_headers,
+            params={"limit": 2, "after_id": after_id},
+        )
+        assert response.status_code == 200, response.text
+        second_page = [item["id"] for item in response.json()["proposals"]]
+        assert second_page == expected_ids[2:]
+        assert "X-Next-After-Id" not in response.headers
+
+    async def test_read_job_proposals_page_rejects_bad_limit(
+        self,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        job_fixture: Job,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        endpoint = f"{ROOT_ENDPOINT}{job_fixture.id}/page/"
+        for limit in (0, -1):
+            response = await http_client.get(
+                endpoint, headers=user_auth_headers, params={"limit": limit}
+            )
+            assert response.status_code == 422, response.text
+
+    async def test_export_job_proposals(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        user_fixture_2: User,
+        job_fixture: Job,
+        proposal_fixture: Proposal,
+    ) -> None:
+        await create_proposals(async_session, job_fixture, 2)
+        user_auth_headers = await get_auth_headers(user_fixture)
+        endpoint = f"{ROOT_ENDPOINT}{job_fixture.id}/export/"
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.status_code == 200, response.text
+        assert response.headers["content-type"].startswith(
+            "application/x-ndjson"
+        )
+        lines = response.text.splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])["id"] == proposal_fixture.id
+
+        user_auth_headers = await get_auth_headers(user_fixture_2)
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.status_code == 403, response.text
+
+    async def test_filter_and_sort_by_number_answers(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        job_fixture: Job,
+        proposal_fixture: Proposal,
+    ) -> None:
+        proposals = [
+            proposal_fixture,
+            *await create_proposals(async_session, job_fixture, 2),
+        ]
+        field = await create_custom_field(
+            async_session, job_fixture, user_fixture
+        )
+        values = (5, 1, 3)
+        async_session.add_all(
+            NumberAnswer(
+                proposal_id=proposal.id, field_id=field.id, value=value
+            )
+            for proposal, value in zip(proposals, values)
+        )
+        await async_session.commit()
+        by_value = [
+            proposal.id
+            for _, proposal in sorted(
+                zip(values, proposals), key=lambda pair: pair[0]
+            )
+        ]
+        user_auth_headers = await get_auth_headers(user_fixture)
+        endpoint = f"{ROOT_ENDPOINT}{job_fixture.id}/page/"
+
+        response = await http_client.get(
+            endpoint,
+            headers=user_auth_headers,
+            params={"answer__field_id": field.id, "answer__number__gte": 2},
+        )
+        assert response.status_code == 200, response.text
+        found_ids = {item["id"] for item in response.json()["proposals"]}
+        assert found_ids == {proposals[0].id, proposals[2].id}
+
+        params = {
+            "sort_by": "number_answer",
+            "sort_field_id": field.id,
+            "limit": 2,
+        }
+        response = await http_client.get(
+            endpoint, headers=user_auth_headers, params=params
+        )
+        assert response.status_code == 200, response.text
+        first_page = [item["id"] for item in response.json()["proposals"]]
+        assert first_page == by_value[:2]
+
+        params["after_id"] = response.headers["X-Next-After-Id"]
+        response = await http_client.get(
+            endpoint, headers=user_auth_headers, params=params
+        )
+        assert response.status_code == 200, response.text
+        second_page = [item["id"] for item in response.json()["proposals"]]
+        assert second_page == by_value[2:]
+
+        response = await http_client.get(
+            endpoint,
+            headers=user_auth_headers,
+            params={"sort_by": "number_answer"},
+        )
+        assert response.status_code == 422, response.text
+
+    async def test_custom_field_answer_indexes(
+        self,
+        async_session: AsyncSession,
+        user_fixture: User,
+        job_fixture: Job,
+    ) -> None:
+        field = await create_custom_field(
+            async_session, job_fixture, user_fixture
+        )
+        index_name = f"ix_{NumberAnswer.__tablename__}_field_{field.id}"
+        statement = text(
+            "SELECT count(*) FROM pg_indexes WHERE indexname = :name"
+        )
+        assert await async_session.scalar(
+            statement, {"name": index_name}
+        ) == 1
+
+        await async_session.delete(field)
+        await async_session.commit()
+        assert await async_session.scalar(
+            statement, {"name": index_name}
+        ) == 0
@@ -2,7 +2,8 @@ from typing import Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import User, UserExperience, UserSpecialization
+from constants.finance import Currency
+from models import ExchangeRate, User, UserExperience, UserSpecialization
 from models.user.mentorship import Mentorship
 
 ROOT_ENDPOINT = "/ch/v1/"
@@ -48,3 +49,50 @@ class TestUserCatalogAPI:
         response_data = response.json()
         assert response_data[0]["mentorship"] is not None
         assert response_data[0]["experience"] != []
+
+    async def test_exchange_rate_normalizes_mentorship_price(
+        self,
+        async_session: AsyncSession,
+        mentorship_fixture: Mentorship,
+    ) -> None:
+        async_session.add(ExchangeRate(currency=Currency.euro, rate=100))
+        await async_session.commit()
+        await async_session.refresh(mentorship_fixture)
+
+        assert mentorship_fixture.normalized_price == (
+            mentorship_fixture.price * 100
+        )
+
+    async def test_read_user_experts_by_normalized_price(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncSession,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        mentorship_fixture: Mentorship,
+        user_experience_fixture: UserExperience,
+    ) -> None:
+        async_session.add(ExchangeRate(currency=Currency.euro, rate=100))
+        await async_session.commit()
+        await async_session.refresh(mentorship_fixture)
+        normalized_price = mentorship_fixture.normalized_price
+        user_auth_headers = await get_auth_headers(user_fixture)
+        endpoint = f"{ROOT_ENDPOINT}user-experts/"
+
+        response = await http_client.get(
+            endpoint,
+            headers=user_auth_headers,
+            params={"price_gte": normalized_price, "price_order": "desc"},
+        )
+        assert response.status_code == 200, response.text
+        assert [user["uid"] for user in response.json()] == [
+            str(user_fixture.uid)
+        ]
+
+        response = await http_client.get(
+            endpoint,
+            headers=user_auth_headers,
+            params={"price_lte": normalized_price - 1},
+        )
+        assert response.status_code == 200, response.text
+        assert response.json() == []
@@ -1,13 +1,19 @@
 import json
 import uuid
 from io import BytesIO
+from pathlib import Path
 from typing import Callable
 
+import pytest
 from fastapi import UploadFile
+from fastapi_storages import FileSystemStorage
+from pytest_mock import MockerFixture
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from constants.education import EducationType
+from constants.files import MAX_UPLOAD_FILE_SIZE
 from models import City, Education, User
+from services.storage import FileTooLargeError, upload_file
 
 ROOT_ENDPOINT = "/ch/v1/user-education/"
 
@@ -139,6 +145,109 @@ class TestUserEducationAPI:
         )
         assert response.status_code == 404
 
+    async def test_create_deduplicates_certificates(
+        self,
+        http_client: AsyncSession,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        city_fixture: City,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        create_data = {
+            "educations": [
+                {
+                    "end_year": 1950,
+                    "start_month": 1,
+                    "is_current": False,
+                    "name": "string",
+                    "filenames": ["test.txt"],
+                    "city_id": city_fixture.id,
+                    "department": "string",
+                    "start_year": 1950,
+                    "type": "Высшее",
+                    "end_month": 1,
+                }
+            ]
+        }
+        file = ("test.txt", b"Same content", "text/plain")
+        certificates = []
+        for _ in range(2):
+            response = await http_client.post(
+                ROOT_ENDPOINT,
+                headers=user_auth_headers,
+                data={"create_data": json.dumps(create_data)},
+                files={"files": file},
+            )
+            assert response.status_code == 201, response.text
+            certificates.append(response.json()[0]["certificates"][0]["file"])
+        assert certificates[0] == certificates[1]
+        # Имя общего объекта не раскрывает имя файла загрузившего.
+        assert "test" not in certificates[0].rsplit("/", 1)[-1]
+
+    async def test_create_too_large_file(
+        self,
+        http_client: AsyncSession,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        city_fixture: City,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        file = UploadFile(
+            filename="test.txt",
+            file=BytesIO(b"0" * (MAX_UPLOAD_FILE_SIZE + 1)),
+        )
+        create_data = {
+            "educations": [
+                {
+                    "end_year": 1950,
+                    "start_month": 1,
+                    "is_current": False,
+                    "name": "string",
+                    "filenames": ["test.txt"],
+                    "city_id": city_fixture.id,
+                    "department": "string",
+                    "start_year": 1950,
+                    "type": "Высшее",
+                    "end_month": 1,
+                }
+            ]
+        }
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            headers=user_auth_headers,
+            data={"create_data": json.dumps(create_data)},
+            files={"files": (file.filename, file.file, "text/plain")},
+        )
+        assert response.status_code == 413
+
+    async def test_create_too_large_body(
+        self,
+        http_client: AsyncSession,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        mocker: MockerFixture,
+    ) -> None:
+        mocker.patch("api.routes.MAX_UPLOAD_BODY_SIZE", 1024)
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            headers=user_auth_headers,
+            data={"create_data": json.dumps({"educations": []})},
+            files={"files": ("test.txt", b"0" * 2048, "text/plain")},
+        )
+        assert response.status_code == 413, response.text
+
+    def test_upload_too_large_file_leaves_nothing(
+        self, tmp_path: Path
+    ) -> None:
+        storage = FileSystemStorage(path=str(tmp_path))
+        file = UploadFile(filename="test.txt", file=BytesIO(b"0" * 2048))
+
+        with pytest.raises(FileTooLargeError):
+            upload_file(storage, file, max_size=1024)
+
+        assert list(tmp_path.iterdir()) == []
+
     async def test_update_multi(
         self,
         http_client: AsyncSession,
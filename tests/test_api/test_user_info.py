@@ -138,3 +138,79 @@ class TestUpdateUserInfo:
         assert link["name"] in response_data["links"][0].values()
         assert contact_info["email"] in response_data["contact_info"].values()
         assert response_data["private_site"] is None
+
+    async def test_full_profile_refreshed_after_update(
+        self,
+        http_client: AsyncSession,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        mock_update_user_completeness_fixture: MockerFixture,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        endpoint = f"{ROOT_ENDPOINT}full/{user_fixture.uid}/"
+        response = await http_client.get(endpoint)
+        assert response.status_code == 200
+        assert response.json()["links"] == []
+
+        link = {"name": "Test", "url": "https://example.com/"}
+        contact_info = {
+            "email": "example@yandex.ru",
+            "phone_code": "+123",
+            "phone_number": "1234567788",
+        }
+        data = UserInfoCreateUpdate(links=[link], contact_info=contact_info)
+        response = await http_client.put(
+            ROOT_ENDPOINT, headers=user_auth_headers, json=data.model_dump()
+        )
+        assert response.status_code == 200
+
+        response = await http_client.get(endpoint)
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data["uid"] == str(user_fixture.uid)
+        assert link["name"] in response_data["links"][0].values()
+
+    async def test_update_removes_missing_links(
+        self,
+        http_client: AsyncSession,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        link_fixture: Link,
+        mock_update_user_completeness_fixture: MockerFixture,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        link = {"name": "New link", "url": "https://example.com/new/"}
+        contact_info = {
+            "email": "example@yandex.ru",
+            "phone_code": "+123",
+            "phone_number": "1234567788",
+        }
+        data = UserInfoCreateUpdate(links=[link], contact_info=contact_info)
+        response = await http_client.put(
+            ROOT_ENDPOINT, headers=user_auth_headers, json=data.model_dump()
+        )
+        assert response.status_code == 200
+        response_data = response.json()
+        assert len(response_data["links"]) == 1
+        assert response_data["links"][0]["name"] == link["name"]
+        assert response_data["links"][0]["id"] != link_fixture.id
+
+    async def test_update_link_not_found(
+        self,
+        http_client: AsyncSession,
+        get_auth_headers: Callable,
+        user_fixture: User,
+        mock_update_user_completeness_fixture: MockerFixture,
+    ) -> None:
+        user_auth_headers = await get_auth_headers(user_fixture)
+        link = {"name": "Test", "url": "https://example.com/", "id": 9999}
+        contact_info = {
+            "email": "example@yandex.ru",
+            "phone_code": "+123",
+            "phone_number": "1234567788",
+        }
+        data = UserInfoCreateUpdate(links=[link], contact_info=contact_info)
+        response = await http_client.put(
+            ROOT_ENDPOINT, headers=user_auth_headers, json=data.model_dump()
+        )
+        assert response.status_code == 404
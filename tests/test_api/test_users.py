@@ -1,12 +1,15 @@
+from datetime import datetime, timedelta, UTC
 from typing import Callable
 
 from httpx import AsyncClient
 from pytest_mock import MockerFixture
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from models import Timezone, User
+from crud.user_profile import crud_user_profile
+from crud.user_purge import crud_user_purge
+from models import Event, Job, Timezone, User
 from schemas.user.user import UserCreate, UserUpdate, UserUpdateLinkPermission
-from services.user import user_service
+from services.user import purge, user_service
 from services.user.completeness import update_user_completeness
 from schemas.user.user_contact_info import ContactInfoParsed
 from schemas.user.user_info import UserInfoCreateUpdate
@@ -44,6 +47,92 @@ class TestUserApi:
         response_data = response.json()
         assert str(user_fixture.uid) == response_data["uid"]
 
+    async def test_user_profile_deleted_while_loading(
+        self,
+        async_session: AsyncSession,
+        user_fixture: User,
+        mocker: MockerFixture,
+    ):
+        async def load_deleted_user(*args, relation: str, **kwargs):
+            return relation, None
+
+        mocker.patch.object(
+            crud_user_profile, "_load_relation", side_effect=load_deleted_user
+        )
+        assert (
+            await crud_user_profile.get_by_uid_full(
+                async_session, uid=user_fixture.uid
+            )
+            is None
+        )
+
+        mocker.stopall()
+        session_maker = async_sessionmaker(
+            bind=async_session.bind, expire_on_commit=False
+        )
+        assert await crud_user_profile._load_relation(
+            session_maker,
+            user_id=user_fixture.id + 1_000_000,
+            relation="links",
+            options=(),
+        ) == ("links", None)
+
+    async def test_read_author_statistics(
+        self,
+        http_client: AsyncClient,
+        user_fixture: User,
+        get_auth_headers: Callable,
+        job_fixture: Job,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}statistics/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.status_code == 200, response.text
+
+        response_data = response.json()
+        jobs_count = (
+            response_data["draft_jobs_count"]
+            + response_data["published_jobs_count"]
+        )
+        assert jobs_count >= 1
+        assert (
+            0
+            <= response_data["new_proposals_count"]
+            <= response_data["proposals_count"]
+        )
+
+    async def test_author_statistics_follow_job_status(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        user_fixture: User,
+        get_auth_headers: Callable,
+        job_fixture: Job,
+    ):
+        endpoint = f"{ROOT_ENDPOINT}statistics/"
+        user_auth_headers = await get_auth_headers(user_fixture)
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.status_code == 200, response.text
+        before = response.json()
+
+        job_fixture.is_archived = True
+        await async_session.commit()
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.status_code == 200, response.text
+        after = response.json()
+        assert (
+            after["archived_jobs_count"] == before["archived_jobs_count"] + 1
+        )
+
+        await async_session.delete(job_fixture)
+        await async_session.commit()
+        response = await http_client.get(endpoint, headers=user_auth_headers)
+        assert response.status_code == 200, response.text
+        assert (
+            response.json()["archived_jobs_count"]
+            == before["archived_jobs_count"]
+        )
+
     async def test_create_user(
         self,
         http_client: AsyncClient,
@@ -196,6 +285,55 @@ class TestUserApi:
         response = await http_client.get(endpoint, headers=user_auth_headers)
         assert response.status_code == 404
 
+    async def test_purge_deleted_users(
+        self,
+        async_session: AsyncSession,
+        user_fixture: User,
+        event_fixture: Event,
+    ):
+        user_id, event_id = user_fixture.id, event_fixture.id
+        user_fixture.is_deleted = True
+        user_fixture.deleted_at = datetime.now(tz=UTC) - timedelta(days=31)
+        await async_session.commit()
+
+        deleted = await purge.purge_deleted_users(
+            async_session, batch_size=1, chunk_size=1
+        )
+        assert deleted >= 2
+        async_session.expunge_all()
+        assert await async_session.get(User, user_id) is None
+        assert await async_session.get(Event, event_id) is None
+
+        # повторный запуск ничего не находит
+        assert await purge.purge_deleted_users(async_session) == 0
+
+    async def test_purge_skips_restored_user(
+        self,
+        async_session: AsyncSession,
+        user_fixture: User,
+        event_fixture: Event,
+    ):
+        user_id, event_id = user_fixture.id, event_fixture.id
+        deleted_before = datetime.now(tz=UTC) - timedelta(days=30)
+        user_fixture.is_deleted = True
+        user_fixture.deleted_at = deleted_before - timedelta(days=1)
+        await async_session.commit()
+        dependents = crud_user_purge.get_dependents([user_id], deleted_before)
+
+        # пользователя восстановили во время очистки
+        user_fixture.is_deleted = False
+        await async_session.commit()
+
+        for model, condition in dependents:
+            assert (
+                await crud_user_purge.delete_chunk(
+                    async_session, model=model, condition=condition, limit=10
+                )
+                == 0
+            )
+        async_session.expunge_all()
+        assert await async_session.get(Event, event_id) is not None
+
     async def test_user_completeness(
         self,
         http_client: AsyncClient,
@@ -0,0 +1,48 @@
+from pathlib import PurePosixPath
+from typing import Any, Iterable, Optional
+
+from fastapi_storages.base import BaseStorage
+
+from constants.images import IMAGE_VARIANT_FORMAT, ImageVariant
+
+
+def get_variant_name(name: str, variant: ImageVariant) -> str:
+    """Имя варианта изображения рядом с оригиналом."""
+
+    path = PurePosixPath(name)
+    return str(
+        path.with_name(f"{path.stem}_{variant.value}.{IMAGE_VARIANT_FORMAT}")
+    )
+
+
+def get_variant_urls(
+    storage: BaseStorage, name: Optional[str], variants: Iterable[str]
+) -> dict[ImageVariant, str]:
+    """
+    Ссылки на созданные варианты изображения `name`.
+
+    Каждая ссылка строится хранилищем по имени варианта, поэтому
+    у приватных бакетов она подписана отдельно от оригинала.
+    """
+
+    if not name:
+        return {}
+    return {
+        ImageVariant(variant): storage.get_path(
+            get_variant_name(name, ImageVariant(variant))
+        )
+        for variant in variants
+    }
+
+
+def get_file_name(storage: BaseStorage, value: Any) -> Optional[str]:
+    """
+    Имя файла в хранилище для значения колонки FileType.
+
+    Загруженная из базы колонка - StorageFile, строковое значение
+    которого уже ссылка; присвоенная, но не сохранённая - имя файла.
+    """
+
+    if not value:
+        return None
+    return getattr(value, "name", None) or storage.get_name(value)